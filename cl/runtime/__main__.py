@@ -38,6 +38,7 @@ from cl.runtime.fallback.fallback_static_files import FallbackStaticFiles
 from cl.runtime.log.exceptions.user_error import UserError
 from cl.runtime.log.log_config import logging_config
 from cl.runtime.log.log_config import uvicorn_empty_logging_config
+from cl.runtime.log.queued_log_handler import QueuedLogHandler
 from cl.runtime.records.typename import typename
 from cl.runtime.routers.context_middleware import ContextMiddleware
 from cl.runtime.routers.server_util import ServerUtil
@@ -182,6 +183,12 @@ def run_backend(*, interactive: bool = False) -> None:
             if CelerySettings.instance().celery_is_embedded_worker:
                 CeleryQueue.run_stop_queue()
 
+            # Write queued log messages and events before releasing database connections
+            QueuedLogHandler.flush_all()
+
+            # Release database connections
+            ds.db.close_connection()
+
 
 if __name__ == "__main__":
 
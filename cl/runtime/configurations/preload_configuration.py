@@ -12,8 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from itertools import chain
+from typing import Iterator
 from typing import Sequence
 from more_itertools import consume
 from typing_extensions import final
@@ -21,9 +29,49 @@ from cl.runtime.configurations.configuration import Configuration
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.db.data_source import DataSource
 from cl.runtime.file.csv_reader import CsvReader
+from cl.runtime.file.file_util import FileUtil
+from cl.runtime.file.preload_snapshot import PreloadSnapshot
+from cl.runtime.file.reader import Reader
 from cl.runtime.file.yaml_reader import YamlReader
+from cl.runtime.records.record_mixin import RecordMixin
 from cl.runtime.settings.preload_settings import PreloadSettings
 
+_LOGGER = logging.getLogger(__name__)
+
+_READER_TYPES: dict[str, type[Reader]] = {
+    "csv": CsvReader,
+    "yaml": YamlReader,
+}
+"""Reader type for each file extension in the order in which the files are preloaded."""
+
+
+def _read_file(
+    ext: str,
+    file_path: str,
+    snapshot_path: str | None = None,
+    is_snapshot_current: bool = False,
+) -> tuple[str, tuple[RecordMixin, ...], float, bool]:
+    """
+    Read records from a single file or its snapshot if current, save the snapshot if the file was parsed.
+
+    Returns:
+        Tuple of file path, records, elapsed time in seconds and a flag indicating the records came from the snapshot
+    """
+    start_time = time.perf_counter()
+    if is_snapshot_current:
+        try:
+            if (records := PreloadSnapshot.load_records(snapshot_path)) is not None:
+                return file_path, records, time.perf_counter() - start_time, True
+            _LOGGER.info(f"Types in snapshot of {file_path} changed, parsing the file instead.")
+        except Exception as e:  # noqa
+            # Parse the file if the snapshot cannot be loaded, for example when a stored type has changed
+            _LOGGER.warning(f"Cannot load snapshot of {file_path}, parsing the file instead: {e!r}")
+
+    records = _READER_TYPES[ext]().build().load_file(file_path)
+    if snapshot_path is not None:
+        PreloadSnapshot.save_records(snapshot_path, records)
+    return file_path, records, time.perf_counter() - start_time, False
+
 
 @dataclass(slots=True, kw_only=True)
 @final
@@ -39,6 +87,9 @@ class PreloadConfiguration(Configuration):
     file_exclude_patterns: Sequence[str] | None = None
     """Optional list of filename glob patterns to exclude"""
 
+    snapshot_dir: str | None = None
+    """Directory for the binary snapshot of preloaded records, use preload_snapshot_dir if not specified."""
+
     def run_configure(self):
         """Load records from files in the specified directories and insert them into the active data source."""
 
@@ -53,34 +104,119 @@ class PreloadConfiguration(Configuration):
         preload_settings = PreloadSettings.instance()
         dirs = self.dirs or preload_settings.preload_dirs
 
-        # Specify readers for each file extension
-        reader_dict = {
-            "csv": CsvReader().build(),
-            "yaml": YamlReader().build(),
-        }
-
-        # Get records stored in preload directories
-        record_lists = [
-            reader.load_all(
+        # Enumerate files once, each file is a separate work item
+        file_items = [
+            (ext, file_path)
+            for ext in _READER_TYPES
+            for file_path in FileUtil.enumerate_files(
                 dirs=dirs,
                 ext=ext,
                 file_include_patterns=self.file_include_patterns,
                 file_exclude_patterns=self.file_exclude_patterns,
             )
-            for ext, reader in reader_dict.items()
         ]
 
-        # Chain records into a single list
-        records = list(chain(*record_lists))
+        # Check which files changed since the snapshot was taken, only those files will be parsed
+        if (snapshot_dir := self.snapshot_dir or preload_settings.preload_snapshot_dir) is not None:
+            previous_entries = PreloadSnapshot.load_manifest(snapshot_dir)
+            snapshot_entries = {
+                file_path: PreloadSnapshot.get_entry(file_path, previous=previous_entries.get(file_path))
+                for _, file_path in file_items
+            }
+            work_items = [
+                (
+                    ext,
+                    file_path,
+                    PreloadSnapshot.get_snapshot_path(snapshot_dir, file_path),
+                    PreloadSnapshot.is_current(
+                        snapshot_dir,
+                        file_path,
+                        entry=snapshot_entries[file_path],
+                        previous=previous_entries.get(file_path),
+                    ),
+                )
+                for ext, file_path in file_items
+            ]
+        else:
+            previous_entries = snapshot_entries = None
+            work_items = [(ext, file_path, None, False) for ext, file_path in file_items]
 
-        if records:
-            # Insert into the active data source
-            ds.insert_many(records, commit=True)
+        # Insert records as files are read, in batches of records with the same key type
+        start_time = time.perf_counter()
+        batch_size = preload_settings.preload_batch_size
+        batches = defaultdict(list)
+        record_count = 0
+        snapshot_file_count = 0
+        autorun_configurations = []
+        for file_path, records, file_time, from_snapshot in self._read_files(work_items):
+            if from_snapshot:
+                _LOGGER.info(f"Read {len(records)} records from snapshot of {file_path} in {file_time:.3f}s.")
+                snapshot_file_count += 1
+            else:
+                _LOGGER.info(f"Read {len(records)} records from {file_path} in {file_time:.3f}s.")
+            record_count += len(records)
+            for record in records:
+                # Build records received from another process (build will have no effect if already invoked)
+                record = record.build()
+                batch = batches[record.get_key_type()]
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    ds.insert_many(batch, commit=True)
+                    batch.clear()
 
-            # Execute run_configure on all preloaded Configuration records with autorun=True
-            autorun_configurations = [
-                record for record in records if isinstance(record, Configuration) and record.autorun
-            ]
+                # Collect preloaded Configuration records with autorun=True
+                if isinstance(record, Configuration) and record.autorun:
+                    autorun_configurations.append(record)
+
+        # Insert the remaining records
+        consume(ds.insert_many(batch, commit=True) for batch in batches.values() if batch)
+        if work_items:
+            _LOGGER.info(
+                f"Preloaded {record_count} records from {len(work_items)} files "
+                f"({snapshot_file_count} unchanged files read from snapshot) "
+                f"in {time.perf_counter() - start_time:.3f}s."
+            )
+
+        # Update the manifest after all snapshots are written, drop entries for files that no longer exist
+        if snapshot_entries is not None:
+            for file_path, previous_entry in previous_entries.items():
+                if file_path not in snapshot_entries:
+                    if os.path.exists(file_path):
+                        # Keep entries for files excluded by the patterns of this configuration
+                        snapshot_entries[file_path] = previous_entry
+                    else:
+                        PreloadSnapshot.delete_records(PreloadSnapshot.get_snapshot_path(snapshot_dir, file_path))
+            PreloadSnapshot.save_manifest(snapshot_dir, snapshot_entries)
+
+        # Execute run_configure methods of autorun configurations after all records are inserted
+        consume(autorun_configuration.run_configure() for autorun_configuration in autorun_configurations)
+
+    @classmethod
+    def _read_files(
+        cls,
+        work_items: Sequence[tuple[str, str, str | None, bool]],
+    ) -> Iterator[tuple[str, tuple[RecordMixin, ...], float, bool]]:
+        """Read files in a process pool in the order of work items, the number of files read ahead is bounded."""
+
+        # Use CPU count if max_workers is not specified
+        if (max_workers := PreloadSettings.instance().preload_max_workers) is None:
+            max_workers = os.cpu_count() or 1
 
-            # Execute their run_configure methods
-            consume(autorun_configuration.run_configure() for autorun_configuration in autorun_configurations)
+        if max_workers == 0 or len(work_items) <= 1:
+            # Read in this process
+            yield from (_read_file(*work_item) for work_item in work_items)
+        else:
+            # Start workers using spawn rather than fork because this process may already have threads holding
+            # locks, for example database connection pools and log writers, _read_file does not depend on them
+            worker_count = min(max_workers, len(work_items))
+            with ProcessPoolExecutor(
+                max_workers=worker_count, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                # Submit up to two files per worker ahead of the one being consumed
+                futures: deque[Future] = deque()
+                for work_item in work_items:
+                    futures.append(executor.submit(_read_file, *work_item))
+                    if len(futures) > 2 * worker_count:
+                        yield futures.popleft().result()
+                while futures:
+                    yield futures.popleft().result()
@@ -19,6 +19,7 @@ from typing import Iterable
 from typing import Sequence
 from typing import cast
 from pycouchdb import Server
+from pycouchdb.exceptions import Conflict
 from pycouchdb.exceptions import NotFound
 from cl.runtime.db.db import Db
 from cl.runtime.db.query_mixin import QueryMixin
@@ -47,7 +48,7 @@ from cl.runtime.serializers.data_serializers import DataSerializers
 from cl.runtime.serializers.key_serializers import KeySerializers
 from cl.runtime.settings.db_settings import DbSettings
 
-_INVALID_DB_NAME_SYMBOLS = r'/\\. "$*<>:|?' # TODO: !!! Update for CouchDB
+_INVALID_DB_NAME_SYMBOLS = r'/\\. "$*<>:|?'  # TODO: !!! Update for CouchDB
 """Invalid CouchDB database name symbols."""
 
 _INVALID_DB_NAME_SYMBOLS_MSG = r'<space>/\."$*<>:|?'  # TODO: !!! Update for CouchDB
@@ -56,7 +57,7 @@ _INVALID_DB_NAME_SYMBOLS_MSG = r'<space>/\."$*<>:|?'  # TODO: !!! Update for Cou
 _INVALID_DB_NAME_REGEX = re.compile(f"[{_INVALID_DB_NAME_SYMBOLS}]")
 """Precompiled regex to check for invalid CouchDB database name symbols."""
 
-_RECORD_SERIALIZER = DataSerializers.FOR_MONGO
+_RECORD_SERIALIZER = DataSerializers.FOR_COUCH
 """Used for record serialization."""
 
 _KEY_SERIALIZER = KeySerializers.DELIMITED
@@ -423,6 +424,61 @@ class BasicCouchDb(Db):
             else:
                 ErrorUtil.enum_value_error(save_policy, SavePolicy)
 
+    def replace_one_if(
+        self,
+        key_type: type[KeyMixin],
+        record: RecordMixin,
+        *,
+        query: QueryMixin,
+        dataset: str,
+        tenant: str,
+    ) -> bool:
+
+        # Check params
+        assert TypeCheck.guard_key_type(key_type)
+        query.check_frozen()
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
+
+        # Get CouchDB database and collection name for the key type
+        couch_db = self._get_couch_db()
+        collection_name = self._get_collection_name(key_type=key_type)
+
+        # Serialize key
+        serialized_key = _KEY_SERIALIZER.serialize(record.get_key())
+        doc_id = f"{collection_name}:{serialized_key}"
+
+        # Find the stored document by key and the query conditions
+        query_dict = {
+            "_id": doc_id,
+            "_dataset": dataset,
+            "_tenant": tenant,
+            "_collection": collection_name,
+        }
+        query_dict.update(BootstrapSerializers.FOR_MONGO_QUERY.serialize(query))
+        query_dict = self._convert_op_fields_to_couch_syntax(query_dict)
+        existing_docs = list(couch_db.find(self._build_mango_query(query_dict, limit=1)))
+        if not existing_docs:
+            # The condition is not met when the stored record does not exist
+            return False
+
+        # Serialize record
+        serialized_record = _RECORD_SERIALIZER.serialize(record)
+        serialized_record["_id"] = doc_id
+        serialized_record["_dataset"] = dataset
+        serialized_record["_key"] = serialized_key
+        serialized_record["_tenant"] = tenant
+        serialized_record["_collection"] = collection_name
+
+        # Save with the revision of the matching document, CouchDB rejects the save with a conflict
+        # if the document has been modified after it was found (optimistic concurrency)
+        serialized_record["_rev"] = existing_docs[0]["_rev"]
+        try:
+            couch_db.save(serialized_record)
+        except Conflict:
+            return False
+        return True
+
     def delete_many(
         self,
         key_type: type[KeyMixin],
@@ -728,7 +784,14 @@ class BasicCouchDb(Db):
 
         return record_dict
 
-    def _build_mango_query(self, selector: dict[str, Any], *, limit: int | None = None, skip: int | None = None, sort: list[dict[str, str]] | None = None) -> dict[str, Any]:
+    def _build_mango_query(
+        self,
+        selector: dict[str, Any],
+        *,
+        limit: int | None = None,
+        skip: int | None = None,
+        sort: list[dict[str, str]] | None = None,
+    ) -> dict[str, Any]:
         """Build a CouchDB Mango query from selector and options."""
         query = {"selector": selector}
         if limit is not None:
@@ -739,7 +802,9 @@ class BasicCouchDb(Db):
             query["sort"] = sort
         return query
 
-    def _get_couch_keys_filter(self, keys: Sequence[KeyMixin], *, dataset: str, tenant: str, collection_name: str) -> dict[str, Any]:
+    def _get_couch_keys_filter(
+        self, keys: Sequence[KeyMixin], *, dataset: str, tenant: str, collection_name: str
+    ) -> dict[str, Any]:
         """Get filter for loading records that match one of the specified keys."""
         serialized_keys = tuple(_KEY_SERIALIZER.serialize(key) for key in keys)
         # Build list of document IDs
@@ -774,9 +839,7 @@ class BasicCouchDb(Db):
 
             # Create design document for Mango index
             design_doc_id = f"_design/index_{typename(query_type).replace('.', '_')}"
-            index_def = {
-                "fields": [{"name": field, "type": "string"} for field in index_fields]
-            }
+            index_def = {"fields": [{"name": field, "type": "string"} for field in index_fields]}
 
             try:
                 # Try to get existing design document
@@ -786,12 +849,7 @@ class BasicCouchDb(Db):
                 couch_db.save(design_doc)
             except NotFound:
                 # Create new design document
-                design_doc = {
-                    "_id": design_doc_id,
-                    "indexes": {
-                        f"index_{typename(query_type)}": index_def
-                    }
-                }
+                design_doc = {"_id": design_doc_id, "indexes": {f"index_{typename(query_type)}": index_def}}
                 couch_db.save(design_doc)
 
             # Add to the set of query types for which the index has already been added
@@ -15,6 +15,7 @@
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
+from typing import Iterator
 from typing import Self
 from typing import Sequence
 from typing import cast
@@ -92,6 +93,9 @@ class DataSource(DataSourceKey, RecordMixin):
     _pending_replacements: list[RecordMixin] | None = None
     """Records that will be replaced on commit."""
 
+    _data_source_chain: tuple[Self, ...] | None = None
+    """This data source followed by the chain of its parents, resolved on first use."""
+
     def get_key(self) -> DataSourceKey:
         return DataSourceKey(data_source_id=self.data_source_id).build()
 
@@ -327,11 +331,11 @@ class DataSource(DataSourceKey, RecordMixin):
                     f"that are not derived from the cast_to parameter {typename(cast_to)}:\n{invalid_records_str}"
                 )
 
-        # The list of keys to load, skip None and records
-        keys_to_load = [x for x in records_or_keys if is_key_type(type(x))]
+        # Serialized keys (after normalization) to load, skip None and records
+        serialized_keys = [KeySerializers.TUPLE.serialize(x) if is_key_type(type(x)) else None for x in records_or_keys]
 
-        # Group keys by table
-        keys_to_load_grouped_by_key_type = self._group_inputs_by_key_type(keys_to_load)
+        # Keys to load in this data source, each key is included once
+        keys_to_load = list({k: x for k, x in zip(serialized_keys, records_or_keys) if k is not None}.items())
 
         # Select sort order to use for the DB call
         if sort_order == SortOrder.INPUT:
@@ -341,49 +345,33 @@ class DataSource(DataSourceKey, RecordMixin):
         else:
             db_sort_order = sort_order
 
-        # Get records from DB, the result is unsorted and grouped by table
-        loaded_records_grouped_by_key_type = [
-            self._get_db().load_many(
-                key_type,
-                keys_for_key_type,
-                dataset=self.dataset.dataset_id,
-                tenant=self.tenant.tenant_id,
-                project_to=project_to,
-                sort_order=db_sort_order,
+        # Look up each key in this data source, then only the keys that are still missing in each successive parent
+        # using one call per key type for each level of the hierarchy
+        loaded_records_dict = {}
+        for data_source in self._get_data_source_chain():
+            if not keys_to_load:
+                break
+            loaded_records_dict.update(
+                data_source._load_many_from_db(
+                    [x for _, x in keys_to_load],
+                    project_to=project_to,
+                    sort_order=db_sort_order,
+                )
             )
-            for key_type, keys_for_key_type in keys_to_load_grouped_by_key_type.items()
-        ]
-
-        # Concatenated list
-        loaded_records = [item for sublist in loaded_records_grouped_by_key_type for item in sublist]
-        serialized_loaded_keys = [KeySerializers.TUPLE.serialize(x.get_key()) for x in loaded_records]
-
-        # Create a dictionary with pairs consisting of serialized key (after normalization) and the record for this key
-        loaded_records_dict = {k: v for k, v in zip(serialized_loaded_keys, loaded_records)}
+            keys_to_load = [(k, x) for k, x in keys_to_load if k not in loaded_records_dict]
 
         # Populate the result with records loaded using input keys, pass through None and input records
-        # Invoke build on each item (will have no effect if already invoked)
         result = tuple(
-            loaded_records_dict.get(KeySerializers.TUPLE.serialize(x), None) if is_key_type(type(x)) else x
-            for x in records_or_keys
+            loaded_records_dict.get(k, None) if k is not None else x for k, x in zip(serialized_keys, records_or_keys)
         )
 
         # Invoke build and return (build will have no effect if already invoked)
-        if result is not None:
-            result = tuple(x.build() if x is not None else x for x in result)
+        result = tuple(x.build() if x is not None else x for x in result)
 
         # Cast to cast_to if specified, pass through None
         if cast_to is not None:
             result = tuple(CastUtil.cast_or_none(cast_to, x) for x in result)
-
-        # If result is empty return from parent DataSource
-        not_none_result = [x for x in result if x]
-        if not not_none_result and self.parent:
-            return self.parent.load_many_or_none(
-                records_or_keys, cast_to=cast_to, project_to=project_to, sort_order=sort_order
-            )
-        else:
-            return result
+        return result
 
     def load_by_type(
         self,
@@ -472,6 +460,68 @@ class DataSource(DataSourceKey, RecordMixin):
         else:
             return result
 
+    def iter_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
+        """
+        Iterate over all records for the specified key type fetching them from the database in batches.
+
+        Notes:
+            The database connection or cursor may be held until the iterator is exhausted or closed
+
+        Args:
+            key_type: Key type determines the database table
+            cast_to: Cast the result to this type (error if not a subtype)
+            restrict_to: Include only this type and its subtypes, skip other types
+            project_to: Use some or all fields from the stored record to create and return instances of this type
+            sort_order: Sort by key fields in the specified order, reversing for fields marked as DESC
+            limit: Maximum number of records to return (for pagination)
+            skip: Number of records to skip (for pagination)
+            batch_size: Number of records fetched from the database at a time (defaults to DbSettings)
+        """
+        assert TypeCheck.guard_key_type(key_type)
+
+        records = self._get_db().iter_all(
+            key_type=key_type,
+            dataset=self.dataset.dataset_id,
+            tenant=self.tenant.tenant_id,
+            cast_to=cast_to,
+            restrict_to=restrict_to,
+            project_to=project_to,
+            sort_order=sort_order,
+            limit=limit,
+            skip=skip,
+            batch_size=batch_size,
+        )
+
+        # Invoke build and yield (build will have no effect if already invoked)
+        is_empty = True
+        for record in records:
+            is_empty = False
+            yield record.build()
+
+        # If result is empty yield from parent DataSource
+        if is_empty and self.parent:
+            yield from self.parent.iter_all(
+                key_type,
+                cast_to=cast_to,
+                restrict_to=restrict_to,
+                project_to=project_to,
+                sort_order=sort_order,
+                limit=limit,
+                skip=skip,
+                batch_size=batch_size,
+            )
+
     def load_by_filter(
         self,
         filter_: Filter,
@@ -600,6 +650,94 @@ class DataSource(DataSourceKey, RecordMixin):
         else:
             return result
 
+    def iter_by_query(
+        self,
+        query: QueryMixin,
+        *,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
+        """
+        Iterate over records that match the specified query fetching them from the database in batches.
+
+        Notes:
+            The database connection or cursor may be held until the iterator is exhausted or closed
+
+        Args:
+            query: Contains predicates to match
+            cast_to: Cast the result to this type (error if not a subtype)
+            restrict_to: Include only this type and its subtypes, skip other types
+            project_to: Use some or all fields from the stored record to create and return instances of this type
+            sort_order: Sort by query fields in the specified order, reversing for fields marked as DESC
+            limit: Maximum number of records to return (for pagination)
+            skip: Number of records to skip (for pagination)
+            batch_size: Number of records fetched from the database at a time (defaults to DbSettings)
+        """
+        records = self._get_db().iter_by_query(
+            query,
+            dataset=self.dataset.dataset_id,
+            tenant=self.tenant.tenant_id,
+            cast_to=cast_to,
+            restrict_to=restrict_to,
+            project_to=project_to,
+            sort_order=sort_order,
+            limit=limit,
+            skip=skip,
+            batch_size=batch_size,
+        )
+
+        # Invoke build and yield (build will have no effect if already invoked)
+        is_empty = True
+        for record in records:
+            is_empty = False
+            yield record.build()
+
+        # If result is empty yield from parent DataSource
+        if is_empty and self.parent:
+            yield from self.parent.iter_by_query(
+                query,
+                cast_to=cast_to,
+                restrict_to=restrict_to,
+                project_to=project_to,
+                sort_order=sort_order,
+                limit=limit,
+                skip=skip,
+                batch_size=batch_size,
+            )
+
+    def count_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        restrict_to: type | None = None,
+    ) -> int:
+        """
+        Return the count of all records for the specified key type.
+
+        Args:
+            key_type: Key type determines the database table
+            restrict_to: Include only this type and its subtypes, skip other types
+        """
+        assert TypeCheck.guard_key_type(key_type)
+
+        result = self._get_db().count_all(
+            key_type,
+            dataset=self.dataset.dataset_id,
+            tenant=self.tenant.tenant_id,
+            restrict_to=restrict_to,
+        )
+
+        # If result is empty return from parent DataSource
+        if result == 0 and self.parent:
+            return self.parent.count_all(key_type, restrict_to=restrict_to)
+        else:
+            return result
+
     def count_by_query(
         self,
         query: QueryMixin,
@@ -702,6 +840,33 @@ class DataSource(DataSourceKey, RecordMixin):
         """
         self._save_many(records, commit=commit, save_policy=SavePolicy.REPLACE)
 
+    def replace_one_if(
+        self,
+        record: RecordMixin,
+        *,
+        query: QueryMixin,
+    ) -> bool:
+        """
+        Atomically replace the record only if the stored record with the same key exists and matches the query,
+        return True if the record was replaced and False otherwise (compare-and-set).
+
+        Notes:
+            - DB is written to immediately rather than on commit(), other pending operations are not committed
+            - Use to claim a record so that only one of the concurrent processes or threads proceeds
+
+        Args:
+            record: Record to be saved
+            query: Condition the stored record must match, its target type must have the same key type as the record
+        """
+        assert TypeCheck.guard_record_sequence([record])
+        return self._get_db().replace_one_if(
+            record.get_key_type(),
+            record,
+            query=query,
+            dataset=self.dataset.dataset_id,
+            tenant=self.tenant.tenant_id,
+        )
+
     def delete_one(
         self,
         key: KeyMixin,
@@ -768,6 +933,7 @@ class DataSource(DataSourceKey, RecordMixin):
         if not self._has_pending_operations():
             return
 
+        transaction_started = False
         try:
             # Ensure no key collisions within the deletions, insertions and replacements lists
             pending_keys = self._pending_deletions + [
@@ -803,6 +969,10 @@ class DataSource(DataSourceKey, RecordMixin):
                 )
                 self._pending_replacements.extend(record_type_presences)
 
+            # Apply all deletes, inserts and replacements in a single transaction if supported by the database
+            self._get_db().begin_transaction()
+            transaction_started = True
+
             # Invoke delete_many for all pending deletes
             if self._pending_deletions:
                 [
@@ -841,9 +1011,22 @@ class DataSource(DataSourceKey, RecordMixin):
                         tenant=self.tenant.tenant_id,
                         save_policy=SavePolicy.REPLACE,
                     )
+
+            # Commit the transaction, the database ends the transaction even if commit fails
+            transaction_started = False
+            self._get_db().commit_transaction()
         except Exception as e:
             # Clear all pending operations before propagating
             self._clear_pending_operations()
+            # Roll back the partially applied changes if supported by the database
+            if transaction_started:
+                try:
+                    self._get_db().rollback_transaction()
+                except Exception as rollback_error:
+                    raise RuntimeError(
+                        f"Rollback after an error in commit for data_source_id={self.data_source_id} failed.\n"
+                        f"Rollback error: {rollback_error}"
+                    ) from e
             # Rethrow to propagate
             raise e
         else:
@@ -918,6 +1101,53 @@ class DataSource(DataSourceKey, RecordMixin):
         """Cast parent key types to record type, the record is already loaded by the __init method."""
         return cast(Self, self.parent)
 
+    def _get_data_source_chain(self) -> tuple[Self, ...]:
+        """Return self followed by parent, parent of parent, etc., loading parents specified as keys on first call."""
+        if self._data_source_chain is None:
+            result = [self]
+            data_source_ids = {self.data_source_id}
+            parent = self.parent
+            while parent is not None:
+                if is_key_type(type(parent)):
+                    # Load parent specified as key using the active data source
+                    parent = active(DataSource).load_one(parent)
+                if parent.data_source_id in data_source_ids:
+                    raise RuntimeError(
+                        f"Parent of data source {self.data_source_id} includes\n"
+                        f"a cycle in the chain of parents at {parent.data_source_id}."
+                    )
+                data_source_ids.add(parent.data_source_id)
+                result.append(parent)
+                parent = parent.parent
+            self._data_source_chain = tuple(result)
+        return self._data_source_chain
+
+    def _load_many_from_db(
+        self,
+        keys: Sequence[KeyMixin],
+        *,
+        project_to: type[TRecord] | None,
+        sort_order: SortOrder,
+    ) -> dict[tuple, RecordMixin]:
+        """Load keys from the database of this data source only, return a dict of serialized key and record."""
+
+        # Get records from DB using one call per table, the result is unsorted
+        loaded_records = [
+            record
+            for key_type, keys_for_key_type in self._group_inputs_by_key_type(keys).items()
+            for record in self._get_db().load_many(
+                key_type,
+                keys_for_key_type,
+                dataset=self.dataset.dataset_id,
+                tenant=self.tenant.tenant_id,
+                project_to=project_to,
+                sort_order=sort_order,
+            )
+        ]
+
+        # Create a dictionary with pairs consisting of serialized key (after normalization) and the record for this key
+        return {KeySerializers.TUPLE.serialize(x.get_key()): x for x in loaded_records}
+
     @classmethod
     def _group_inputs_by_key_type(
         cls, inputs: Sequence[RecordMixin | KeyMixin | None]
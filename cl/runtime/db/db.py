@@ -15,6 +15,7 @@
 from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
+from typing import Iterator
 from typing import Sequence
 from typing import final
 from cl.runtime.contexts.context_manager import active_or_default
@@ -24,8 +25,10 @@ from cl.runtime.db.save_policy import SavePolicy
 from cl.runtime.db.sort_order import SortOrder
 from cl.runtime.exceptions.error_util import ErrorUtil
 from cl.runtime.records.key_mixin import KeyMixin
+from cl.runtime.records.protocols import is_record_type
 from cl.runtime.records.record_mixin import RecordMixin
 from cl.runtime.records.record_mixin import TRecord
+from cl.runtime.records.typename import typename
 from cl.runtime.records.typename import typenameof
 from cl.runtime.schema.type_info import TypeInfo
 from cl.runtime.server.env import Env
@@ -126,6 +129,116 @@ class Db(DbKey, RecordMixin, ABC):
             skip: Number of records to skip (for pagination)
         """
 
+    def iter_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
+        """
+        Iterate over all records for the specified key type, fetching and deserializing in batches.
+        The default implementation delegates to load_all, override to avoid loading all records at once.
+
+        Notes:
+            The database connection or cursor may be held until the iterator is exhausted or closed.
+
+        Args:
+            key_type: Key type determines the database table
+            dataset: Backslash-delimited dataset argument is combined with self.base_dataset if specified
+            tenant: Unique tenant identifier, tenants are isolated when sharing the same DB
+            cast_to: Cast the result to this type (error if not a subtype)
+            restrict_to: Include only this type and its subtypes, skip other types
+            project_to: Use some or all fields from the stored record to create and return instances of this type
+            sort_order: Sort by key fields in the specified order, reversing for fields marked as DESC
+            limit: Maximum number of records to return (for pagination)
+            skip: Number of records to skip (for pagination)
+            batch_size: Number of records fetched from the database at a time (defaults to DbSettings)
+        """
+        yield from self.load_all(
+            key_type,
+            dataset=dataset,
+            tenant=tenant,
+            cast_to=cast_to,
+            restrict_to=restrict_to,
+            project_to=project_to,
+            sort_order=sort_order,
+            limit=limit,
+            skip=skip,
+        )
+
+    def iter_by_query(
+        self,
+        query: QueryMixin,
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
+        """
+        Iterate over records that match the specified query, fetching and deserializing in batches.
+        The default implementation delegates to load_by_query, override to avoid loading all records at once.
+
+        Notes:
+            The database connection or cursor may be held until the iterator is exhausted or closed.
+
+        Args:
+            query: Contains predicates to match
+            dataset: Backslash-delimited dataset argument is combined with self.base_dataset if specified
+            tenant: Unique tenant identifier, tenants are isolated when sharing the same DB
+            cast_to: Cast the result to this type (error if not a subtype)
+            restrict_to: Include only this type and its subtypes, skip other types
+            project_to: Use some or all fields from the stored record to create and return instances of this type
+            sort_order: Sort by query fields in the specified order, reversing for fields marked as DESC
+            limit: Maximum number of records to return (for pagination)
+            skip: Number of records to skip (for pagination)
+            batch_size: Number of records fetched from the database at a time (defaults to DbSettings)
+        """
+        yield from self.load_by_query(
+            query,
+            dataset=dataset,
+            tenant=tenant,
+            cast_to=cast_to,
+            restrict_to=restrict_to,
+            project_to=project_to,
+            sort_order=sort_order,
+            limit=limit,
+            skip=skip,
+        )
+
+    def count_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        restrict_to: type | None = None,
+    ) -> int:
+        """
+        Return the count of all records for the specified key type.
+        The default implementation iterates over the records, override to count in the database.
+
+        Args:
+            key_type: Key type determines the database table
+            dataset: Backslash-delimited dataset argument is combined with self.base_dataset if specified
+            tenant: Unique tenant identifier, tenants are isolated when sharing the same DB
+            restrict_to: Include only this type and its subtypes, skip other types
+        """
+        return sum(1 for _ in self.iter_all(key_type, dataset=dataset, tenant=tenant, restrict_to=restrict_to))
+
     @abstractmethod
     def count_by_query(
         self,
@@ -166,6 +279,32 @@ class Db(DbKey, RecordMixin, ABC):
             save_policy: Insert vs. replace policy, partial update is not included due to design considerations
         """
 
+    def replace_one_if(
+        self,
+        key_type: type[KeyMixin],
+        record: RecordMixin,
+        *,
+        query: QueryMixin,
+        dataset: str,
+        tenant: str,
+    ) -> bool:
+        """
+        Atomically replace the record only if the stored record with the same key exists and matches the query,
+        return True if the record was replaced and False otherwise (compare-and-set).
+
+        Notes:
+            The default implementation raises an error, derived types that support atomic conditional
+            replacement override this method.
+
+        Args:
+            key_type: Key type determines the database table
+            record: Record to save, record.get_key_type() must match the key_type argument
+            query: Condition the stored record must match, its target type must have the specified key type
+            dataset: Backslash-delimited dataset argument is combined with self.base_dataset if specified
+            tenant: Unique tenant identifier, tenants are isolated when sharing the same DB
+        """
+        raise RuntimeError(f"{typenameof(self)} does not support conditional replacement of records.")
+
     @abstractmethod
     def delete_many(
         self,
@@ -204,6 +343,21 @@ class Db(DbKey, RecordMixin, ABC):
             restrict_to: Include only this type and its subtypes, skip other types
         """
 
+    def begin_transaction(self) -> None:
+        """
+        Begin a transaction where saves and deletes are applied atomically by commit_transaction
+        and discarded by rollback_transaction, the default implementation does nothing.
+
+        Notes:
+            Databases that do not support transactions apply each save and delete immediately.
+        """
+
+    def commit_transaction(self) -> None:
+        """Commit the transaction started by begin_transaction, the default implementation does nothing."""
+
+    def rollback_transaction(self) -> None:
+        """Roll back the transaction started by begin_transaction, the default implementation does nothing."""
+
     @abstractmethod
     def close_connection(self) -> None:  # TODO: !!! Check if this should be done using a context manager instead
         """Close database connection to releasing resource locks."""
@@ -280,8 +434,15 @@ class Db(DbKey, RecordMixin, ABC):
             else:
                 raise RuntimeError("Use pytest fixtures to create temporary DBs inside tests.")
 
-        # Create and return a new DB instance
-        return db_type(db_id=db_id).build()
+        # Create a new DB instance
+        result = db_type(db_id=db_id).build()
+
+        # Wrap in the in-process record cache shared by all data sources for this db_id if enabled in settings
+        if db_settings.db_cache:
+            from cl.runtime.db.local.cached_db import CachedDb  # TODO: Avoid circular dependency
+
+            result = CachedDb.for_db(result)
+        return result
 
     @classmethod
     def _check_dataset(cls, dataset: str) -> None:
@@ -302,3 +463,18 @@ class Db(DbKey, RecordMixin, ABC):
             raise RuntimeError(f"Tenant identifier cannot be an empty string.")
         elif not isinstance(tenant, str):
             raise RuntimeError(f"Tenant identifier must be a string.")
+
+    @classmethod
+    def _get_projected_field_names(cls, *, key_type: type[KeyMixin], project_to: type) -> tuple[str, ...]:
+        """
+        Return the names of stored fields to read when creating instances of project_to, error if project_to
+        is not a record type with the specified key type.
+        """
+        if not is_record_type(project_to):
+            raise RuntimeError(f"Parameter project_to={typename(project_to)} is not a record type.")
+        elif project_to.get_key_type() != key_type:
+            raise RuntimeError(
+                f"Key type {typename(project_to.get_key_type())} of project_to={typename(project_to)}\n"
+                f"does not match key_type={typename(key_type)}."
+            )
+        return project_to.get_field_names()
@@ -0,0 +1,501 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from dataclasses import dataclass
+from typing import Iterator
+from typing import Sequence
+from typing import cast
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.db.db import Db
+from cl.runtime.db.db_key import DbKey
+from cl.runtime.db.local.local_cache import LocalCache
+from cl.runtime.db.query_mixin import QueryMixin
+from cl.runtime.db.save_policy import SavePolicy
+from cl.runtime.db.sort_order import SortOrder
+from cl.runtime.records.for_dataclasses.extensions import required
+from cl.runtime.records.key_mixin import KeyMixin
+from cl.runtime.records.protocols import is_key_type
+from cl.runtime.records.record_mixin import RecordMixin
+from cl.runtime.records.record_mixin import TRecord
+from cl.runtime.records.type_check import TypeCheck
+from cl.runtime.serializers.key_serializers import KeySerializers
+from cl.runtime.settings.db_settings import DbSettings
+
+_KEY_SERIALIZER = KeySerializers.TUPLE
+"""Serializer for keys used to match cached records to the requested keys."""
+
+_cached_db_dict: dict[tuple[type, str], "CachedDb"] = {}
+"""Dict of CachedDb instances shared by all data sources in this process, with (db_type, db_id) key."""
+
+_cached_db_dict_lock = threading.Lock()
+"""Lock for creating shared CachedDb instances."""
+
+_cached_db_lock = threading.Lock()
+"""Lock for the hit and miss counters, the invalidation count and adding loaded records to cache."""
+
+
+@dataclass(slots=True, kw_only=True)
+class CachedDb(Db):
+    """
+    In-process read-through and write-through record cache in front of another database.
+
+    Notes:
+        - Only the lookup by key is served from cache, queries are passed through to the underlying database
+        - Records are invalidated on save and delete in this process, changes made by other processes are not seen
+        - Use 'for_db' to get the instance shared by all data sources in this process for the underlying database
+        - Records saved inside a transaction are written through on commit, other threads do not see them before
+    """
+
+    db: DbKey = required()
+    """Underlying database where records are stored (loaded from the active data source if a key is specified)."""
+
+    max_records: int | None = None
+    """Maximum number of records in cache, least recently used records are evicted (defaults to DbSettings)."""
+
+    _cache: LocalCache | None = None
+    """Cache of record instances partitioned by dataset and tenant."""
+
+    _hit_count: int = 0
+    """Number of records returned from cache by load_many since creation or the last reset_counters call."""
+
+    _miss_count: int = 0
+    """Number of records requested from the underlying database by load_many (found or not)."""
+
+    _invalidation_count: int = 0
+    """Incremented when records are invalidated, records loaded before it changed are not added to cache."""
+
+    _transaction_local: threading.local | None = None
+    """Holds the list of writes to apply to cache on commit or rollback for the transaction in each thread."""
+
+    def __init(self) -> None:
+        """Use instead of __init__ in the builder pattern, invoked by the build method in base to derived order."""
+
+        # Load the underlying database object if specified as key
+        if is_key_type(type(self.db)):
+            from cl.runtime.db.data_source import DataSource  # TODO: Avoid circular dependency
+
+            self.db = active(DataSource).load_one(self.db)
+        if isinstance(self.db, CachedDb):
+            raise RuntimeError(f"The underlying database {self.db.db_id} of a CachedDb is also a CachedDb.")
+
+        # Share db_id with the underlying database if not specified
+        if self.db_id is None:
+            self.db_id = self.db.db_id
+
+        # Get the maximum number of records from settings if not specified
+        if self.max_records is None:
+            self.max_records = DbSettings.instance().db_cache_max_records
+
+        # Create the cache
+        self._cache = LocalCache(db_id=self.db_id, max_records=self.max_records).build()
+        self._transaction_local = threading.local()
+
+    @classmethod
+    def for_db(cls, db: Db) -> "CachedDb":
+        """Return the instance shared by all data sources in this process for db type and db_id, create if needed."""
+        cached_db_id = (type(db), db.db_id)
+        if (result := _cached_db_dict.get(cached_db_id, None)) is None:
+            with _cached_db_dict_lock:
+                if (result := _cached_db_dict.get(cached_db_id, None)) is None:
+                    result = CachedDb(db=db).build()
+                    _cached_db_dict[cached_db_id] = result
+        return result
+
+    def get_hit_count(self) -> int:
+        """Number of records returned from cache by load_many since creation or the last reset_counters call."""
+        return self._hit_count
+
+    def get_miss_count(self) -> int:
+        """Number of records requested from the underlying database by load_many (found or not)."""
+        return self._miss_count
+
+    def reset_counters(self) -> None:
+        """Reset hit and miss counters to zero."""
+        with _cached_db_lock:
+            self._hit_count = 0
+            self._miss_count = 0
+
+    def is_empty(self) -> bool:
+        """Return true if the underlying database contains no collections."""
+        return self._get_db().is_empty()
+
+    def load_many(
+        self,
+        key_type: type[KeyMixin],
+        keys: Sequence[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder,  # Default value not provided due to the lack of natural default for this method
+    ) -> tuple[RecordMixin, ...]:
+
+        # Check params
+        assert TypeCheck.guard_key_type(key_type)
+        assert TypeCheck.guard_key_sequence(keys)
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
+
+        if project_to is not None:
+            # Projected records are not cached
+            return self._get_db().load_many(
+                key_type,
+                keys,
+                dataset=dataset,
+                tenant=tenant,
+                project_to=project_to,
+                sort_order=sort_order,
+            )
+
+        # Look up in cache first
+        cached_records = self._cache.load_many(
+            key_type,
+            keys,
+            dataset=dataset,
+            tenant=tenant,
+            sort_order=SortOrder.UNORDERED,
+        )
+        cached_keys = set(_KEY_SERIALIZER.serialize(x.get_key()) for x in cached_records)
+        missing_keys = [x for x in keys if _KEY_SERIALIZER.serialize(x) not in cached_keys]
+
+        # Update the counters and get the invalidation count before loading from the underlying database
+        with _cached_db_lock:
+            self._hit_count += len(keys) - len(missing_keys)
+            self._miss_count += len(missing_keys)
+            invalidation_count = self._invalidation_count
+
+        if missing_keys:
+            # Load the remaining records from the underlying database in a single call, then build and add to cache
+            loaded_records = self._get_db().load_many(
+                key_type,
+                missing_keys,
+                dataset=dataset,
+                tenant=tenant,
+                sort_order=SortOrder.UNORDERED,
+            )
+            loaded_records = tuple(x.build() for x in loaded_records)
+
+            # Do not add to cache inside a transaction or if records were invalidated while loading,
+            # as the loaded records may be uncommitted or out of date
+            if not self._in_transaction():
+                with _cached_db_lock:
+                    if self._invalidation_count == invalidation_count:
+                        self._cache.save_many(
+                            key_type,
+                            loaded_records,
+                            dataset=dataset,
+                            tenant=tenant,
+                            save_policy=SavePolicy.REPLACE,
+                        )
+            result = (*cached_records, *loaded_records)
+        else:
+            result = tuple(cached_records)
+
+        # Apply sort to the combined result
+        return LocalCache._apply_sort(result, sort_order=sort_order)  # noqa
+
+    def load_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+    ) -> tuple[TRecord, ...]:
+        return self._get_db().load_all(
+            key_type,
+            dataset=dataset,
+            tenant=tenant,
+            cast_to=cast_to,
+            restrict_to=restrict_to,
+            project_to=project_to,
+            sort_order=sort_order,
+            limit=limit,
+            skip=skip,
+        )
+
+    def load_by_query(
+        self,
+        query: QueryMixin,
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+    ) -> tuple[TRecord, ...]:
+        return self._get_db().load_by_query(
+            query,
+            dataset=dataset,
+            tenant=tenant,
+            cast_to=cast_to,
+            restrict_to=restrict_to,
+            project_to=project_to,
+            sort_order=sort_order,
+            limit=limit,
+            skip=skip,
+        )
+
+    def iter_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
+        return self._get_db().iter_all(
+            key_type,
+            dataset=dataset,
+            tenant=tenant,
+            cast_to=cast_to,
+            restrict_to=restrict_to,
+            project_to=project_to,
+            sort_order=sort_order,
+            limit=limit,
+            skip=skip,
+            batch_size=batch_size,
+        )
+
+    def iter_by_query(
+        self,
+        query: QueryMixin,
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
+        return self._get_db().iter_by_query(
+            query,
+            dataset=dataset,
+            tenant=tenant,
+            cast_to=cast_to,
+            restrict_to=restrict_to,
+            project_to=project_to,
+            sort_order=sort_order,
+            limit=limit,
+            skip=skip,
+            batch_size=batch_size,
+        )
+
+    def count_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        restrict_to: type | None = None,
+    ) -> int:
+        return self._get_db().count_all(
+            key_type,
+            dataset=dataset,
+            tenant=tenant,
+            restrict_to=restrict_to,
+        )
+
+    def count_by_query(
+        self,
+        query: QueryMixin,
+        *,
+        dataset: str,
+        tenant: str,
+        restrict_to: type | None = None,
+    ) -> int:
+        return self._get_db().count_by_query(
+            query,
+            dataset=dataset,
+            tenant=tenant,
+            restrict_to=restrict_to,
+        )
+
+    def save_many(
+        self,
+        key_type: type[KeyMixin],
+        records: Sequence[RecordMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        save_policy: SavePolicy,
+    ) -> None:
+
+        # Invalidate before writing so a partially failed write does not leave stale records in cache
+        keys = [x.get_key() for x in records]
+        self._invalidate(key_type, keys, dataset=dataset, tenant=tenant)
+
+        # Write to the underlying database first
+        self._get_db().save_many(
+            key_type,
+            records,
+            dataset=dataset,
+            tenant=tenant,
+            save_policy=save_policy,
+        )
+
+        if self._in_transaction():
+            # Other threads must not see uncommitted records, write through on commit
+            self._transaction_local.pending.append((key_type, keys, records, dataset, tenant))
+        else:
+            # Write through to cache after the write succeeds, records are frozen and can be shared
+            self._cache.save_many(
+                key_type,
+                records,
+                dataset=dataset,
+                tenant=tenant,
+                save_policy=SavePolicy.REPLACE,
+            )
+
+    def replace_one_if(
+        self,
+        key_type: type[KeyMixin],
+        record: RecordMixin,
+        *,
+        query: QueryMixin,
+        dataset: str,
+        tenant: str,
+    ) -> bool:
+
+        # Invalidate before writing, the record is not written through as the condition is checked by the database
+        keys = [record.get_key()]
+        self._invalidate(key_type, keys, dataset=dataset, tenant=tenant)
+
+        # The condition must be checked against the underlying database as cache may be out of date
+        result = self._get_db().replace_one_if(
+            key_type,
+            record,
+            query=query,
+            dataset=dataset,
+            tenant=tenant,
+        )
+        if self._in_transaction():
+            self._transaction_local.pending.append((key_type, keys, None, dataset, tenant))
+        return result
+
+    def delete_many(
+        self,
+        key_type: type[KeyMixin],
+        keys: Sequence[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+    ) -> None:
+        self._invalidate(key_type, keys, dataset=dataset, tenant=tenant)
+        self._get_db().delete_many(key_type, keys, dataset=dataset, tenant=tenant)
+        if self._in_transaction():
+            self._transaction_local.pending.append((key_type, keys, None, dataset, tenant))
+
+    def delete_by_query(
+        self,
+        query: QueryMixin,
+        *,
+        dataset: str,
+        tenant: str,
+        restrict_to: type | None = None,
+    ) -> None:
+        # Keys of the deleted records are not known, invalidate the entire table for this dataset and tenant
+        key_type = query.get_target_type().get_key_type()
+        self._invalidate(key_type, None, dataset=dataset, tenant=tenant)
+        self._get_db().delete_by_query(query, dataset=dataset, tenant=tenant, restrict_to=restrict_to)
+        if self._in_transaction():
+            self._transaction_local.pending.append((key_type, None, None, dataset, tenant))
+
+    def begin_transaction(self) -> None:
+        self._get_db().begin_transaction()
+        self._transaction_local.pending = []
+
+    def commit_transaction(self) -> None:
+        committed = False
+        try:
+            self._get_db().commit_transaction()
+            committed = True
+        finally:
+            # Records loaded by other threads during the transaction may be out of date after commit
+            self._apply_pending(write_through=committed)
+
+    def rollback_transaction(self) -> None:
+        try:
+            self._get_db().rollback_transaction()
+        finally:
+            self._apply_pending(write_through=False)
+
+    def close_connection(self) -> None:
+        self._cache._clear()  # noqa
+        self._get_db().close_connection()
+
+    def _drop_db_do_not_call_directly(self) -> None:
+        """DO NOT CALL DIRECTLY, call drop_db() instead."""
+        self._cache._clear()  # noqa
+        self._get_db()._drop_db_do_not_call_directly()  # noqa
+
+    def _in_transaction(self) -> bool:
+        """Return True if a transaction has been started by begin_transaction in the current thread."""
+        return getattr(self._transaction_local, "pending", None) is not None
+
+    def _invalidate(
+        self,
+        key_type: type[KeyMixin],
+        keys: Sequence[KeyMixin] | None,
+        *,
+        dataset: str,
+        tenant: str,
+    ) -> None:
+        """Remove the records for the specified keys from cache, or all records for the key type if keys is None."""
+        with _cached_db_lock:
+            self._invalidation_count += 1
+            if keys is not None:
+                self._cache.delete_many(key_type, keys, dataset=dataset, tenant=tenant)
+            else:
+                self._cache.delete_table(key_type, dataset=dataset, tenant=tenant)
+
+    def _apply_pending(self, *, write_through: bool) -> None:
+        """
+        Invalidate the records written inside the transaction in the current thread, then write through
+        the saved records if specified, and end the transaction.
+        """
+        pending = self._transaction_local.pending
+        self._transaction_local.pending = None
+        for key_type, keys, records, dataset, tenant in pending or ():
+            self._invalidate(key_type, keys, dataset=dataset, tenant=tenant)
+            if write_through and records is not None:
+                self._cache.save_many(
+                    key_type,
+                    records,
+                    dataset=dataset,
+                    tenant=tenant,
+                    save_policy=SavePolicy.REPLACE,
+                )
+
+    def _get_db(self) -> Db:
+        """Cast db key type to record type, the record is already loaded by the __init method."""
+        return cast(Db, self.db)
@@ -12,37 +12,75 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Any
+from typing import Iterable
 from typing import Sequence
 from cl.runtime.db.db import Db
 from cl.runtime.db.query_mixin import QueryMixin
 from cl.runtime.db.save_policy import SavePolicy
 from cl.runtime.db.sort_order import SortOrder
+from cl.runtime.exceptions.error_util import ErrorUtil
+from cl.runtime.records.cast_util import CastUtil
 from cl.runtime.records.for_dataclasses.extensions import required
 from cl.runtime.records.key_mixin import KeyMixin
+from cl.runtime.records.protocols import is_key_type
+from cl.runtime.records.protocols import is_record_type
 from cl.runtime.records.record_mixin import RecordMixin
 from cl.runtime.records.record_mixin import TRecord
 from cl.runtime.records.type_check import TypeCheck
+from cl.runtime.records.typename import typename
+from cl.runtime.serializers.bootstrap_serializers import BootstrapSerializers
 from cl.runtime.serializers.key_serializers import KeySerializers
 
 _KEY_SERIALIZER = KeySerializers.TUPLE
 """Serializer for keys used in cache lookup."""
 
+_SORT_KEY_SERIALIZER = KeySerializers.DELIMITED
+"""Serializer for keys used for sorting, matches the serialized _key field used for sorting by other Db types."""
+
+_QUERY_SERIALIZER = BootstrapSerializers.FOR_MONGO_QUERY
+"""Serializer for both queries and records when matching records to a query."""
+
 _local_cache_instance = None
 """Singleton instance is created on first access."""
 
+_TableId = tuple[str, str, type[KeyMixin]]
+"""Table identifier in (dataset, tenant, key_type) format."""
+
+_cache_lock = threading.RLock()
+"""Lock for reading and updating the cache and LRU order, the same instance may be used by several threads."""
+
 
 @dataclass(slots=True, kw_only=True)
 class LocalCache(Db):
     """In-memory cache for objects without serialization."""
 
-    __cache: dict[type[KeyMixin], dict[tuple, RecordMixin]] = required(default_factory=lambda: {})
-    """Record instance is stored in cache without serialization."""
+    max_records: int | None = None
+    """Least recently used records are evicted when the total number of records exceeds this limit (optional)."""
+
+    __cache: dict[_TableId, dict[tuple, RecordMixin]] = required(default_factory=lambda: {})
+    """Record instance is stored in cache without serialization, tables are partitioned by dataset and tenant."""
+
+    __lru: OrderedDict[tuple[_TableId, tuple], None] = required(default_factory=lambda: OrderedDict())
+    """Record identifiers in the order of last use, only maintained when max_records is set."""
+
+    def __init(self) -> None:
+        """Use instead of __init__ in the builder pattern, invoked by the build method in base to derived order."""
+        if self.max_records is not None and self.max_records <= 0:
+            raise RuntimeError(f"{typename(type(self))}.max_records={self.max_records} must be positive or None.")
 
     def is_empty(self) -> bool:
         """Return true if the cache dict is empty."""
         return len(self.__cache) == 0
 
+    def get_record_count(self) -> int:
+        """Return the total number of records in cache across all datasets, tenants and tables."""
+        with _cache_lock:
+            return sum(len(table_cache) for table_cache in self.__cache.values())
+
     def load_many(
         self,
         key_type: type[KeyMixin],
@@ -60,17 +98,20 @@ class LocalCache(Db):
         self._check_dataset(dataset)
         self._check_tenant(tenant)
 
-        if (table_cache := self.__cache.get(key_type, None)) is not None:
-            result = []
-            for key in keys:
-                # Look up the record, defaults to None
-                serialized_key = _KEY_SERIALIZER.serialize(key)  # Use hash instead?
-                record = table_cache.get(serialized_key, None)
-                result.append(record)
-            return result
-        else:
-            # Tables are created on demand, table not found means no records with this key type are stored
-            return []
+        table_id = (dataset, tenant, key_type)
+        serialized_keys = [_KEY_SERIALIZER.serialize(key) for key in keys]
+        with _cache_lock:
+            if (table_cache := self.__cache.get(table_id, None)) is not None:
+                result = []
+                for serialized_key in serialized_keys:
+                    # Look up the record, skip if not found
+                    if (record := table_cache.get(serialized_key, None)) is not None:
+                        self._touch(table_id, serialized_key)
+                        result.append(record)
+            else:
+                # Tables are created on demand, table not found means no records with this key type are stored
+                return tuple()
+        return self._apply_sort(result, sort_order=sort_order)
 
     def load_all(
         self,
@@ -85,7 +126,23 @@ class LocalCache(Db):
         limit: int | None = None,
         skip: int | None = None,
     ) -> tuple[TRecord, ...]:
-        raise NotImplementedError()
+
+        # Check params
+        assert TypeCheck.guard_key_type(key_type)
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
+
+        if project_to is not None:
+            raise RuntimeError(f"{typename(type(self))} does not currently support 'project_to' option.")
+
+        with _cache_lock:
+            table_records = tuple(self.__cache.get((dataset, tenant, key_type), {}).values())
+        records = self._apply_restrict_to(table_records, key_type=key_type, restrict_to=restrict_to)
+        records = self._apply_sort(records, sort_order=sort_order)
+        records = self._apply_limit_and_skip(records, limit=limit, skip=skip)
+        if cast_to is not None:
+            records = tuple(CastUtil.cast(cast_to, x) for x in records)
+        return records
 
     def load_by_query(
         self,
@@ -100,7 +157,19 @@ class LocalCache(Db):
         limit: int | None = None,
         skip: int | None = None,
     ) -> tuple[TRecord, ...]:
-        raise NotImplementedError()
+
+        if project_to is not None:
+            raise RuntimeError(f"{typename(type(self))} does not currently support 'project_to' option.")
+
+        records = self._select_by_query(query, dataset=dataset, tenant=tenant, restrict_to=restrict_to)
+
+        # Set cast_to to restrict_to or query target type if not specified
+        if cast_to is None:
+            cast_to = restrict_to if restrict_to is not None else query.get_target_type()
+
+        records = self._apply_sort(records, sort_order=sort_order)
+        records = self._apply_limit_and_skip(records, limit=limit, skip=skip)
+        return tuple(CastUtil.cast(cast_to, x) for x in records)
 
     def count_by_query(
         self,
@@ -110,7 +179,7 @@ class LocalCache(Db):
         tenant: str,
         restrict_to: type | None = None,
     ) -> int:
-        raise NotImplementedError()
+        return len(self._select_by_query(query, dataset=dataset, tenant=tenant, restrict_to=restrict_to))
 
     def save_many(
         self,
@@ -128,25 +197,65 @@ class LocalCache(Db):
         self._check_dataset(dataset)
         self._check_tenant(tenant)
 
-        # TODO: Provide a more performant implementation
-        for record in records:
+        table_id = (dataset, tenant, key_type)
+        with _cache_lock:
             # Try to retrieve table dictionary, insert if it does not yet exist
-            table_cache = self.__cache.setdefault(key_type, {})
-
-            # Serialize both key and record
-            key = record.get_key()
-            serialized_key = _KEY_SERIALIZER.serialize(key)
-
-            if save_policy == SavePolicy.INSERT:
-                # Insert the record, error if already exists
-                if serialized_key in table_cache:
-                    raise RuntimeError(f"Key {serialized_key} already exists in cache while INSERT policy is selected.")
-                table_cache[serialized_key] = record
-            elif save_policy == SavePolicy.REPLACE:
-                # Add record to cache, overwriting an existing record if present
-                table_cache[serialized_key] = record
-            else:
-                ErrorUtil.enum_value_error(save_policy, SavePolicy)
+            table_cache = self.__cache.setdefault(table_id, {})
+
+            for record in records:
+                # Serialize key
+                key = record.get_key()
+                serialized_key = _KEY_SERIALIZER.serialize(key)
+
+                if save_policy == SavePolicy.INSERT:
+                    # Insert the record, error if already exists
+                    if serialized_key in table_cache:
+                        raise RuntimeError(
+                            f"Key {serialized_key} already exists in cache while INSERT policy is selected."
+                        )
+                    table_cache[serialized_key] = record
+                elif save_policy == SavePolicy.REPLACE:
+                    # Add record to cache, overwriting an existing record if present
+                    table_cache[serialized_key] = record
+                else:
+                    raise ErrorUtil.enum_value_error(save_policy, SavePolicy)
+
+                # Mark as most recently used
+                self._touch(table_id, serialized_key)
+
+            # Evict least recently used records if max_records is exceeded
+            self._evict()
+
+    def replace_one_if(
+        self,
+        key_type: type[KeyMixin],
+        record: RecordMixin,
+        *,
+        query: QueryMixin,
+        dataset: str,
+        tenant: str,
+    ) -> bool:
+
+        # Check params
+        assert TypeCheck.guard_key_type(key_type)
+        query.check_frozen()
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
+
+        with _cache_lock:
+            # Get the stored record, the condition is not met when it does not exist
+            table_cache = self.__cache.get((dataset, tenant, key_type), {})
+            serialized_key = _KEY_SERIALIZER.serialize(record.get_key())
+            if (stored_record := table_cache.get(serialized_key, None)) is None:
+                return False
+
+            # Serialize the query and the stored record using the same serializer, then compare
+            query_dict = _QUERY_SERIALIZER.serialize(query)
+            if not self._match_query_dict(_QUERY_SERIALIZER.serialize(stored_record), query_dict):
+                return False
+
+            self.save_many(key_type, [record], dataset=dataset, tenant=tenant, save_policy=SavePolicy.REPLACE)
+            return True
 
     def delete_many(
         self,
@@ -156,7 +265,21 @@ class LocalCache(Db):
         dataset: str,
         tenant: str,
     ) -> None:
-        raise NotImplementedError()
+
+        # Check params
+        assert TypeCheck.guard_key_type(key_type)
+        assert TypeCheck.guard_key_sequence(keys)
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
+
+        table_id = (dataset, tenant, key_type)
+        serialized_keys = [_KEY_SERIALIZER.serialize(key) for key in keys]
+        with _cache_lock:
+            if (table_cache := self.__cache.get(table_id, None)) is not None:
+                for serialized_key in serialized_keys:
+                    # No error if the record is not found
+                    table_cache.pop(serialized_key, None)
+                    self.__lru.pop((table_id, serialized_key), None)
 
     def delete_by_query(
         self,
@@ -166,15 +289,184 @@ class LocalCache(Db):
         tenant: str,
         restrict_to: type | None = None,
     ) -> None:
-        raise NotImplementedError()
+        records = self._select_by_query(query, dataset=dataset, tenant=tenant, restrict_to=restrict_to)
+        key_type = query.get_target_type().get_key_type()
+        self.delete_many(key_type, [x.get_key() for x in records], dataset=dataset, tenant=tenant)
+
+    def delete_table(self, key_type: type[KeyMixin], *, dataset: str, tenant: str) -> None:
+        """Delete all records with the specified key type, dataset and tenant."""
+        table_id = (dataset, tenant, key_type)
+        with _cache_lock:
+            if (table_cache := self.__cache.pop(table_id, None)) is not None and self.max_records is not None:
+                for serialized_key in table_cache.keys():
+                    self.__lru.pop((table_id, serialized_key), None)
 
     def _drop_db_do_not_call_directly(self) -> None:
         """DO NOT CALL DIRECTLY, call drop_db() instead."""
-        # Create a new cache, the objects in the old cache will no longer be accessible.
+        # Clear the cache, the objects in the old cache will no longer be accessible.
         # This relies on the preconditions check above to prevent unintended use
-        __cache = {}
+        self._clear()
 
     def close_connection(self) -> None:
         """Close database connection to releasing resource locks."""
         # TODO: Review if this should be in __exit__ method
         # Do nothing here, as this is an in-memory cache which does not require a connection
+
+    def _clear(self) -> None:
+        """Remove all records from cache in all datasets and tenants."""
+        with _cache_lock:
+            self.__cache.clear()
+            self.__lru.clear()
+
+    def _touch(self, table_id: _TableId, serialized_key: tuple) -> None:
+        """Mark the record as most recently used, do nothing if max_records is not set (call under _cache_lock)."""
+        if self.max_records is not None:
+            lru_id = (table_id, serialized_key)
+            self.__lru[lru_id] = None
+            self.__lru.move_to_end(lru_id)
+
+    def _evict(self) -> None:
+        """Evict the least recently used records until there are no more than max_records (call under _cache_lock)."""
+        if self.max_records is not None:
+            while len(self.__lru) > self.max_records:
+                (table_id, serialized_key), _ = self.__lru.popitem(last=False)
+                table_cache = self.__cache[table_id]
+                del table_cache[serialized_key]
+                if not table_cache:
+                    # Remove empty tables so is_empty returns True when all records are evicted
+                    del self.__cache[table_id]
+
+    def _select_by_query(
+        self,
+        query: QueryMixin,
+        *,
+        dataset: str,
+        tenant: str,
+        restrict_to: type | None,
+    ) -> list[RecordMixin]:
+        """Return unsorted records that match the query and restrict_to type."""
+
+        # Check that the query has been frozen
+        query.check_frozen()
+
+        # Check dataset
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
+
+        # Get table from key type
+        query_target_type = query.get_target_type()
+        key_type = query_target_type.get_key_type()
+        with _cache_lock:
+            table_records = tuple(self.__cache.get((dataset, tenant, key_type), {}).values())
+
+        # Validate restrict_to or use the query target type if not specified
+        if restrict_to is None:
+            # Default to the query target type
+            restrict_to = query_target_type
+        elif not issubclass(restrict_to, query_target_type):
+            # Ensure restrict_to is a subclass of the query target type
+            raise RuntimeError(
+                f"In {typename(type(self))}.load_by_query, restrict_to={typename(restrict_to)} is not a subclass\n"
+                f"of the query target type {typename(query_target_type)} for {typename(type(query))}."
+            )
+        records = self._apply_restrict_to(table_records, key_type=key_type, restrict_to=restrict_to)
+
+        # Serialize the query and each record using the same serializer, then compare
+        query_dict = _QUERY_SERIALIZER.serialize(query)
+        return [x for x in records if self._match_query_dict(_QUERY_SERIALIZER.serialize(x), query_dict)]
+
+    @classmethod
+    def _match_query_dict(cls, record_dict: dict[str, Any], query_dict: dict[str, Any]) -> bool:
+        """Return True if the serialized record matches each condition in the serialized query."""
+        for field_name, condition in query_dict.items():
+            value = record_dict.get(field_name, None) if record_dict is not None else None
+            if isinstance(condition, dict) and condition and all(x.startswith("op_") for x in condition.keys()):
+                # Operators, all must match
+                if not all(cls._match_op(op, op_value, value) for op, op_value in condition.items()):
+                    return False
+            elif isinstance(condition, dict):
+                # Embedded data or key, match recursively
+                if not isinstance(value, dict) or not cls._match_query_dict(value, condition):
+                    return False
+            elif value != condition:
+                # Simple equality
+                return False
+        return True
+
+    @classmethod
+    def _match_op(cls, op: str, op_value: Any, value: Any) -> bool:
+        """Return True if the value satisfies the operator condition, None value only satisfies op_nin and op_exists."""
+        if op == "op_exists":
+            return (value is not None) == op_value
+        elif op == "op_in":
+            return value in op_value
+        elif op == "op_nin":
+            return value not in op_value
+        elif value is None:
+            return False
+        elif op == "op_gt":
+            return value > op_value
+        elif op == "op_gte":
+            return value >= op_value
+        elif op == "op_lt":
+            return value < op_value
+        elif op == "op_lte":
+            return value <= op_value
+        else:
+            raise RuntimeError(f"Unsupported operator: {op}")
+
+    @classmethod
+    def _apply_restrict_to(
+        cls,
+        records: Iterable[RecordMixin],
+        *,
+        key_type: type,
+        restrict_to: type | None,
+    ) -> list[RecordMixin]:
+        """Return records that are instances of restrict_to type, or all records if not specified."""
+        if restrict_to is None:
+            # Do nothing if restrict_to is not specified
+            return list(records)
+        elif is_record_type(restrict_to):
+            return [x for x in records if isinstance(x, restrict_to)]
+        elif is_key_type(restrict_to):
+            # Check that it matches the key type obtained from the query
+            if restrict_to != key_type:
+                raise RuntimeError(
+                    f"Parameter restrict_to={typename(restrict_to)} does not match " f"key_type={typename(key_type)}."
+                )
+            return list(records)
+        else:
+            raise RuntimeError(f"Parameter restrict_to={typename(restrict_to)} is not a key or record.")
+
+    @classmethod
+    def _apply_sort(cls, records: Sequence[RecordMixin], *, sort_order: SortOrder) -> tuple[RecordMixin, ...]:
+        """Sort records by serialized key in the specified sort order."""
+        if sort_order in (SortOrder.UNORDERED, SortOrder.INPUT):
+            # Records are returned in the order of input keys or insertion
+            return tuple(records)
+        elif sort_order == SortOrder.ASC:
+            return tuple(sorted(records, key=lambda x: _SORT_KEY_SERIALIZER.serialize(x.get_key())))
+        elif sort_order == SortOrder.DESC:
+            return tuple(sorted(records, key=lambda x: _SORT_KEY_SERIALIZER.serialize(x.get_key()), reverse=True))
+        else:
+            raise ErrorUtil.enum_value_error(sort_order, SortOrder)
+
+    @classmethod
+    def _apply_limit_and_skip(
+        cls,
+        records: tuple[RecordMixin, ...],
+        *,
+        limit: int | None = None,
+        skip: int | None = None,
+    ) -> tuple[RecordMixin, ...]:
+        """Apply limit and skip to the records tuple."""
+        if skip is not None:
+            if skip < 0:
+                raise RuntimeError(f"Parameter skip={skip} is negative.")
+            records = records[skip:]
+        if limit is not None:
+            if limit < 0:
+                raise RuntimeError(f"Parameter limit={limit} is negative.")
+            records = records[:limit]
+        return records
@@ -13,14 +13,20 @@
 # limitations under the License.
 
 import re
+import threading
 from dataclasses import dataclass
 from typing import Any
 from typing import Iterable
+from typing import Iterator
 from typing import Sequence
 from typing import cast
 import pymongo
+from pymongo import InsertOne
 from pymongo import MongoClient
+from pymongo import ReplaceOne
+from pymongo.client_session import ClientSession
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError
 from pymongo.synchronous.collection import Collection
 from pymongo.synchronous.cursor import Cursor
 from cl.runtime.db.db import Db
@@ -59,6 +65,9 @@ _INVALID_DB_NAME_SYMBOLS_MSG = r'<space>/\."$*<>:|?'
 _INVALID_DB_NAME_REGEX = re.compile(f"[{_INVALID_DB_NAME_SYMBOLS}]")
 """Precompiled regex to check for invalid MongoDB database name symbols."""
 
+_DUPLICATE_KEY_ERROR_CODE = 11000
+"""MongoDB error code for a unique index violation, reported when INSERT policy encounters an existing record."""
+
 _RECORD_SERIALIZER = DataSerializers.FOR_MONGO
 """Used for record serialization."""
 
@@ -77,6 +86,12 @@ class BasicMongoDb(Db):
     client_uri: str | None = None
     """MongoDB client URI, defaults to mongodb://localhost:27017/"""
 
+    bulk_write_batch_size: int = 1000
+    """Maximum number of records sent to MongoDB in a single bulk_write call."""
+
+    bulk_write_ordered: bool = True
+    """If True, stop at the first failed record, otherwise attempt to write all records before reporting failures."""
+
     _mongo_client: MongoClient | None = None
     """MongoDB client instance, initialized once and stored."""
 
@@ -89,6 +104,15 @@ class BasicMongoDb(Db):
     _mongo_collection_dict: dict[type, Collection] | None = None
     """MongoDB collection dict, collections are initialized once and stored."""
 
+    _mongo_session_local: threading.local | None = None
+    """
+    Holds the MongoDB session for the transaction started by begin_transaction in each thread, as the same
+    instance is shared by the data sources in different threads (e.g., the log writer thread).
+    """
+
+    _supports_transactions: bool | None = None
+    """True if the server is a replica set or sharded cluster, determined on first begin_transaction call."""
+
     _query_types_with_index: set[type] | None = None
     """Set of query types for which an index has already been added."""
 
@@ -117,6 +141,9 @@ class BasicMongoDb(Db):
         # Perform variable substitution
         self.client_uri = self.client_uri.format(client_uri_dict)
 
+        # Each thread has its own transaction session
+        self._mongo_session_local = threading.local()
+
     def is_empty(self) -> bool:
         """Return true if the database contains no collections."""
         mongo_db = self._get_mongo_db()
@@ -142,16 +169,18 @@ class BasicMongoDb(Db):
         # Get MongoDB collection for the key type
         collection = self._get_mongo_collection(key_type=key_type)
 
-        # Query for all records in one call using $in operator
-        serialized_records = collection.find(self._get_mongo_keys_filter(keys, dataset=dataset, tenant=tenant))
+        # Query for all records in one call using $in operator, read only the fields of project_to if specified
+        serialized_records = collection.find(
+            self._get_mongo_keys_filter(keys, dataset=dataset, tenant=tenant),
+            self._get_mongo_projection(key_type=key_type, project_to=project_to),
+        )
 
         # Apply sort to the iterable
         serialized_records = self._apply_sort(serialized_records, sort_field="_key", sort_order=sort_order)
 
         # Prune the fields used by Db that are not part of the serialized record data and deserialize
         result = tuple(
-            _RECORD_SERIALIZER.deserialize(self._with_pruned_fields(x, expected_dataset=dataset))
-            for x in serialized_records
+            self._deserialize_record(x, expected_dataset=dataset, project_to=project_to) for x in serialized_records
         )
         return cast(tuple[TRecord, ...], result)
 
@@ -168,6 +197,34 @@ class BasicMongoDb(Db):
         limit: int | None = None,
         skip: int | None = None,
     ) -> tuple[TRecord, ...]:
+        return tuple(
+            self.iter_all(
+                key_type,
+                dataset=dataset,
+                tenant=tenant,
+                cast_to=cast_to,
+                restrict_to=restrict_to,
+                project_to=project_to,
+                sort_order=sort_order,
+                limit=limit,
+                skip=skip,
+            )
+        )
+
+    def iter_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
 
         # Check params
         assert TypeCheck.guard_key_type(key_type)
@@ -190,8 +247,13 @@ class BasicMongoDb(Db):
         # serialized_primary_key = _KEY_SERIALIZER.serialize(key)
         # serialized_record = collection.find_one({"_key": serialized_primary_key})
 
-        # Get iterable from the query, execution is deferred
-        serialized_records = collection.find(query_dict)
+        # Get iterable from the query, execution is deferred and records are fetched in batches,
+        # read only the fields of project_to if specified
+        serialized_records = collection.find(
+            query_dict,
+            self._get_mongo_projection(key_type=key_type, project_to=project_to),
+            batch_size=self._get_fetch_batch_size(batch_size),
+        )
 
         # Apply sort to the iterable
         serialized_records = self._apply_sort(serialized_records, sort_field="_key", sort_order=sort_order)
@@ -200,11 +262,8 @@ class BasicMongoDb(Db):
         serialized_records = self._apply_limit_and_skip(serialized_records, limit=limit, skip=skip)
 
         # Prune the fields used by Db that are not part of the serialized record data and deserialize
-        result = tuple(
-            _RECORD_SERIALIZER.deserialize(self._with_pruned_fields(x, expected_dataset=dataset))
-            for x in serialized_records
-        )
-        return cast(tuple[TRecord, ...], result)
+        for serialized_record in serialized_records:
+            yield self._deserialize_record(serialized_record, expected_dataset=dataset, project_to=project_to)
 
     def load_by_query(
         self,
@@ -219,6 +278,34 @@ class BasicMongoDb(Db):
         limit: int | None = None,
         skip: int | None = None,
     ) -> tuple[TRecord, ...]:
+        return tuple(
+            self.iter_by_query(
+                query,
+                dataset=dataset,
+                tenant=tenant,
+                cast_to=cast_to,
+                restrict_to=restrict_to,
+                project_to=project_to,
+                sort_order=sort_order,
+                limit=limit,
+                skip=skip,
+            )
+        )
+
+    def iter_by_query(
+        self,
+        query: QueryMixin,
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
 
         # Check that the query has been frozen
         query.check_frozen()
@@ -264,8 +351,13 @@ class BasicMongoDb(Db):
         # Filter by restrict_to if specified
         self._apply_restrict_to(query_dict=query_dict, key_type=key_type, restrict_to=restrict_to)
 
-        # Get iterable from the query, execution is deferred
-        serialized_records = collection.find(query_dict)
+        # Get iterable from the query, execution is deferred and records are fetched in batches,
+        # read only the fields of project_to if specified
+        serialized_records = collection.find(
+            query_dict,
+            self._get_mongo_projection(key_type=key_type, project_to=project_to),
+            batch_size=self._get_fetch_batch_size(batch_size),
+        )
 
         # Apply sort to the iterable
         serialized_records = self._apply_sort(serialized_records, sort_field="_key", sort_order=sort_order)
@@ -278,11 +370,38 @@ class BasicMongoDb(Db):
             cast_to = restrict_to
 
         # Prune the fields used by Db that are not part of the serialized record data and deserialize
-        result = tuple(
-            _RECORD_SERIALIZER.deserialize(self._with_pruned_fields(x, expected_dataset=dataset))
-            for x in serialized_records
-        )
-        return cast(tuple[TRecord, ...], result)
+        for serialized_record in serialized_records:
+            yield self._deserialize_record(serialized_record, expected_dataset=dataset, project_to=project_to)
+
+    def count_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        restrict_to: type | None = None,
+    ) -> int:
+
+        # Check params
+        assert TypeCheck.guard_key_type(key_type)
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
+
+        # Get MongoDB collection for the key type
+        collection = self._get_mongo_collection(key_type=key_type)
+
+        # Create a query dictionary
+        query_dict = {
+            "_dataset": dataset,
+            "_tenant": tenant,
+        }
+
+        # Filter by restrict_to if specified
+        self._apply_restrict_to(query_dict=query_dict, key_type=key_type, restrict_to=restrict_to)
+
+        # Use count_documents to get the count
+        count = collection.count_documents(query_dict)
+        return count
 
     def count_by_query(
         self,
@@ -360,15 +479,17 @@ class BasicMongoDb(Db):
         # Get MongoDB collection for the key type
         collection = self._get_mongo_collection(key_type=key_type)
 
-        # TODO: Provide a more performant implementation
+        # Check batch size
+        if self.bulk_write_batch_size <= 0:
+            raise RuntimeError(f"Field bulk_write_batch_size={self.bulk_write_batch_size} must be positive.")
+
+        # Serialized keys are retained to report failures for individual records
+        serialized_keys = []
+        write_operations = []
         for record in records:
             # Serialize key
             serialized_key = _KEY_SERIALIZER.serialize(record.get_key())
-            key_dict = {
-                "_dataset": dataset,
-                "_key": serialized_key,
-                "_tenant": tenant,
-            }
+            serialized_keys.append(serialized_key)
 
             # Serialize record
             serialized_record = _RECORD_SERIALIZER.serialize(record)
@@ -377,11 +498,79 @@ class BasicMongoDb(Db):
             serialized_record["_tenant"] = tenant
 
             if save_policy == SavePolicy.INSERT:
-                collection.insert_one(serialized_record)
+                write_operations.append(InsertOne(serialized_record))
             elif save_policy == SavePolicy.REPLACE:
-                collection.replace_one(key_dict, serialized_record, upsert=True)
+                key_dict = {
+                    "_dataset": dataset,
+                    "_key": serialized_key,
+                    "_tenant": tenant,
+                }
+                write_operations.append(ReplaceOne(key_dict, serialized_record, upsert=True))
             else:
-                ErrorUtil.enum_value_error(save_policy, SavePolicy)
+                raise ErrorUtil.enum_value_error(save_policy, SavePolicy)
+
+        # Send write operations in batches, collecting per-record errors
+        write_errors = []
+        batch_size = self.bulk_write_batch_size
+        for batch_start in range(0, len(write_operations), batch_size):
+            batch = write_operations[batch_start : batch_start + batch_size]
+            try:
+                self._bulk_write(collection, batch, ordered=self.bulk_write_ordered)
+            except BulkWriteError as e:
+                # Convert index within the batch to index within the records sequence
+                write_errors.extend(
+                    (batch_start + write_error["index"], write_error) for write_error in e.details["writeErrors"]
+                )
+                if self.bulk_write_ordered:
+                    # Records after the first failure are not written in ordered mode, do not send further batches
+                    break
+
+        # Report all failed records in a single error message
+        if write_errors:
+            self._raise_write_errors(
+                key_type=key_type,
+                serialized_keys=serialized_keys,
+                write_errors=write_errors,
+            )
+
+    def replace_one_if(
+        self,
+        key_type: type[KeyMixin],
+        record: RecordMixin,
+        *,
+        query: QueryMixin,
+        dataset: str,
+        tenant: str,
+    ) -> bool:
+
+        # Check params
+        assert TypeCheck.guard_key_type(key_type)
+        query.check_frozen()
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
+
+        # Get MongoDB collection for the key type
+        collection = self._get_mongo_collection(key_type=key_type)
+
+        # Serialize record
+        serialized_key = _KEY_SERIALIZER.serialize(record.get_key())
+        serialized_record = _RECORD_SERIALIZER.serialize(record)
+        serialized_record["_dataset"] = dataset
+        serialized_record["_key"] = serialized_key
+        serialized_record["_tenant"] = tenant
+
+        # Filter by key and the query conditions, replacement of a single document is atomic
+        query_dict = {
+            "_dataset": dataset,
+            "_key": serialized_key,
+            "_tenant": tenant,
+        }
+        query_dict.update(BootstrapSerializers.FOR_MONGO_QUERY.serialize(query))
+        query_dict = self._convert_op_fields_to_mongo_syntax(query_dict)
+
+        # Do not insert if not found, the condition is not met when the stored record does not exist
+        result = collection.replace_one(query_dict, serialized_record, upsert=False, session=self._get_mongo_session())
+        return result.matched_count == 1
 
     def delete_many(
         self,
@@ -403,7 +592,7 @@ class BasicMongoDb(Db):
 
         # Create filter and delete
         keys_filter = self._get_mongo_keys_filter(keys, dataset=dataset, tenant=tenant)
-        collection.delete_many(keys_filter)
+        collection.delete_many(keys_filter, session=self._get_mongo_session())
 
     def delete_by_query(
         self,
@@ -459,7 +648,7 @@ class BasicMongoDb(Db):
         self._apply_restrict_to(query_dict=query_dict, key_type=key_type, restrict_to=restrict_to)
 
         # Delete from DB
-        collection.delete_many(query_dict)
+        collection.delete_many(query_dict, session=self._get_mongo_session())
 
     def _drop_db_do_not_call_directly(self) -> None:
         """DO NOT CALL DIRECTLY, call drop_db() instead."""
@@ -469,10 +658,79 @@ class BasicMongoDb(Db):
         db_name = self._get_db_name()
         client.drop_database(db_name)
 
+    def begin_transaction(self) -> None:
+        if self._get_mongo_session() is not None:
+            raise RuntimeError(
+                f"Transaction for {typename(type(self))} with db_id={self.db_id} is already in progress."
+            )
+
+        # Transactions are only supported by replica sets and sharded clusters, writes are applied
+        # immediately for a standalone server
+        if self._supports_transactions is None:
+            self._supports_transactions = self._check_supports_transactions()
+        if self._supports_transactions:
+            session = self._get_mongo_client().start_session()
+            session.start_transaction()
+            self._mongo_session_local.session = session
+
+    def commit_transaction(self) -> None:
+        if (session := self._get_mongo_session()) is not None:
+            self._mongo_session_local.session = None
+            try:
+                session.commit_transaction()
+            finally:
+                session.end_session()
+
+    def rollback_transaction(self) -> None:
+        if (session := self._get_mongo_session()) is not None:
+            self._mongo_session_local.session = None
+            try:
+                session.abort_transaction()
+            finally:
+                session.end_session()
+
     def close_connection(self) -> None:
         # TODO: Review the use of this method and when it is invoked
         self._get_mongo_client().close()
 
+    def _bulk_write(
+        self,
+        collection: Collection,
+        write_operations: Sequence[InsertOne | ReplaceOne],
+        *,
+        ordered: bool,
+    ) -> None:
+        """Send write operations to DB in a single round trip, BasicMongoMockDb overrides this for mongomock."""
+        collection.bulk_write(write_operations, ordered=ordered, session=self._get_mongo_session())
+
+    def _raise_write_errors(
+        self,
+        *,
+        key_type: type[KeyMixin],
+        serialized_keys: Sequence[str],
+        write_errors: Sequence[tuple[int, dict[str, Any]]],
+    ) -> None:
+        """Raise an error listing the keys of records that failed to save in bulk_write."""
+        duplicate_keys = [serialized_keys[x] for x, e in write_errors if e.get("code") == _DUPLICATE_KEY_ERROR_CODE]
+        other_errors = [
+            f"{serialized_keys[x]}: {e.get('errmsg')}"
+            for x, e in write_errors
+            if e.get("code") != _DUPLICATE_KEY_ERROR_CODE
+        ]
+        error_msgs = []
+        if duplicate_keys:
+            duplicate_keys_str = "\n".join(f"  - {x}" for x in duplicate_keys)
+            error_msgs.append(
+                f"Records with the following keys already exist while INSERT policy is selected:\n{duplicate_keys_str}"
+            )
+        if other_errors:
+            other_errors_str = "\n".join(f"  - {x}" for x in other_errors)
+            error_msgs.append(f"Records with the following keys failed to save:\n{other_errors_str}")
+        if self.bulk_write_ordered:
+            error_msgs.append("Records after the first failure were not saved because bulk_write_ordered=True.")
+        error_msgs_str = "\n".join(error_msgs)
+        raise RuntimeError(f"In {typename(type(self))}.save_many for key type {typename(key_type)}:\n{error_msgs_str}")
+
     def _convert_op_fields_to_mongo_syntax(self, query_dict: dict[str, Any]) -> dict[str, Any]:
         """Convert op_* fields to MongoDB $* syntax recursively."""
         if not isinstance(query_dict, dict):
@@ -525,6 +783,15 @@ class BasicMongoDb(Db):
             self._mongo_collection_dict[key_type] = collection
         return collection
 
+    def _get_mongo_session(self) -> ClientSession | None:
+        """Return the session for the transaction in progress in the current thread or None if there is none."""
+        return getattr(self._mongo_session_local, "session", None)
+
+    def _check_supports_transactions(self) -> bool:
+        """Return True if the server supports multi-document transactions (replica set or sharded cluster)."""
+        client = self._get_mongo_client()
+        return client.is_mongos or client.primary is not None
+
     def _get_mongo_client_type(self) -> type:
         """Get the type of MongoDB client object, BasicMongoMockDb overrides this to return the mongomock version."""
         return MongoClient
@@ -654,6 +921,16 @@ class BasicMongoDb(Db):
         else:
             raise ValueError(f"Unsupported SortOrder: {order}")
 
+    @classmethod
+    def _get_fetch_batch_size(cls, batch_size: int | None) -> int:
+        """Return batch_size if specified after checking it is positive, otherwise the default from DbSettings."""
+        if batch_size is None:
+            return DbSettings.instance().db_fetch_batch_size
+        elif batch_size <= 0:
+            raise RuntimeError(f"Parameter batch_size={batch_size} must be positive.")
+        else:
+            return batch_size
+
     def _with_pruned_fields(
         self,
         record_dict: dict[str, Any],
@@ -669,6 +946,33 @@ class BasicMongoDb(Db):
 
         return record_dict
 
+    def _deserialize_record(
+        self,
+        record_dict: dict[str, Any],
+        *,
+        expected_dataset: str,
+        project_to: type[TRecord] | None,
+    ) -> RecordMixin:
+        """Deserialize the stored record, or an instance of project_to from the fields read using projection."""
+        record_dict = self._with_pruned_fields(record_dict, expected_dataset=expected_dataset)
+        if project_to is not None:
+            # Only the fields of project_to were read, deserialize into project_to
+            record_dict["_type"] = typename(project_to)
+        return _RECORD_SERIALIZER.deserialize(record_dict)
+
+    @classmethod
+    def _get_mongo_projection(
+        cls,
+        *,
+        key_type: type[KeyMixin],
+        project_to: type[TRecord] | None,
+    ) -> dict[str, bool] | None:
+        """Get projection that reads only the fields of project_to and the fields used by Db, or None for all fields."""
+        if project_to is None:
+            return None
+        field_names = cls._get_projected_field_names(key_type=key_type, project_to=project_to)
+        return {"_dataset": True, "_key": True, **{x: True for x in field_names}}
+
     def _get_mongo_keys_filter(self, keys: Sequence[KeyMixin], *, dataset: str, tenant: str) -> dict[str, Any]:
         """Get filter for loading records that match one of the specified keys."""
         serialized_keys = tuple(_KEY_SERIALIZER.serialize(key) for key in keys)
@@ -13,8 +13,13 @@
 # limitations under the License.
 
 from dataclasses import dataclass
+from typing import Sequence
 from mongomock import MongoClient as MongoClientMock
+from pymongo import InsertOne
+from pymongo import ReplaceOne
+from pymongo.synchronous.collection import Collection
 from cl.runtime.db.mongo.basic_mongo_db import BasicMongoDb
+from cl.runtime.records.typename import typenameof
 
 
 @dataclass(slots=True, kw_only=True)
@@ -24,3 +29,34 @@ class BasicMongoMockDb(BasicMongoDb):
     def _get_mongo_client_type(self) -> type:
         """Get the type of MongoDB client object, this method overrides base to return the mongomock class."""
         return MongoClientMock
+
+    def _check_supports_transactions(self) -> bool:
+        """Return False because mongomock does not support transactions, this method overrides base."""
+        return False
+
+    def _bulk_write(
+        self,
+        collection: Collection,
+        write_operations: Sequence[InsertOne | ReplaceOne],
+        *,
+        ordered: bool,
+    ) -> None:
+        """
+        Send write operations using the mongomock bulk operation builder, this method overrides base
+        because recent pymongo versions pass arguments to bulk_write that mongomock does not accept.
+        """
+        if ordered:
+            bulk = collection.initialize_ordered_bulk_op()
+        else:
+            bulk = collection.initialize_unordered_bulk_op()
+        for write_operation in write_operations:
+            if isinstance(write_operation, InsertOne):
+                bulk.insert(write_operation._doc)  # noqa
+            elif isinstance(write_operation, ReplaceOne):
+                if write_operation._upsert:  # noqa
+                    bulk.find(write_operation._filter).upsert().replace_one(write_operation._doc)  # noqa
+                else:
+                    bulk.find(write_operation._filter).replace_one(write_operation._doc)  # noqa
+            else:
+                raise RuntimeError(f"Write operation {typenameof(write_operation)} is not supported by mongomock.")
+        bulk.execute()
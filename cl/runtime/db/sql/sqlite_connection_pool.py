@@ -0,0 +1,201 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pathlib
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class SqliteConnectionPool:
+    """
+    Pool of SQLite connections to a single database file with one writer connection guarded
+    by a lock and up to reader_count read-only connections used concurrently under WAL.
+
+    Notes:
+        - Reads by the thread that holds an open transaction use the writer connection to see its own changes
+        - If reader_count is zero, reads use the writer connection under the lock
+    """
+
+    __slots__ = (
+        "_db_file_path",
+        "_reader_count",
+        "_writer",
+        "_writer_lock",
+        "_transaction_thread_id",
+        "_readers",
+        "_idle_readers",
+        "_reader_semaphore",
+        "_reader_lock",
+        "_closed",
+    )
+
+    def __init__(self, *, db_file_path: str, reader_count: int):
+        """Open the writer connection, read-only connections are opened on demand."""
+        if reader_count < 0:
+            raise RuntimeError(f"SQLite reader connection count {reader_count} must not be negative.")
+
+        self._db_file_path = db_file_path
+        self._reader_count = reader_count
+        self._writer_lock = threading.RLock()
+        self._transaction_thread_id: int | None = None
+        self._readers: list[sqlite3.Connection] = []
+        self._idle_readers: list[sqlite3.Connection] = []
+        self._reader_semaphore = threading.BoundedSemaphore(max(reader_count, 1))
+        self._reader_lock = threading.Lock()
+        self._closed = False
+
+        # Ensure the parent directory exists
+        os.makedirs(os.path.dirname(db_file_path), exist_ok=True)
+
+        # Open the writer connection first, it creates the file if it does not exist (but not the directory)
+        # and switches the database to WAL mode which the read-only connections rely on
+        self._writer = sqlite3.connect(db_file_path, check_same_thread=False)
+
+        # Enable Write-Ahead Logging (WAL) mode.
+        # This permits concurrent readers while a write is in progress.
+        self._writer.execute("PRAGMA journal_mode=WAL")
+
+        # Set the synchronous mode to 'NORMAL' to balance performance and durability.
+        # It's faster than FULL, and still safe for most use cases.
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+
+        # Set the row factory so that rows fetched from queries will be returned
+        # as sqlite3.Row objects, which act like dictionaries (column access by name).
+        self._writer.row_factory = sqlite3.Row
+
+    def in_transaction(self) -> bool:
+        """Return True if the current thread has begun a transaction that is not yet committed or rolled back."""
+        return self._transaction_thread_id == threading.get_ident()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Context manager for exclusive use of the writer connection by the current thread."""
+        with self._writer_lock:
+            self._check_not_closed()
+            yield self._writer
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Context manager for the use of a read-only connection by the current thread."""
+        if self._reader_count == 0 or self.in_transaction():
+            # Use the writer connection
+            with self.writer() as conn:
+                yield conn
+        else:
+            with self._reader_semaphore:
+                conn = self._acquire_reader()
+                try:
+                    yield conn
+                finally:
+                    self._release_reader(conn)
+
+    def begin_transaction(self) -> None:
+        """Acquire the writer lock and begin a transaction, the lock is held until commit or rollback."""
+        self._writer_lock.acquire()
+        try:
+            self._check_not_closed()
+            if self._transaction_thread_id is not None:
+                raise RuntimeError(f"Transaction for SQLite database {self._db_file_path} is already in progress.")
+
+            # Roll back a transaction left open on the writer connection if any rather than commit changes
+            # that were never committed explicitly, then begin. Take the write lock immediately so the busy
+            # timeout applies when other processes write to the same database, otherwise upgrading the read
+            # snapshot of a deferred transaction to a write fails without waiting
+            if self._writer.in_transaction:
+                self._writer.rollback()
+            self._writer.execute("BEGIN IMMEDIATE")
+            self._transaction_thread_id = threading.get_ident()
+        except Exception as e:
+            self._writer_lock.release()
+            raise e
+
+    def commit_transaction(self) -> None:
+        """Commit the transaction started by begin_transaction and release the writer lock."""
+        self._end_transaction(commit=True)
+
+    def rollback_transaction(self) -> None:
+        """Roll back the transaction started by begin_transaction and release the writer lock."""
+        self._end_transaction(commit=False)
+
+    def close(self) -> None:
+        """Close the writer and idle reader connections, readers in use are closed when released."""
+        with self._writer_lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._transaction_thread_id is not None:
+                # Release the lock held by the transaction, uncommitted changes are rolled back on close
+                self._transaction_thread_id = None
+                self._writer_lock.release()
+            self._writer.close()
+        with self._reader_lock:
+            for conn in self._idle_readers:
+                conn.close()
+                self._readers.remove(conn)
+            self._idle_readers.clear()
+
+    def _end_transaction(self, *, commit: bool) -> None:
+        """Commit or roll back the transaction and release the writer lock."""
+        if not self.in_transaction():
+            raise RuntimeError(
+                f"No transaction for SQLite database {self._db_file_path} is in progress in this thread."
+            )
+        try:
+            if commit:
+                try:
+                    self._writer.commit()
+                except Exception as e:
+                    # Roll back so the failed changes are not committed by the next transaction
+                    try:
+                        self._writer.rollback()
+                    except Exception as rollback_error:
+                        raise rollback_error from e
+                    raise e
+            else:
+                self._writer.rollback()
+        finally:
+            self._transaction_thread_id = None
+            self._writer_lock.release()
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Return an idle read-only connection or open a new one."""
+        with self._reader_lock:
+            self._check_not_closed()
+            if self._idle_readers:
+                return self._idle_readers.pop()
+
+        # Open outside the lock, the semaphore limits the number of connections
+        db_uri = f"{pathlib.Path(self._db_file_path).absolute().as_uri()}?mode=ro"
+        conn = sqlite3.connect(db_uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        with self._reader_lock:
+            self._readers.append(conn)
+        return conn
+
+    def _release_reader(self, conn: sqlite3.Connection) -> None:
+        """Return the connection to the pool or close it if the pool has been closed."""
+        with self._reader_lock:
+            if self._closed:
+                conn.close()
+                self._readers.remove(conn)
+            else:
+                self._idle_readers.append(conn)
+
+    def _check_not_closed(self) -> None:
+        """Error if the pool has been closed."""
+        if self._closed:
+            raise RuntimeError(f"Connection pool for SQLite database {self._db_file_path} has been closed.")
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import os
 import re
 import sqlite3
+import threading
 from dataclasses import dataclass
+from typing import Iterator
 from typing import Sequence
 from typing import cast
 from memoization import cached
@@ -23,6 +26,7 @@ from cl.runtime.db.db import Db
 from cl.runtime.db.query_mixin import QueryMixin
 from cl.runtime.db.save_policy import SavePolicy
 from cl.runtime.db.sort_order import SortOrder
+from cl.runtime.db.sql.sqlite_connection_pool import SqliteConnectionPool
 from cl.runtime.exceptions.error_util import ErrorUtil
 from cl.runtime.file.file_util import FileUtil
 from cl.runtime.records.cast_util import CastUtil
@@ -44,8 +48,23 @@ from cl.runtime.settings.db_settings import DbSettings
 _KEY_SERIALIZER = KeySerializers.DELIMITED
 _DATA_SERIALIZER = DataSerializers.FOR_SQLITE
 
-_connection_dict: dict[str, sqlite3.Connection] = {}
-"""Dict of Connection instances with db_id key stored outside the class to avoid serialization."""
+_pool_dict: dict[str, SqliteConnectionPool] = {}
+"""Dict of connection pools with db_id key stored outside the class to avoid serialization."""
+
+_pool_dict_lock = threading.Lock()
+"""Lock for creating connection pools."""
+
+_table_dict: dict[str, dict[str, set[str]]] = {}
+"""Dict of table name to column names for the tables known to exist, with db_id key, cleared on disconnect."""
+
+_index_dict: dict[str, set[tuple[str, tuple[str, ...]]]] = {}
+"""Dict of (table_name, index_columns) for the indexes already created, with db_id key, cleared on disconnect."""
+
+_pending_table_dict: dict[str, dict[str, set[str]]] = {}
+"""Same as _table_dict for the tables created or altered inside the transaction in progress, merged on commit."""
+
+_pending_index_dict: dict[str, set[tuple[str, tuple[str, ...]]]] = {}
+"""Same as _index_dict for the indexes created inside the transaction in progress, merged on commit."""
 
 # Regex for a safe SQLite table name (letters, digits, underscores, start with letter or underscore)
 _TABLE_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
@@ -59,8 +78,8 @@ class SqliteDb(Db):
 
     def is_empty(self) -> bool:
         """Return true if the database contains no tables."""
-        connection = self._get_connection()
-        table_names = [row[1] for row in connection.execute("PRAGMA table_list;")]
+        with self._get_pool().reader() as conn:
+            table_names = [row[1] for row in conn.execute("PRAGMA table_list;")]
         table_count = len([x for x in table_names if not x.startswith("sqlite_")])
         return table_count == 0
 
@@ -93,10 +112,12 @@ class SqliteDb(Db):
         serialized_keys = [_KEY_SERIALIZER.serialize(key) for key in keys]
 
         # Build SQL query to select records by keys
+        columns = self._get_select_columns(key_type=key_type, table_name=table_name, project_to=project_to)
         placeholders = ",".join("?" for _ in serialized_keys)
         values = [tenant, *serialized_keys]
         select_sql = (
-            f'SELECT * FROM {self._quote_identifier(table_name)} WHERE "_tenant" = ? AND "_key" IN ({placeholders})'
+            f"SELECT {columns} FROM {self._quote_identifier(table_name)} "
+            f'WHERE "_tenant" = ? AND "_key" IN ({placeholders})'
         )
 
         if sort_order is not None:
@@ -104,14 +125,11 @@ class SqliteDb(Db):
             select_sql = self._add_order(select_sql, sort_field="_key", sort_order=sort_order)
 
         # Execute SQL query
-        conn = self._get_connection()
-        cursor = conn.execute(select_sql, values)
+        with self._get_pool().reader() as conn:
+            rows = conn.execute(select_sql, values).fetchall()
 
         # Deserialize records and return
-        return [
-            _DATA_SERIALIZER.deserialize({k: row[k] for k in row.keys() if row[k] is not None})
-            for row in cursor.fetchall()
-        ]
+        return [self._deserialize_row(row, project_to=project_to) for row in rows]
 
     def load_all(
         self,
@@ -126,24 +144,54 @@ class SqliteDb(Db):
         limit: int | None = None,
         skip: int | None = None,
     ) -> tuple[TRecord, ...]:
+        return tuple(
+            self.iter_all(
+                key_type,
+                dataset=dataset,
+                tenant=tenant,
+                cast_to=cast_to,
+                restrict_to=restrict_to,
+                project_to=project_to,
+                sort_order=sort_order,
+                limit=limit,
+                skip=skip,
+            )
+        )
+
+    def iter_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
 
         # Check params
         assert TypeCheck.guard_key_type(key_type)
         self._check_dataset(dataset)
         self._check_tenant(tenant)
 
-        if project_to is not None:
-            raise RuntimeError(f"{typename(type(self))} does not currently support 'project_to' option.")
-
         # Get table name from key type and check it has an acceptable format
         table_name = self._get_validated_table_name(key_type=key_type)
 
         if not self._table_exists(table_name=table_name):
-            return tuple()
+            return
 
-        select_sql, values = f'SELECT * FROM {self._quote_identifier(table_name)} WHERE "_tenant" = ?', [tenant]
+        # Select only the columns for the fields of project_to if specified
+        columns = self._get_select_columns(key_type=key_type, table_name=table_name, project_to=project_to)
+        select_sql, values = f'SELECT {columns} FROM {self._quote_identifier(table_name)} WHERE "_tenant" = ?', [tenant]
 
         if restrict_to is not None:
+            # Add index on type if not yet added
+            self._add_index(table_name=table_name, query_dict={})
+
             # Add filter condition on type
             subtype_names = TypeInfo.get_child_and_self_type_names(restrict_to, type_kind=TypeKind.RECORD)
             placeholders = ",".join("?" for _ in subtype_names)
@@ -158,23 +206,8 @@ class SqliteDb(Db):
         select_sql, add_params = self._add_limit_and_skip(select_sql, limit=limit, skip=skip)
         values.extend(add_params)
 
-        # Execute SQL query
-        conn = self._get_connection()
-        cursor = conn.execute(select_sql, values)
-
-        # Deserialize records
-        result = []
-        for row in cursor.fetchall():
-            # Convert sqlite3.Row to dict
-            serialized_record = {k: row[k] for k in row.keys() if row[k] is not None}
-            del serialized_record["_key"]
-
-            # Create a record from the serialized data
-            record = _DATA_SERIALIZER.deserialize(serialized_record)
-
-            result.append(record)
-
-        return tuple(result)
+        # Execute SQL query and deserialize records in batches
+        yield from self._iter_rows(select_sql, values, project_to=project_to, batch_size=batch_size)
 
     def load_by_query(
         self,
@@ -189,6 +222,34 @@ class SqliteDb(Db):
         limit: int | None = None,
         skip: int | None = None,
     ) -> tuple[TRecord, ...]:
+        return tuple(
+            self.iter_by_query(
+                query,
+                dataset=dataset,
+                tenant=tenant,
+                cast_to=cast_to,
+                restrict_to=restrict_to,
+                project_to=project_to,
+                sort_order=sort_order,
+                limit=limit,
+                skip=skip,
+            )
+        )
+
+    def iter_by_query(
+        self,
+        query: QueryMixin,
+        *,
+        dataset: str,
+        tenant: str,
+        cast_to: type[TRecord] | None = None,
+        restrict_to: type[TRecord] | None = None,
+        project_to: type[TRecord] | None = None,
+        sort_order: SortOrder = SortOrder.ASC,
+        limit: int | None = None,
+        skip: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[TRecord]:
 
         # Check that the query has been frozen
         query.check_frozen()
@@ -197,18 +258,19 @@ class SqliteDb(Db):
         self._check_dataset(dataset)
         self._check_tenant(tenant)
 
-        if project_to is not None:
-            raise RuntimeError(f"{typename(type(self))} does not currently support 'project_to' option.")
-
         # Get table name from key type and check it has an acceptable format
-        table_name = self._get_validated_table_name(key_type=query.get_target_type().get_key_type())
+        key_type = query.get_target_type().get_key_type()
+        table_name = self._get_validated_table_name(key_type=key_type)
 
         if not self._table_exists(table_name=table_name):
-            return tuple()
+            return
 
         # Serialize the query
         query_dict = BootstrapSerializers.FOR_SQLITE_QUERY.serialize(query)
 
+        # Add index for the fields in this query if not yet added
+        self._add_index(table_name=table_name, query_dict=query_dict)
+
         # Validate restrict_to or use the query target type if not specified
         if restrict_to is None:
             # Default to the query target type
@@ -234,7 +296,9 @@ class SqliteDb(Db):
             where += f'"_type" IN ({placeholders})'
             values += subtype_names
 
-        select_sql = f'SELECT * FROM {self._quote_identifier(table_name)} WHERE "_tenant" = ?'
+        # Select only the columns for the fields of project_to if specified
+        columns = self._get_select_columns(key_type=key_type, table_name=table_name, project_to=project_to)
+        select_sql = f'SELECT {columns} FROM {self._quote_identifier(table_name)} WHERE "_tenant" = ?'
 
         if where:
             select_sql += f" AND {where}"
@@ -246,29 +310,51 @@ class SqliteDb(Db):
         select_sql, add_params = self._add_limit_and_skip(select_sql, limit=limit, skip=skip)
         values.extend(add_params)
 
-        # Execute SQL query
-        conn = self._get_connection()
-        cursor = conn.execute(select_sql, values)
-
-        # Set cast_to to restrict_to if not specified
+        # Set cast_to to project_to or restrict_to if not specified
         if cast_to is None:
-            cast_to = restrict_to
+            cast_to = project_to if project_to is not None else restrict_to
+
+        # Execute SQL query, deserialize records in batches and apply cast (error if not a subtype)
+        for record in self._iter_rows(select_sql, values, project_to=project_to, batch_size=batch_size):
+            yield CastUtil.cast(cast_to, record)
+
+    def count_all(
+        self,
+        key_type: type[KeyMixin],
+        *,
+        dataset: str,
+        tenant: str,
+        restrict_to: type | None = None,
+    ) -> int:
 
-        # Deserialize records
-        result = []
-        for row in cursor.fetchall():
-            # Convert sqlite3.Row to dict
-            serialized_record = {k: row[k] for k in row.keys() if row[k] is not None}
-            del serialized_record["_key"]
+        # Check params
+        assert TypeCheck.guard_key_type(key_type)
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
 
-            # Create a record from the serialized data
-            record = _DATA_SERIALIZER.deserialize(serialized_record)
+        # Get table name from key type and check it has an acceptable format
+        table_name = self._get_validated_table_name(key_type=key_type)
 
-            # Apply cast (error if not a subtype)
-            record = CastUtil.cast(cast_to, record)
-            result.append(record)
+        if not self._table_exists(table_name=table_name):
+            return 0
 
-        return tuple(result)
+        select_sql, values = f'SELECT COUNT(*) FROM {self._quote_identifier(table_name)} WHERE "_tenant" = ?', [tenant]
+
+        if restrict_to is not None:
+            # Add index on type if not yet added
+            self._add_index(table_name=table_name, query_dict={})
+
+            # Add filter condition on type
+            subtype_names = TypeInfo.get_child_and_self_type_names(restrict_to, type_kind=TypeKind.RECORD)
+            placeholders = ",".join("?" for _ in subtype_names)
+
+            select_sql += f' AND "_type" IN ({placeholders})'
+            values += subtype_names
+
+        # Execute SQL query
+        with self._get_pool().reader() as conn:
+            count = conn.execute(select_sql, values).fetchone()[0]
+        return count
 
     def count_by_query(
         self,
@@ -296,6 +382,9 @@ class SqliteDb(Db):
         # Serialize the query
         query_dict = BootstrapSerializers.FOR_SQLITE_QUERY.serialize(query)
 
+        # Add index for the fields in this query if not yet added
+        self._add_index(table_name=table_name, query_dict=query_dict)
+
         # Validate restrict_to or use the query target type if not specified
         if restrict_to is None:
             # Default to the query target type
@@ -327,10 +416,8 @@ class SqliteDb(Db):
             select_sql += f" AND {where}"
 
         # Execute SQL query
-        conn = self._get_connection()
-        cursor = conn.execute(select_sql, values)
-
-        count = cursor.fetchone()[0]
+        with self._get_pool().reader() as conn:
+            count = conn.execute(select_sql, values).fetchone()[0]
         return count
 
     def save_many(
@@ -355,9 +442,6 @@ class SqliteDb(Db):
         # Get table name from key type and check it has an acceptable format
         table_name = self._get_validated_table_name(key_type=key_type)
 
-        # Create table if not exists using key_type as source for table schema
-        self._create_table(key_type=key_type)
-
         serialized_records = []
         for record in records:
             serialized_record = _DATA_SERIALIZER.serialize(record)
@@ -368,6 +452,9 @@ class SqliteDb(Db):
         # Dynamically determine all relevant columns to use for query
         columns_for_query = sorted(set(k for data in serialized_records for k in data.keys()))
 
+        # Create table if not exists using key_type as source for table schema, add missing columns
+        self._create_table(key_type=key_type, column_names=columns_for_query)
+
         # Build SQL query to insert records
         quoted_cols = [self._quote_identifier(self._get_validated_column_name(c)) for c in columns_for_query]
         placeholders = ", ".join("?" for _ in quoted_cols)
@@ -387,9 +474,62 @@ class SqliteDb(Db):
         values_for_query = [tuple(data.get(col) for col in columns_for_query) for data in serialized_records]
 
         # Execute SQL query
-        conn = self._get_connection()
-        conn.executemany(insert_sql, values_for_query)
-        conn.commit()
+        with self._get_pool().writer() as conn:
+            conn.executemany(insert_sql, values_for_query)
+            self._commit(conn)
+
+    def replace_one_if(
+        self,
+        key_type: type[KeyMixin],
+        record: RecordMixin,
+        *,
+        query: QueryMixin,
+        dataset: str,
+        tenant: str,
+    ) -> bool:
+
+        # Check params
+        assert TypeCheck.guard_key_type(key_type)
+        query.check_frozen()
+        self._check_dataset(dataset)
+        self._check_tenant(tenant)
+
+        # Get table name from key type and check it has an acceptable format
+        table_name = self._get_validated_table_name(key_type=key_type)
+
+        # The stored record does not exist if the table does not exist
+        if not self._table_exists(table_name=table_name):
+            return False
+
+        serialized_record = _DATA_SERIALIZER.serialize(record)
+        serialized_record["_key"] = _KEY_SERIALIZER.serialize(record.get_key())
+        serialized_record["_tenant"] = tenant
+
+        # Add missing columns, then set all columns so that fields not present in the record are cleared as in replace
+        self._create_table(key_type=key_type, column_names=list(serialized_record.keys()))
+        table_columns = sorted(self._get_table_columns(table_name=table_name))
+        set_sql = ", ".join(
+            f"{self._quote_identifier(self._get_validated_column_name(c))} = ?" for c in table_columns
+        )
+
+        # Build SQL query to update the record by key only if the stored record matches the query
+        query_dict = BootstrapSerializers.FOR_SQLITE_QUERY.serialize(query)
+        where, values = self._convert_query_dict_to_sql_syntax(query_dict, tenant)
+        update_sql = f'UPDATE {self._quote_identifier(table_name)} SET {set_sql} WHERE "_tenant" = ? AND "_key" = ?'
+        if where:
+            update_sql += f" AND {where}"
+        values = [
+            *(serialized_record.get(c) for c in table_columns),
+            values[0],
+            serialized_record["_key"],
+            *values[1:],
+        ]
+
+        # Execute SQL query, the update is atomic so the number of updated rows shows if the condition was met
+        with self._get_pool().writer() as conn:
+            updated_count = conn.execute(update_sql, values).rowcount
+            self._commit(conn)
+        return updated_count == 1
 
     def delete_many(
         self,
@@ -425,8 +565,9 @@ class SqliteDb(Db):
         )
 
         # Execute SQL query
-        conn = self._get_connection()
-        conn.execute(select_sql, values)
+        with self._get_pool().writer() as conn:
+            conn.execute(select_sql, values)
+            self._commit(conn)
 
     def delete_by_query(
         self,
@@ -452,6 +593,9 @@ class SqliteDb(Db):
         # Serialize the query
         query_dict = BootstrapSerializers.FOR_SQLITE_QUERY.serialize(query)
 
+        # Add index for the fields in this query if not yet added
+        self._add_index(table_name=table_name, query_dict=query_dict)
+
         # Validate restrict_to or use the query target type if not specified
         if restrict_to is None:
             # Default to the query target type
@@ -483,16 +627,44 @@ class SqliteDb(Db):
             delete_sql += f" AND {where}"
 
         # Execute SQL query
-        conn = self._get_connection()
-        conn.execute(delete_sql, values)
+        with self._get_pool().writer() as conn:
+            conn.execute(delete_sql, values)
+            self._commit(conn)
+
+    def begin_transaction(self) -> None:
+        # Other threads wait for the writer connection until the transaction is committed or rolled back
+        self._get_pool().begin_transaction()
+
+    def commit_transaction(self) -> None:
+        pending_tables = _pending_table_dict.pop(self.db_id, None)
+        pending_indexes = _pending_index_dict.pop(self.db_id, None)
+        self._get_pool().commit_transaction()
+
+        # Cache tables, columns and indexes created inside the transaction only after they are visible to readers
+        if pending_tables:
+            _table_dict.setdefault(self.db_id, {}).update(pending_tables)
+        if pending_indexes:
+            _index_dict.setdefault(self.db_id, set()).update(pending_indexes)
+
+    def rollback_transaction(self) -> None:
+        # Tables, columns and indexes created inside the transaction are also rolled back
+        _pending_table_dict.pop(self.db_id, None)
+        _pending_index_dict.pop(self.db_id, None)
+        self._get_pool().rollback_transaction()
 
     def close_connection(self) -> None:
-        if (connection := _connection_dict.get(self.db_id, None)) is not None:
-            # Close connection
-            connection.close()
-
-            # Remove from dictionary so connection can be reopened on next access
-            del _connection_dict[self.db_id]
+        # Remove from dictionary so the pool can be reopened on next access
+        with _pool_dict_lock:
+            pool = _pool_dict.pop(self.db_id, None)
+        if pool is not None:
+            # Close the writer and reader connections
+            pool.close()
+
+        # Tables and indexes will be checked again on next access as the database may have been dropped
+        _table_dict.pop(self.db_id, None)
+        _index_dict.pop(self.db_id, None)
+        _pending_table_dict.pop(self.db_id, None)
+        _pending_index_dict.pop(self.db_id, None)
 
     def _get_db_file_path(self) -> str:
         """Get database file path from db_id, applying the appropriate formatting conventions."""
@@ -506,67 +678,204 @@ class SqliteDb(Db):
         result = os.path.join(db_dir, f"{self.db_id}.sqlite")
         return result
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get sqlite3 connection object."""
-
-        if (conn := _connection_dict.get(self.db_id, None)) is None:
-            db_file_path = self._get_db_file_path()
+    def _get_pool(self) -> SqliteConnectionPool:
+        """Get or create the connection pool for this database."""
+        if (pool := _pool_dict.get(self.db_id, None)) is None:
+            with _pool_dict_lock:
+                if (pool := _pool_dict.get(self.db_id, None)) is None:
+                    pool = SqliteConnectionPool(
+                        db_file_path=self._get_db_file_path(),
+                        reader_count=DbSettings.instance().db_sqlite_reader_count,
+                    )
+                    _pool_dict[self.db_id] = pool
+        return pool
 
-            # Ensure the parent directory exists
-            os.makedirs(os.path.dirname(db_file_path), exist_ok=True)
+    @classmethod
+    def close_all_connections(cls) -> None:
+        """Close connection pools for all databases, invoked on process exit."""
+        with _pool_dict_lock:
+            pools = tuple(_pool_dict.values())
+            _pool_dict.clear()
+        for pool in pools:
+            pool.close()
+
+    def _create_table(self, *, key_type: type[KeyMixin], column_names: Sequence[str]) -> None:
+        """
+        Create a table if not exists with a structure corresponding to the key_type hierarchy,
+        then add the specified columns if not already present.
+        """
 
-            # Open a connection to the SQLite database at the given path.
-            # If the file does not exist, SQLite will create it (but not directory)
-            conn = sqlite3.connect(db_file_path, check_same_thread=False)
+        # Get table name from key type and check it has an acceptable format
+        table_name = self._get_validated_table_name(key_type=key_type)
 
-            # Enable Write-Ahead Logging (WAL) mode.
-            # This improves concurrent read/write performance and reduces locking issues.
-            conn.execute("PRAGMA journal_mode=WAL")
+        with self._get_pool().writer() as conn:
+            self._create_table_or_add_columns(
+                conn,
+                key_type=key_type,
+                table_name=table_name,
+                column_names=column_names,
+            )
 
-            # Set the synchronous mode to 'NORMAL' to balance performance and durability.
-            # It's faster than FULL, and still safe for most use cases.
-            conn.execute("PRAGMA synchronous=NORMAL")
+    def _create_table_or_add_columns(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        key_type: type[KeyMixin],
+        table_name: str,
+        column_names: Sequence[str],
+    ) -> None:
+        """Implements _create_table using the writer connection."""
+        if (table_columns := self._get_table_columns(table_name=table_name)) is None:
+
+            # List of columns that are present in the table by default
+            column_defs = ["_key", "_type", "_tenant"]
+
+            # Validate and quote data type columns
+            column_defs.extend(
+                (
+                    self._quote_identifier(self._get_validated_column_name(column_name))
+                    for column_name in self._extract_columns_for_key_type(key_type)
+                )
+            )
 
-            # Set the row factory so that rows fetched from queries will be returned
-            # as sqlite3.Row objects, which act like dictionaries (column access by name).
-            conn.row_factory = sqlite3.Row
+            sql = (
+                f"CREATE TABLE IF NOT EXISTS {self._quote_identifier(table_name)} "
+                + f'({", ".join(column_defs)}, PRIMARY KEY (_key, _tenant));'
+            )
+            conn.execute(sql)
+            self._commit(conn)
+
+            # Read the columns back as the table may have been created earlier by another process
+            table_columns = self._get_table_columns(table_name=table_name)
+
+        # Add columns for the fields of types that were not known when the table was created
+        if missing_column_names := [x for x in column_names if x not in table_columns]:
+            for column_name in missing_column_names:
+                quoted_column_name = self._quote_identifier(self._get_validated_column_name(column_name))
+                try:
+                    conn.execute(f"ALTER TABLE {self._quote_identifier(table_name)} ADD COLUMN {quoted_column_name};")
+                except sqlite3.OperationalError as e:
+                    # Ignore if the column has been added by another process after the table columns were read
+                    if "duplicate column name" not in str(e):
+                        raise e
+                table_columns.add(column_name)
+            self._commit(conn)
+
+    def _add_index(self, *, table_name: str, query_dict: dict) -> None:
+        """
+        Add index on (_tenant, query fields, _type) for the fields present in the serialized query
+        if not yet added, so each combination of fields used in queries gets its own index.
+        """
+        query_columns = tuple(self._get_validated_column_name(x) for x in query_dict.keys())
+        index_columns = ("_tenant", *query_columns, "_type")
+        index_id = (table_name, index_columns)
+        indexes = _index_dict.setdefault(self.db_id, set())
+        if self._get_pool().in_transaction():
+            # Index created inside the transaction is not visible to other threads until commit
+            pending_indexes = _pending_index_dict.setdefault(self.db_id, set())
+            is_known = index_id in indexes or index_id in pending_indexes
+            indexes = pending_indexes
+        else:
+            is_known = index_id in indexes
+        if not is_known:
+            index_name = "__".join(("idx", table_name, *query_columns, "_type"))
+            quoted_columns = ", ".join(self._quote_identifier(x) for x in index_columns)
+            index_sql = (
+                f"CREATE INDEX IF NOT EXISTS {self._quote_identifier(index_name)} "
+                f"ON {self._quote_identifier(table_name)} ({quoted_columns});"
+            )
 
-            _connection_dict[self.db_id] = conn
+            with self._get_pool().writer() as conn:
+                conn.execute(index_sql)
+                self._commit(conn)
 
-        return conn
+            # Add to the set of indexes that have already been added
+            indexes.add(index_id)
 
-    def _create_table(self, *, key_type: type[KeyMixin]) -> None:
-        """Create a table if not exists with a structure corresponding to the key_type hierarchy."""
+    def _iter_rows(
+        self,
+        select_sql: str,
+        values: list,
+        *,
+        project_to: type[TRecord] | None,
+        batch_size: int | None,
+    ) -> Iterator[RecordMixin]:
+        """Execute the query using a reader connection, then fetch and deserialize records in batches."""
+        if batch_size is None:
+            batch_size = DbSettings.instance().db_fetch_batch_size
+        elif batch_size <= 0:
+            raise RuntimeError(f"Parameter batch_size={batch_size} must be positive.")
+
+        # The reader connection is held until the iterator is exhausted or closed
+        with self._get_pool().reader() as conn:
+            cursor = conn.execute(select_sql, values)
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield self._deserialize_row(row, project_to=project_to)
 
-        # Get table name from key type and check it has an acceptable format
-        table_name = self._get_validated_table_name(key_type=key_type)
+    @classmethod
+    def _deserialize_row(cls, row: sqlite3.Row, *, project_to: type[TRecord] | None) -> RecordMixin:
+        """Deserialize the row into a record, or into an instance of project_to from the selected columns."""
 
-        # List of columns that are present in the table by default
-        column_defs = ["_key", "_type", "_tenant"]
+        # Convert sqlite3.Row to dict
+        serialized_record = {k: row[k] for k in row.keys() if row[k] is not None}
+        del serialized_record["_key"]
 
-        # Validate and quote data type columns
-        column_defs.extend(
-            (
-                self._quote_identifier(self._get_validated_column_name(column_name))
-                for column_name in self._extract_columns_for_key_type(key_type)
-            )
-        )
+        if project_to is not None:
+            # Only the columns for the fields of project_to were selected, deserialize into project_to
+            serialized_record["_type"] = typename(project_to)
 
-        sql = (
-            f"CREATE TABLE IF NOT EXISTS {self._quote_identifier(table_name)} "
-            + f'({", ".join(column_defs)}, PRIMARY KEY (_key, _tenant));'
-        )
+        # Create a record from the serialized data
+        return _DATA_SERIALIZER.deserialize(serialized_record)
 
-        conn = self._get_connection()
-        conn.execute(sql)
-        conn.commit()
+    def _get_select_columns(
+        self,
+        *,
+        key_type: type[KeyMixin],
+        table_name: str,
+        project_to: type[TRecord] | None,
+    ) -> str:
+        """
+        Return the column list for SELECT, which includes only '_key' and the columns for the fields
+        of project_to present in the table if specified, and all columns otherwise.
+        """
+        if project_to is None:
+            return "*"
+        field_names = self._get_projected_field_names(key_type=key_type, project_to=project_to)
+        table_columns = self._get_table_columns(table_name=table_name)
+        column_names = ["_key", *(x for x in field_names if x in table_columns)]
+        return ", ".join(self._quote_identifier(self._get_validated_column_name(x)) for x in column_names)
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Commit unless inside a transaction started by begin_transaction, in which case commit_transaction will."""
+        if not self._get_pool().in_transaction():
+            conn.commit()
 
     def _table_exists(self, *, table_name: str) -> bool:
         """Check if specified table exists in DB."""
+        return self._get_table_columns(table_name=table_name) is not None
 
-        check_sql = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
-        conn = self._get_connection()
-        return conn.execute(check_sql, (table_name,)).fetchone()
+    def _get_table_columns(self, *, table_name: str) -> set[str] | None:
+        """
+        Return the set of column names for the table or None if the table does not exist.
+        Only tables that exist are cached because the table may be created by another process.
+        Inside a transaction, the columns are cached separately until commit because readers
+        in other threads do not see the tables and columns created by the transaction.
+        """
+        tables = _table_dict.setdefault(self.db_id, {})
+        if self._get_pool().in_transaction():
+            committed_tables = tables
+            tables = _pending_table_dict.setdefault(self.db_id, {})
+            if table_name not in tables and (committed_columns := committed_tables.get(table_name, None)) is not None:
+                # Copy so the columns added inside the transaction are not visible to other threads
+                tables[table_name] = set(committed_columns)
+        if (result := tables.get(table_name, None)) is None:
+            with self._get_pool().reader() as conn:
+                rows = conn.execute(f"PRAGMA table_info({self._quote_identifier(table_name)});").fetchall()
+            if rows:
+                result = set(row["name"] for row in rows)
+                tables[table_name] = result
+        return result
 
     def _drop_db_do_not_call_directly(self) -> None:
         """DO NOT CALL DIRECTLY, call drop_db() instead."""
@@ -729,3 +1038,7 @@ class SqliteDb(Db):
 
         where_clause = " AND ".join(clauses)
         return where_clause, values
+
+
+# Close connection pools on process exit
+atexit.register(SqliteDb.close_all_connections)
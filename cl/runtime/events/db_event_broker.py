@@ -13,19 +13,23 @@
 # limitations under the License.
 
 import asyncio
+import datetime as dt
 import logging
 from collections import deque
 from dataclasses import dataclass
 from typing import AsyncGenerator
+from typing import Sequence
 from starlette.requests import Request
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.db.data_source import DataSource
 from cl.runtime.db.sort_order import SortOrder
 from cl.runtime.events.event import Event
 from cl.runtime.events.event_broker import EventBroker
+from cl.runtime.events.event_query import EventQuery
 from cl.runtime.primitive.timestamp import Timestamp
 from cl.runtime.records.data_mixin import TDataDict
 from cl.runtime.records.for_dataclasses.extensions import required
+from cl.runtime.records.predicates import Gt
 from cl.runtime.serializers.data_serializers import DataSerializers
 
 _logger = logging.getLogger(__name__)
@@ -33,8 +37,17 @@ _logger = logging.getLogger(__name__)
 _pull_events_delay = 3.0
 """Delay in seconds to check new events in DB."""
 
-_event_buffer_maxlen = 100
-"""Max number of sent events in buffer."""
+_pull_events_lookback = 3.0
+"""Events committed up to this number of seconds after their timestamp was created are still delivered."""
+
+_pull_events_batch_size = 1000
+"""Max number of events loaded from DB in a single query."""
+
+_subscriber_queue_maxsize = 1000
+"""Max number of events waiting to be sent to a single subscriber, the oldest events are dropped when reached."""
+
+_poller_dict: dict[tuple, "_EventPoller"] = {}
+"""Dict of pollers shared by all subscribers in this process, indexed by event loop and data source."""
 
 
 def _handle_async_task_exception(task: asyncio.Task):
@@ -49,18 +62,97 @@ def _handle_async_task_exception(task: asyncio.Task):
         _logger.error("DB SSE pull events task failed.", exc_info=True)
 
 
-async def _pull_events(queue: asyncio.Queue, data_source: DataSource):
-    while True:
-        # Get unprocessed events from the DB, sorted by ascending timestamp
-        # load_all is enough as Event key field is timestamp
-        new_events = data_source.load_all(key_type=Event().get_key_type(), sort_order=SortOrder.DESC, limit=100)[::-1]
-
-        # Put events to subscribed queues
-        for event in new_events:
-            await queue.put(event)
+class _EventPoller:
+    """Pulls new events from DB using a range query on timestamp and fans them out to the subscriber queues."""
+
+    __slots__ = ("_data_source", "_poller_id", "_subscriber_queues", "_delivered_timestamps", "_delivered_queue")
+
+    def __init__(self, data_source: DataSource, poller_id: tuple):
+        """Create the poller for the data source, start using 'get_subscriber_queue'."""
+        self._data_source = data_source
+        self._poller_id = poller_id
+        self._subscriber_queues: set[asyncio.Queue[Event]] = set()
+        self._delivered_timestamps: set[str] = set()
+        self._delivered_queue: deque[str] = deque()
+
+    @classmethod
+    def get_subscriber_queue(cls, data_source: DataSource) -> asyncio.Queue[Event]:
+        """Return a new subscriber queue, start polling if this is the first subscriber for the data source."""
+        poller_id = (
+            id(asyncio.get_running_loop()),
+            data_source.get_db_id(),
+            data_source.dataset.dataset_id,
+            data_source.tenant.tenant_id,
+        )
+        if (poller := _poller_dict.get(poller_id, None)) is None:
+            poller = cls(data_source, poller_id)
+            _poller_dict[poller_id] = poller
+            pull_events_task = asyncio.create_task(poller._pull_events())
+            pull_events_task.add_done_callback(_handle_async_task_exception)
 
-        # Wait for delay
-        await asyncio.sleep(_pull_events_delay)
+        queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=_subscriber_queue_maxsize)
+        poller._subscriber_queues.add(queue)
+        return queue
+
+    @classmethod
+    def remove_subscriber_queue(cls, queue: asyncio.Queue[Event]) -> None:
+        """Remove the subscriber queue, polling stops when there are no subscribers left."""
+        for poller in _poller_dict.values():
+            poller._subscriber_queues.discard(queue)
+
+    async def _pull_events(self) -> None:
+        """Pull events from DB until there are no subscribers left."""
+        try:
+            # Events with timestamps before this lower bound are not delivered
+            last_timestamp = Timestamp.create()
+            while self._subscriber_queues:
+                # Run DB access in a worker thread to avoid blocking the event loop
+                new_events = await asyncio.to_thread(self._load_new_events, last_timestamp)
+
+                # Put events to subscriber queues
+                for event in new_events:
+                    for queue in self._subscriber_queues:
+                        if queue.full():
+                            # Drop the oldest event for a subscriber that does not keep up
+                            queue.get_nowait()
+                            _logger.warning("SSE subscriber queue is full, dropping the oldest event.")
+                        queue.put_nowait(event)
+                    last_timestamp = max(last_timestamp, event.timestamp)
+
+                # Wait for delay
+                await asyncio.sleep(_pull_events_delay)
+        finally:
+            # There is no await between the check for subscribers and removal, so no subscriber is missed
+            if _poller_dict.get(self._poller_id, None) is self:
+                del _poller_dict[self._poller_id]
+
+    def _load_new_events(self, last_timestamp: str) -> list[Event]:
+        """Load events not yet delivered including those committed late within the lookback interval."""
+
+        # Compare to a datetime prefix which is less than all timestamps with this prefix
+        lookback_datetime = Timestamp.to_datetime(last_timestamp) - dt.timedelta(seconds=_pull_events_lookback)
+        from_timestamp = lookback_datetime.strftime("%Y-%m-%d-%H-%M-%S-%f")[:-3]
+
+        # Forget delivered timestamps before the lookback interval as they will not be loaded again
+        while self._delivered_queue and self._delivered_queue[0] <= from_timestamp:
+            self._delivered_timestamps.discard(self._delivered_queue.popleft())
+
+        result = []
+        while True:
+            # Range query on timestamp sorted by ascending timestamp as Event key field is timestamp
+            query = EventQuery(timestamp=Gt(from_timestamp)).build()
+            events = self._data_source.load_by_query(query, sort_order=SortOrder.ASC, limit=_pull_events_batch_size)
+            for event in events:
+                if event.timestamp not in self._delivered_timestamps:
+                    self._delivered_timestamps.add(event.timestamp)
+                    self._delivered_queue.append(event.timestamp)
+                    result.append(event)
+
+            if len(events) < _pull_events_batch_size:
+                return result
+            else:
+                # Continue from the last loaded event if the batch is full
+                from_timestamp = events[-1].timestamp
 
 
 @dataclass(slots=True, kw_only=True)
@@ -68,23 +160,18 @@ class DbEventBroker(EventBroker):
     """
     Event broker that uses current DataSource as transport for events.
     Continuously checks if there are new events in the DB and sends them to the queue.
+
+    Notes:
+        - A single poller per process and data source loads only the events not yet delivered
+        - Each subscriber receives events from the poller through its own bounded queue
     """
 
     data_source: DataSource = required()
     """Data source used for pulling events."""
 
-    _sent_event_buffer: deque[str] | None = None
-    """Buffer queue for sent events."""
-
     _from_timestamp: str | None = None
     """Set start timestamp for filtering old events."""
 
-    _event_queue: asyncio.Queue[Event] | None = None
-    """Buffer queue for events."""
-
-    _pull_events_task: asyncio.Task | None = None
-    """Async Task for pulling Events from DB."""
-
     def __init(self) -> None:
         """Use instead of __init__ in the builder pattern, invoked by the build method in base to derived order."""
 
@@ -93,42 +180,31 @@ class DbEventBroker(EventBroker):
         if self.data_source is None:
             self.data_source = active(DataSource)
 
-        if self._sent_event_buffer is None:
-            self._sent_event_buffer: deque[str] = deque(maxlen=100)
-
         if self._from_timestamp is None:
             self._from_timestamp = Timestamp.create()
 
-        if self._event_queue is None:
-            self._event_queue: asyncio.Queue[Event] = asyncio.Queue()
-
-        if self._pull_events_task is None:
-            self._pull_events_task: asyncio.Task | None = None
-
     async def subscribe(self, topic: str, request: Request | None = None) -> AsyncGenerator[TDataDict, None]:
 
-        # Start pulling events from db in parallel async task
-        if self._pull_events_task is None:
-            pull_events_task = asyncio.create_task(_pull_events(self._event_queue, self.data_source))
-            pull_events_task.add_done_callback(_handle_async_task_exception)
-            self._pull_events_task = pull_events_task
-
-        while True:
-            if request and await request.is_disconnected():
-                _logger.debug("SSE: Client disconnected from SSE. Stop sending events.")
-                break
+        # Start pulling events from DB if this is the first subscriber in this process
+        event_queue = _EventPoller.get_subscriber_queue(self.data_source)
+        try:
+            while True:
+                if request and await request.is_disconnected():
+                    _logger.debug("SSE: Client disconnected from SSE. Stop sending events.")
+                    break
 
-            # Wait for the next event from the queue
-            yield await self._get_event()
+                # Wait for the next event from the queue
+                yield await self._get_event(event_queue)
+        finally:
+            _EventPoller.remove_subscriber_queue(event_queue)
 
-    async def _get_event(self) -> TDataDict:
+    async def _get_event(self, event_queue: asyncio.Queue[Event]) -> TDataDict:
         # Await event in queue
         while True:
-            event = await self._event_queue.get()
+            event = await event_queue.get()
 
-            # Filter old or already sent events
-            if event.timestamp > self._from_timestamp and event.timestamp not in self._sent_event_buffer:
-                self._sent_event_buffer.append(event.timestamp)
+            # Filter events published before this broker was created
+            if event.timestamp > self._from_timestamp:
                 event_data = DataSerializers.FOR_UI.serialize(event)
                 return event_data
 
@@ -139,10 +215,10 @@ class DbEventBroker(EventBroker):
         # Publish event by just saving to DB
         self.data_source.replace_one(event, commit=True)
 
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        # Cancel pull events task
-        if self._pull_events_task is not None:
-            self._pull_events_task.cancel()
+    def sync_publish_many(self, topic: str, events: Sequence[Event]) -> None:
+        # Publish events in a single commit using a copy of the data source with its own pending operations,
+        # so this method can be invoked from a background thread such as the writer thread of EventLogHandler
+        self.data_source.clone().build().replace_many(events, commit=True)
 
     def drop_test_broker(self) -> None:
         # Do nothing. Rely on active Db teardown
@@ -18,6 +18,7 @@ from abc import abstractmethod
 from dataclasses import dataclass
 from typing import AsyncGenerator
 from typing import Self
+from typing import Sequence
 from fastapi import Request
 from cl.runtime.contexts.context_manager import active_or_default
 from cl.runtime.db.tenant import Tenant
@@ -93,6 +94,11 @@ class EventBroker(EventBrokerKey, RecordMixin, ABC):
         """Publish an Event to a topic/channel synchronously."""
         raise NotImplementedError
 
+    def sync_publish_many(self, topic: str, events: Sequence[Event]) -> None:
+        """Publish multiple events to a topic/channel synchronously, derived types may override to publish in bulk."""
+        for event in events:
+            self.sync_publish(topic, event)
+
     def __enter__(self):
         """Enter the sync context. Called during the make_active() method."""
         return self
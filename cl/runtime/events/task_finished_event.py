@@ -24,3 +24,9 @@ class TaskFinishedEvent(TaskEvent):
 
     status: TaskStatus = required()
     """Task status."""
+
+    elapsed_sec: float | None = None
+    """Wall clock time in seconds from start to finish of task execution if available."""
+
+    cpu_sec: float | None = None
+    """CPU time in seconds used by the thread running the task if available."""
@@ -0,0 +1,24 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+from cl.runtime.events.task_event import TaskEvent
+
+
+@dataclass(slots=True, kw_only=True)
+class TaskStartedEvent(TaskEvent):
+    """Event type with info about started Task and the time it spent in queue."""
+
+    queued_sec: float | None = None
+    """Time in seconds from task creation to start of execution if available."""
@@ -29,59 +29,36 @@ _SERIALIZER = DataSerializers.FOR_CSV
 class CsvReader(Reader):
     """Helper class for working with CSV files."""
 
-    def load_all(
-        self,
-        *,
-        dirs: Sequence[str],
-        ext: str,
-        file_include_patterns: Sequence[str] | None = None,
-        file_exclude_patterns: Sequence[str] | None = None,
-    ) -> tuple[RecordMixin]:
-
-        file_paths = FileUtil.enumerate_files(
-            dirs=dirs,
-            ext=ext,
-            file_include_patterns=file_include_patterns,
-            file_exclude_patterns=file_exclude_patterns,
-        )
-
-        # Iterate over files
-        result = []
-        for file_path in file_paths:
-            try:
-                # Determine record type from filename
-                record_type = FileUtil.get_type_from_filename(file_path)
-
-                with open(file_path, mode="r", encoding="utf-8") as file:
-
-                    # The reader is an iterable of row dicts
-                    csv_reader = csv.DictReader(file)
-                    row_dicts = [row_dict for row_dict in csv_reader]
-
-                    invalid_rows = {
-                        index
-                        for index, row_dict in enumerate(row_dicts)
-                        for key in row_dict.keys()
-                        if key is None or key == ""  # TODO: Add other checks for invalid keys
-                    }
-
-                    if invalid_rows:
-                        rows_str = "".join([f"Row: {invalid_row}\n" for invalid_row in invalid_rows])
-                        raise RuntimeError(
-                            "Misaligned values found in the following rows.\n"
-                            "Check the placement of commas and double quotes.\n" + rows_str
-                        )
-
-                    # Deserialize rows into records and add to the result
-                    loaded = [
-                        self._deserialize_row(record_type=record_type, row_dict=row_dict) for row_dict in row_dicts
-                    ]
-                    result.extend(loaded)
-            except Exception as e:
-                raise RuntimeError(f"Failed to load CSV file {file_path}. Error: {e}") from e
-
-        # Convert to tuple and return
-        return tuple(result)
+    def load_file(self, file_path: str) -> tuple[RecordMixin, ...]:
+        try:
+            # Determine record type from filename
+            record_type = FileUtil.get_type_from_filename(file_path)
+
+            with open(file_path, mode="r", encoding="utf-8") as file:
+
+                # The reader is an iterable of row dicts
+                csv_reader = csv.DictReader(file)
+                row_dicts = [row_dict for row_dict in csv_reader]
+
+                invalid_rows = {
+                    index
+                    for index, row_dict in enumerate(row_dicts)
+                    for key in row_dict.keys()
+                    if key is None or key == ""  # TODO: Add other checks for invalid keys
+                }
+
+                if invalid_rows:
+                    rows_str = "".join([f"Row: {invalid_row}\n" for invalid_row in invalid_rows])
+                    raise RuntimeError(
+                        "Misaligned values found in the following rows.\n"
+                        "Check the placement of commas and double quotes.\n" + rows_str
+                    )
+
+                # Deserialize rows into records and return
+                loaded = [self._deserialize_row(record_type=record_type, row_dict=row_dict) for row_dict in row_dicts]
+                return tuple(loaded)
+        except Exception as e:
+            raise RuntimeError(f"Failed to load CSV file {file_path}. Error: {e}") from e
 
     @classmethod
     def check_or_fix_quotes(
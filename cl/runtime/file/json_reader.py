@@ -14,7 +14,6 @@
 
 from dataclasses import dataclass
 from typing import Any
-from typing import Sequence
 from cl.runtime.file.file_util import FileUtil
 from cl.runtime.file.reader import Reader
 from cl.runtime.records.record_mixin import RecordMixin
@@ -31,64 +30,43 @@ _ENCODER = JsonEncoders.DEFAULT
 class JsonReader(Reader):
     """Load records from a single JSON file into the context database."""
 
-    def load_all(
-        self,
-        *,
-        dirs: Sequence[str],
-        ext: str,
-        file_include_patterns: Sequence[str] | None = None,
-        file_exclude_patterns: Sequence[str] | None = None,
-    ) -> tuple[RecordMixin]:
-
-        file_paths = FileUtil.enumerate_files(
-            dirs=dirs,
-            ext=ext,
-            file_include_patterns=file_include_patterns,
-            file_exclude_patterns=file_exclude_patterns,
-        )
-
-        # Iterate over files
-        result = []
-        for file_path in file_paths:
-            try:
-                record_type = FileUtil.get_type_from_filename(file_path, raise_on_fail=False)
-
-                with open(file_path, mode="rb") as file:
-                    json_data = _ENCODER.decode(file.read())
-
-                    # Support both single record (dict) and multiple records (list)
-                    if isinstance(json_data, dict):
-                        object_dicts = [json_data]
-                    elif isinstance(json_data, list):
-                        object_dicts = json_data
-                    else:
-                        raise RuntimeError("JSON file must contain either a JSON object or an array of JSON objects.")
-
-                    invalid_objects = {
-                        index
-                        for index, object_dict in enumerate(object_dicts)
-                        for key in object_dict.keys()
-                        if key is None or key == ""  # TODO: Add other checks for invalid keys
-                    }
-
-                    if invalid_objects:
-                        rows_str = "".join([f"Row: {invalid_object}\n" for invalid_object in invalid_objects])
-                        raise RuntimeError(
-                            "Misaligned values found in the following objects.\n"
-                            "Check the placement of commas, brackets and double quotes.\n" + rows_str
-                        )
-
-                    # Deserialize rows into records and add to the result
-                    loaded = [
-                        self._deserialize_object(record_type=record_type, object_dict=object_dict)
-                        for object_dict in object_dicts
-                    ]
-                    result.extend(loaded)
-            except Exception as e:
-                raise RuntimeError(f"Failed to upload JSON file {file_path}.\n" f"Error: {e}") from e
-
-        # Convert to tuple and return
-        return tuple(result)
+    def load_file(self, file_path: str) -> tuple[RecordMixin, ...]:
+        try:
+            record_type = FileUtil.get_type_from_filename(file_path, raise_on_fail=False)
+
+            with open(file_path, mode="rb") as file:
+                json_data = _ENCODER.decode(file.read())
+
+                # Support both single record (dict) and multiple records (list)
+                if isinstance(json_data, dict):
+                    object_dicts = [json_data]
+                elif isinstance(json_data, list):
+                    object_dicts = json_data
+                else:
+                    raise RuntimeError("JSON file must contain either a JSON object or an array of JSON objects.")
+
+                invalid_objects = {
+                    index
+                    for index, object_dict in enumerate(object_dicts)
+                    for key in object_dict.keys()
+                    if key is None or key == ""  # TODO: Add other checks for invalid keys
+                }
+
+                if invalid_objects:
+                    rows_str = "".join([f"Row: {invalid_object}\n" for invalid_object in invalid_objects])
+                    raise RuntimeError(
+                        "Misaligned values found in the following objects.\n"
+                        "Check the placement of commas, brackets and double quotes.\n" + rows_str
+                    )
+
+                # Deserialize rows into records and return
+                loaded = [
+                    self._deserialize_object(record_type=record_type, object_dict=object_dict)
+                    for object_dict in object_dicts
+                ]
+                return tuple(loaded)
+        except Exception as e:
+            raise RuntimeError(f"Failed to upload JSON file {file_path}.\n" f"Error: {e}") from e
 
     @classmethod
     def _deserialize_object(cls, *, record_type: type | None, object_dict: dict[str, Any]) -> RecordMixin:
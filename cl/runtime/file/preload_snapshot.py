@@ -0,0 +1,199 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import importlib
+import os
+import sys
+from enum import Enum
+from typing import Any
+from typing import Mapping
+from typing import Sequence
+import bson
+import orjson
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+import cl.runtime
+from cl.runtime.records.protocols import is_data_key_or_record_type
+from cl.runtime.records.record_mixin import RecordMixin
+from cl.runtime.schema.type_info import TypeInfo
+from cl.runtime.serializers.data_serializers import DataSerializers
+
+_SNAPSHOT_VERSION = 2
+"""Version of the snapshot format, the snapshot is discarded when written by a different version."""
+
+_MANIFEST_FILENAME = "manifest.json"
+"""Name of the file with path, modification time, size and content hash of each snapshotted preload file."""
+
+_SERIALIZER = DataSerializers.FOR_MONGO
+"""Serializer producing BSON-compatible dicts, the same as used for storing records in MongoDB."""
+
+_CODEC_OPTIONS = CodecOptions(tz_aware=True, uuid_representation=UuidRepresentation.STANDARD)
+"""BSON codec options matching those used by MongoDB client in BasicMongoDb."""
+
+_module_hash_dict: dict[str, str] = {}
+"""Hash of the source file for each module name, computed once per process."""
+
+
+class PreloadSnapshot:
+    """
+    Binary snapshot of records read from preload files, used to skip parsing files that did not change.
+
+    Notes:
+        - Records from each preload file are stored in a separate file as concatenated BSON documents
+        - The manifest records path, modification time, size and content hash of each preload file
+        - Content is hashed only when modification time or size changed, so touching a file does not invalidate it
+        - The snapshot is discarded when TypeInfo.csv or the package version changed since it was written,
+          as the stored records may no longer match the current types
+        - Each snapshot file also stores the source hash of modules that define the types of stored records,
+          their fields and base classes, so that changing fields, defaults or init logic during development
+          causes the preload file to be parsed again
+    """
+
+    @classmethod
+    def get_schema_fingerprint(cls) -> str:
+        """Return the hash of TypeInfo.csv content and the package version, stored in the manifest."""
+        fingerprint = hashlib.sha256(cl.runtime.__version__.encode("utf-8"))
+        type_info_path = TypeInfo._get_preload_filename()  # noqa
+        if os.path.exists(type_info_path):
+            with open(type_info_path, "rb") as file:
+                fingerprint.update(file.read())
+        return fingerprint.hexdigest()
+
+    @classmethod
+    def load_manifest(cls, snapshot_dir: str) -> dict[str, dict[str, Any]]:
+        """Return manifest entries for the snapshot in the specified directory, or an empty dict if not found."""
+        manifest_path = os.path.join(snapshot_dir, _MANIFEST_FILENAME)
+        if not os.path.exists(manifest_path):
+            return {}
+        with open(manifest_path, "rb") as file:
+            manifest = orjson.loads(file.read())
+        if manifest.get("version") != _SNAPSHOT_VERSION:
+            # Discard the snapshot written by a different version of the format
+            return {}
+        if manifest.get("fingerprint") != cls.get_schema_fingerprint():
+            # Discard the snapshot written for different types or by a different version of the package
+            return {}
+        return manifest["files"]
+
+    @classmethod
+    def save_manifest(cls, snapshot_dir: str, entries: dict[str, dict[str, Any]]) -> None:
+        """Save manifest entries for the snapshot in the specified directory (overwrites the existing file)."""
+        manifest = {"version": _SNAPSHOT_VERSION, "fingerprint": cls.get_schema_fingerprint(), "files": entries}
+        cls._write_atomic(os.path.join(snapshot_dir, _MANIFEST_FILENAME), orjson.dumps(manifest))
+
+    @classmethod
+    def get_entry(cls, file_path: str, *, previous: dict[str, Any] | None) -> dict[str, Any]:
+        """
+        Return manifest entry for the current state of the preload file.
+
+        Args:
+            file_path: Absolute path to the preload file
+            previous: Manifest entry for the same file from the previous run or None if not present
+        """
+        stat = os.stat(file_path)
+        if previous is not None and previous["mtime_ns"] == stat.st_mtime_ns and previous["size"] == stat.st_size:
+            # Same modification time and size, reuse the previous hash without reading the file
+            return previous
+        with open(file_path, "rb") as file:
+            content_hash = hashlib.sha256(file.read()).hexdigest()
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": content_hash}
+
+    @classmethod
+    def is_current(
+        cls, snapshot_dir: str, file_path: str, *, entry: dict[str, Any], previous: dict[str, Any] | None
+    ) -> bool:
+        """Return True if the snapshot of the preload file exists and was taken from the same file content."""
+        return (
+            previous is not None
+            and previous["hash"] == entry["hash"]
+            and os.path.exists(cls.get_snapshot_path(snapshot_dir, file_path))
+        )
+
+    @classmethod
+    def get_snapshot_path(cls, snapshot_dir: str, file_path: str) -> str:
+        """Path to the snapshot of records from the specified preload file."""
+        filename = hashlib.sha256(os.path.normpath(file_path).encode("utf-8")).hexdigest()
+        return os.path.join(snapshot_dir, f"{filename}.bson")
+
+    @classmethod
+    def save_records(cls, snapshot_path: str, records: Sequence[RecordMixin]) -> None:
+        """Save records to the snapshot file after the source hash of modules that define their types."""
+        header = {"modules": cls._get_module_hashes(records)}
+        data = bson.encode(header, codec_options=_CODEC_OPTIONS) + b"".join(
+            bson.encode(_SERIALIZER.serialize(record), codec_options=_CODEC_OPTIONS) for record in records
+        )
+        cls._write_atomic(snapshot_path, data)
+
+    @classmethod
+    def load_records(cls, snapshot_path: str) -> tuple[RecordMixin, ...] | None:
+        """Load records from the snapshot file, or return None if a module that defines their types has changed."""
+        with open(snapshot_path, "rb") as file:
+            data = file.read()
+        header, *serialized_records = bson.decode_all(data, codec_options=_CODEC_OPTIONS)
+        if any(cls._get_module_hash(module_name) != module_hash for module_name, module_hash in header["modules"]):
+            return None
+        return tuple(_SERIALIZER.deserialize(x).build() for x in serialized_records)
+
+    @classmethod
+    def delete_records(cls, snapshot_path: str) -> None:
+        """Delete the snapshot file if it exists."""
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+
+    @classmethod
+    def _get_module_hashes(cls, records: Sequence[RecordMixin]) -> list[tuple[str, str]]:
+        """Return sorted module name and source hash pairs for the types of records, their fields and base classes."""
+        types = set()
+        cls._collect_types(records, types)
+        module_names = {base.__module__ for type_ in types for base in type_.__mro__ if base is not object}
+        return [(module_name, cls._get_module_hash(module_name)) for module_name in sorted(module_names)]
+
+    @classmethod
+    def _collect_types(cls, value: Any, types: set[type]) -> None:
+        """Add the types of data, keys, records and enums in the value and its fields to the set recursively."""
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                cls._collect_types(item, types)
+        elif isinstance(value, Mapping):
+            for item in value.values():
+                cls._collect_types(item, types)
+        elif isinstance(value, Enum):
+            types.add(type(value))
+        elif is_data_key_or_record_type(value_type := type(value)):
+            types.add(value_type)
+            for field_name in value.get_field_names():
+                cls._collect_types(getattr(value, field_name), types)
+
+    @classmethod
+    def _get_module_hash(cls, module_name: str) -> str:
+        """Return the hash of the source file for the module, or an empty string if it has no source file."""
+        if (result := _module_hash_dict.get(module_name)) is None:
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
+            if (module_path := getattr(module, "__file__", None)) is not None and os.path.exists(module_path):
+                with open(module_path, "rb") as file:
+                    result = hashlib.sha256(file.read()).hexdigest()
+            else:
+                result = ""
+            _module_hash_dict[module_name] = result
+        return result
+
+    @classmethod
+    def _write_atomic(cls, file_path: str, data: bytes) -> None:
+        """Write to a temporary file and then rename, so a partially written file is never observed."""
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, file_path)
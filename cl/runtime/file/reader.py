@@ -15,7 +15,9 @@
 from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
+from itertools import chain
 from typing import Sequence
+from cl.runtime.file.file_util import FileUtil
 from cl.runtime.file.reader_key import ReaderKey
 from cl.runtime.primitive.timestamp import Timestamp
 from cl.runtime.records.record_mixin import RecordMixin
@@ -34,7 +36,6 @@ class Reader(ReaderKey, RecordMixin, ABC):
         if self.reader_id is None:
             self.reader_id = Timestamp.create()
 
-    @abstractmethod
     def load_all(
         self,
         *,
@@ -56,3 +57,25 @@ class Reader(ReaderKey, RecordMixin, ABC):
         Raises:
             RuntimeError: If an error occurs during file reading or record loading
         """
+        file_paths = FileUtil.enumerate_files(
+            dirs=dirs,
+            ext=ext,
+            file_include_patterns=file_include_patterns,
+            file_exclude_patterns=file_exclude_patterns,
+        )
+
+        # Load each file and concatenate
+        return tuple(chain.from_iterable(self.load_file(file_path) for file_path in file_paths))
+
+    @abstractmethod
+    def load_file(self, file_path: str) -> tuple[RecordMixin, ...]:
+        """
+        Load records from a single file.
+
+        Args:
+            file_path: Absolute path to the file
+        Returns:
+            Tuple of loaded records
+        Raises:
+            RuntimeError: If an error occurs during file reading or record loading
+        """
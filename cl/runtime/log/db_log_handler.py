@@ -12,19 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging
 import traceback
 from logging import LogRecord
+from typing import Sequence
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.db.data_source import DataSource
 from cl.runtime.log.exceptions.user_error import UserError
 from cl.runtime.log.log_message import LogMessage
+from cl.runtime.log.queued_log_handler import QueuedLogHandler
 from cl.runtime.log.user_log_message import UserLogMessage
 from cl.runtime.primitive.case_util import CaseUtil
 
 
-class DbLogHandler(logging.Handler):
-    """Handler to save logs to db."""
+class DbLogHandler(QueuedLogHandler):
+    """Handler to save logs to db, log messages are saved in batches on a background thread unless queued=False."""
 
     @classmethod
     def _create_log_message(cls, record: LogRecord) -> LogMessage:
@@ -62,10 +63,11 @@ class DbLogHandler(logging.Handler):
             task_run_id=getattr(record, "task_run_id", None),
         ).build()
 
-    def emit(self, record):
-        try:
-            # Save LogMessage to current db context.
-            log_message = self._create_log_message(record)
-            active(DataSource).replace_one(log_message, commit=True)
-        except Exception:
-            self.handleError(record)
+    def _create_item(self, record: LogRecord) -> tuple[DataSource, tuple[LogMessage]]:
+        # Save LogMessage to current db context
+        return active(DataSource), (self._create_log_message(record),)
+
+    def _write_batch(self, target: DataSource, payloads: Sequence[LogMessage]) -> None:
+        # Save using a copy of the data source with its own pending operations, so that the commit
+        # does not include pending saves and deletes of the thread that logged the records
+        target.clone().build().replace_many(payloads, commit=True)
@@ -14,16 +14,18 @@
 
 import logging
 from logging import LogRecord
+from typing import Sequence
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.events.event import Event
 from cl.runtime.events.event_broker import EventBroker
 from cl.runtime.events.event_kind import EventKind
 from cl.runtime.events.log_event import LogEvent
+from cl.runtime.log.queued_log_handler import QueuedLogHandler
 from cl.runtime.primitive.case_util import CaseUtil
 
 
-class EventLogHandler(logging.Handler):
-    """Handler to publish log events."""
+class EventLogHandler(QueuedLogHandler):
+    """Handler to publish log events, events are published in batches on a background thread unless queued=False."""
 
     @classmethod
     def _create_log_event(cls, record: LogRecord) -> LogEvent:
@@ -41,19 +43,16 @@ class EventLogHandler(logging.Handler):
             task_run_id=getattr(record, "task_run_id", None),
         ).build()
 
-    def emit(self, record):
+    def _create_item(self, record: LogRecord) -> tuple[EventBroker, tuple[Event, ...]]:
+        log_event = self._create_log_event(record)
 
-        try:
-            # Publish log event
-            log_event = self._create_log_event(record)
-            event_broker = active(EventBroker)
-            event_broker.sync_publish("events", log_event)
+        # If log record level is Error or Warning - trigger additional Error or Warning event
+        if record.levelno >= logging.ERROR:
+            return active(EventBroker), (log_event, Event(event_kind=EventKind.ERROR).build())
+        elif record.levelno >= logging.WARNING:
+            return active(EventBroker), (log_event, Event(event_kind=EventKind.WARNING).build())
+        else:
+            return active(EventBroker), (log_event,)
 
-            # If log record level is Error or Warning - trigger additional Error or Warning event
-            if record.levelno >= logging.ERROR:
-                event_broker.sync_publish("events", Event(event_kind=EventKind.ERROR).build())
-            elif record.levelno >= logging.WARNING:
-                event_broker.sync_publish("events", Event(event_kind=EventKind.WARNING).build())
-
-        except Exception:
-            self.handleError(record)
+    def _write_batch(self, target: EventBroker, payloads: Sequence[Event]) -> None:
+        target.sync_publish_many("events", payloads)
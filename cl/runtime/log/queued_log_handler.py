@@ -0,0 +1,246 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+import weakref
+from abc import ABC
+from abc import abstractmethod
+from collections import deque
+from logging import LogRecord
+from typing import Any
+from typing import Sequence
+
+_handlers: weakref.WeakSet["QueuedLogHandler"] = weakref.WeakSet()
+"""Queued handlers created in this process, flushed together by QueuedLogHandler.flush_all."""
+
+
+class QueuedLogHandler(logging.Handler, ABC):
+    """
+    Base class for handlers that write log records in batches on a background thread.
+
+    Notes:
+        - Items are created on the logging thread because the target (e.g. DataSource) is taken from its context
+        - When the queue is full, the oldest DEBUG item is dropped to make room, if there is no DEBUG item
+          in the queue the new item is dropped, the number of dropped items is available from get_dropped_count
+        - Pass queued=False to write each record synchronously on the logging thread
+    """
+
+    _queued: bool
+    """If False, each record is written synchronously on the logging thread."""
+
+    _max_queue_size: int
+    """Maximum number of items waiting to be written, overflow policy applies when reached."""
+
+    _max_batch_size: int
+    """Maximum number of items written together, a batch is written immediately when this size is reached."""
+
+    _flush_interval_sec: float
+    """Maximum time an item waits in the queue before it is written if the batch is not full."""
+
+    _flush_timeout_sec: float
+    """Maximum time flush waits for the queued items to be written."""
+
+    _condition: threading.Condition
+    """Guards the fields below and wakes up the writer thread and the callers of flush."""
+
+    _items: deque[tuple[int, Any, tuple[Any, ...]]]
+    """Queued items as (levelno, target, payloads) tuples in the order of logging."""
+
+    _debug_count: int
+    """Number of DEBUG items in the queue, used to skip the search for a DEBUG item on overflow."""
+
+    _unfinished_count: int
+    """Number of items queued or being written, flush waits until it drops to zero."""
+
+    _dropped_count: int
+    """Number of items dropped due to overflow since the handler was created."""
+
+    _flush_requested: bool
+    """True if the writer should write all queued items without waiting for the flush interval."""
+
+    _closed: bool
+    """True after close, the writer thread exits when the queue is empty."""
+
+    _writer_thread: threading.Thread | None
+    """Background thread that writes the queued items, started on the first queued item."""
+
+    def __init__(
+        self,
+        level: int | str = logging.NOTSET,
+        *,
+        queued: bool = True,
+        max_queue_size: int = 10000,
+        max_batch_size: int = 100,
+        flush_interval_sec: float = 0.5,
+        flush_timeout_sec: float = 10.0,
+    ):
+        super().__init__(level)
+        if max_queue_size < 1:
+            raise RuntimeError(f"Parameter max_queue_size={max_queue_size} must be a positive integer.")
+        if max_batch_size < 1:
+            raise RuntimeError(f"Parameter max_batch_size={max_batch_size} must be a positive integer.")
+        self._queued = queued
+        self._max_queue_size = max_queue_size
+        self._max_batch_size = max_batch_size
+        self._flush_interval_sec = flush_interval_sec
+        self._flush_timeout_sec = flush_timeout_sec
+        self._dropped_count = 0
+        self._reset_queue()
+        _handlers.add(self)
+
+    @classmethod
+    def flush_all(cls) -> None:
+        """Write the items queued by all handlers in this process before returning."""
+        for handler in list(_handlers):
+            handler.flush()
+
+    @abstractmethod
+    def _create_item(self, record: LogRecord) -> tuple[Any, tuple[Any, ...]]:
+        """Return (target, payloads) for the record, invoked on the logging thread where its context is active."""
+
+    @abstractmethod
+    def _write_batch(self, target: Any, payloads: Sequence[Any]) -> None:
+        """Write payloads to the target, invoked on the writer thread or on the logging thread if not queued."""
+
+    def get_dropped_count(self) -> int:
+        """Number of items dropped due to overflow since the handler was created."""
+        return self._dropped_count
+
+    def emit(self, record: LogRecord) -> None:
+        try:
+            target, payloads = self._create_item(record)
+            if not self._queued or not self._enqueue(record.levelno, target, payloads):
+                # Write synchronously if not queued or after close, e.g. for records logged by atexit handlers
+                self._write_batch(target, payloads)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write the queued items before returning, waits at most flush_timeout_sec."""
+        with self._condition:
+            if self._unfinished_count == 0 or self._writer_thread is None:
+                return
+            self._flush_requested = True
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self._unfinished_count == 0, timeout=self._flush_timeout_sec)
+
+    def close(self) -> None:
+        """Write the queued items and stop the writer thread."""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        super().close()
+
+    def _enqueue(self, levelno: int, target: Any, payloads: tuple[Any, ...]) -> bool:
+        """Add item to the queue or drop it on overflow and return True, or return False if the handler is closed."""
+        with self._condition:
+            if self._closed:
+                return False
+            if len(self._items) >= self._max_queue_size and not self._make_room():
+                self._dropped_count += 1
+                return True
+            self._items.append((levelno, target, payloads))
+            self._unfinished_count += 1
+            if levelno <= logging.DEBUG:
+                self._debug_count += 1
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(target=self._run_writer, name=type(self).__name__, daemon=True)
+                self._writer_thread.start()
+            # Wake up the writer to start the flush interval or to write a full batch
+            if len(self._items) == 1 or len(self._items) >= self._max_batch_size:
+                self._condition.notify_all()
+            return True
+
+    def _make_room(self) -> bool:
+        """Drop the oldest queued DEBUG item and return True, or return False if there is no DEBUG item to drop."""
+        if self._debug_count == 0:
+            return False
+        for index, (queued_levelno, _, _) in enumerate(self._items):
+            if queued_levelno <= logging.DEBUG:
+                del self._items[index]
+                self._debug_count -= 1
+                self._unfinished_count -= 1
+                self._dropped_count += 1
+                return True
+        return False
+
+    def _run_writer(self) -> None:
+        """Write queued items in batches sized by count or by flush interval, runs on the writer thread."""
+        while True:
+            with self._condition:
+                deadline = time.monotonic() + self._flush_interval_sec
+                while not (self._closed or self._flush_requested or len(self._items) >= self._max_batch_size):
+                    if not self._items:
+                        # Wait for the first item, then start the flush interval
+                        self._condition.wait()
+                        deadline = time.monotonic() + self._flush_interval_sec
+                    elif (remaining_sec := deadline - time.monotonic()) > 0:
+                        self._condition.wait(remaining_sec)
+                    else:
+                        break
+
+                batch = [self._items.popleft() for _ in range(min(len(self._items), self._max_batch_size))]
+                self._debug_count -= sum(1 for levelno, _, _ in batch if levelno <= logging.DEBUG)
+                if not self._items:
+                    self._flush_requested = False
+                if not batch and self._closed:
+                    self._writer_thread = None
+                    return
+
+            try:
+                self._write_items(batch)
+            finally:
+                with self._condition:
+                    self._unfinished_count -= len(batch)
+                    self._condition.notify_all()
+
+    def _write_items(self, batch: list[tuple[int, Any, tuple[Any, ...]]]) -> None:
+        """Group items by target preserving the order of logging and write each group."""
+        groups: dict[int, tuple[Any, list[Any]]] = {}
+        for _, target, payloads in batch:
+            groups.setdefault(id(target), (target, []))[1].extend(payloads)
+        for target, payloads in groups.values():
+            try:
+                self._write_batch(target, payloads)
+            except Exception:  # noqa
+                # Follow logging.Handler.handleError, which cannot be used here because there is no single record
+                if logging.raiseExceptions and sys.stderr:
+                    sys.stderr.write(f"--- Logging error in {type(self).__name__} ---\n")
+                    traceback.print_exc(file=sys.stderr)
+
+    def _reset_queue(self) -> None:
+        """Create an empty queue and lock, invoked on construction and in the child process after fork."""
+        self._condition = threading.Condition()
+        self._items = deque()
+        self._debug_count = 0
+        self._unfinished_count = 0
+        self._flush_requested = False
+        self._closed = False
+        self._writer_thread = None
+
+
+def _reset_after_fork() -> None:
+    """The writer thread does not survive fork and the lock may be held by it, start with an empty queue."""
+    for handler in list(_handlers):
+        handler._reset_queue()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
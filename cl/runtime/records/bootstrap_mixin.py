@@ -23,7 +23,8 @@ from cl.runtime.serializers.slots_util import SlotsUtil
 class BootstrapMixin(BuilderMixin, ABC):
     """Dataclasses base for lightweight classes that do not require validation against the schema."""
 
-    __slots__ = ()
+    __slots__ = ("_frozen",)
+    """Frozen status of the instance, see BuilderMixin for details."""
 
     @classmethod
     @cached
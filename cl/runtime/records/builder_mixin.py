@@ -15,13 +15,15 @@
 import weakref
 from abc import ABC
 from abc import abstractmethod
+from types import MemberDescriptorType
+from typing import ClassVar
 from typing import Self
 from cl.runtime.records.cast_util import CastUtil
 from cl.runtime.records.protocols import TObj
 from cl.runtime.records.typename import typename
 
 _FROZEN_IDS = set()
-"""Global registry to track frozen status of Python object id's."""
+"""Global registry to track frozen status of Python object id's for classes without the '_frozen' slot."""
 
 _FROZEN_FINALIZERS = dict()
 """Adding a finalizer to this global dictionary prevents it from being collected before it is executed."""
@@ -29,11 +31,34 @@ _FROZEN_FINALIZERS = dict()
 
 # TODO: Consider renaming to BuilderMixin
 class BuilderMixin(ABC):
-    """Framework-neutral mixin for freezable fields and builder pattern support."""
+    """
+    Framework-neutral mixin for freezable fields and builder pattern support.
+
+    Notes:
+        - Frozen status is stored in the '_frozen' slot when a derived class declares it, this slot is declared
+          by BootstrapMixin and DataclassMixin and should be added to __slots__ of other slots-based classes
+        - It cannot be declared here because a slot in this class would conflict with the instance layout
+          of Pydantic BaseModel, for such classes frozen status is tracked in a global registry of object ids
+    """
 
     __slots__ = ("__weakref__",)
     """To prevent creation of __dict__ in derived types."""
 
+    _has_frozen_slot: ClassVar[bool] = False
+    """True if the class has the '_frozen' slot, otherwise frozen status is tracked in a global registry."""
+
+    def __init_subclass__(cls, **kwargs):
+        """Detect the '_frozen' slot once per class rather than for each instance."""
+        super().__init_subclass__(**kwargs)
+        cls._has_frozen_slot = isinstance(getattr(cls, "_frozen", None), MemberDescriptorType)
+
+    def __new__(cls, *args, **kwargs):
+        """Initialize the '_frozen' slot if present before __init__ assigns the fields."""
+        result = super().__new__(cls)
+        if cls._has_frozen_slot:
+            object.__setattr__(result, "_frozen", False)
+        return result
+
     @classmethod
     def default(cls) -> Self:
         """Create a default instance of this type, derived types may override."""
@@ -45,13 +70,21 @@ class BuilderMixin(ABC):
 
     def is_frozen(self) -> bool:
         """Return True if the instance has been frozen. Once frozen, the instance cannot be unfrozen."""
-        return id(self) in _FROZEN_IDS
+        if self._has_frozen_slot:
+            return self._frozen  # noqa Slot declared in a derived class
+        else:
+            return id(self) in _FROZEN_IDS
 
     def mark_frozen(self) -> Self:
         """
         Mark the instance as frozen without actually freezing it, which is the responsibility of build method.
         The action of marking the instance frozen cannot be reversed. Can be called more than once.
         """
+        if self._has_frozen_slot:
+            # Set the flag in the slot without allocating any objects
+            object.__setattr__(self, "_frozen", True)
+            return self
+
         # Add Python object ID of self the global frozen ID registry
         _FROZEN_IDS.add(oid := id(self))
         # Register a finalizer to remove object ID from the registry when the object is finalized
@@ -65,7 +98,7 @@ class BuilderMixin(ABC):
 
     def __setattr__(self, key, value):
         """Raise an error on attempt to modify a public field for a frozen instance."""
-        if self.is_frozen() and not key.startswith("_"):
+        if not key.startswith("_") and self.is_frozen():
             type_name = typename(type(self))
             raise RuntimeError(f"Cannot modify public field {type_name}.{key} because the instance is frozen.")
         object.__setattr__(self, key, value)
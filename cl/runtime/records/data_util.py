@@ -14,6 +14,7 @@
 
 from types import NoneType
 from typing import Any
+from typing import Callable
 from frozendict import frozendict
 from more_itertools import consume
 from cl.runtime.primitive.enum_util import EnumUtil
@@ -33,6 +34,21 @@ from cl.runtime.records.protocols import is_sequence_type
 from cl.runtime.records.typename import typename
 from cl.runtime.schema.type_hint import TypeHint
 
+_FieldBuilder = Callable[..., Any]
+"""Build a non-empty field value, accepts data and type hint followed by outer_type_name and field_name keywords."""
+
+_BuildPlan = tuple[tuple[str, TypeHint, type | None], ...]
+"""Tuple of (field_name, field_type_hint, passthrough_type) in the order of field declaration."""
+
+_INIT_METHODS_DICT: dict[type, tuple[Callable[[Any], None], ...]] = {}
+"""Unique '__init' methods in the order from base to derived for each data type."""
+
+_BUILD_PLAN_DICT: dict[type, _BuildPlan] = {}
+"""Build plan for each data type, created on first use of the type."""
+
+_FIELD_BUILDER_DICT: dict[type, _FieldBuilder] = {}
+"""Builder for each type of non-empty field value."""
+
 
 class DataUtil(BuilderUtil):
     """Helper methods for build functionality in DataMixin."""
@@ -98,18 +114,10 @@ class DataUtil(BuilderUtil):
                 return data
 
             # Invoke '__init' in the order from base to derived
-            # Keep track of which init methods in class hierarchy were already called
-            invoked = set()
-            # Reverse the MRO to start from base to derived
-            for type_ in reversed(data_type.__mro__):
-                # Remove leading underscores from the class name when generating mangling for __init
-                # to support classes that start from _ to mark them as protected
-                type_init = getattr(type_, f"_{type_.__name__.lstrip('_')}__init", None)
-                if type_init is not None and (qualname := type_init.__qualname__) not in invoked:
-                    # Add qualname to invoked to prevent executing the same method twice
-                    invoked.add(qualname)
-                    # Invoke '__init' method if it exists, otherwise do nothing
-                    type_init(data)
+            if (init_methods := _INIT_METHODS_DICT.get(data_type)) is None:
+                init_methods = _INIT_METHODS_DICT.setdefault(data_type, cls._get_init_methods(data_type))
+            for type_init in init_methods:
+                type_init(data)
 
             # Perform check against the schema if provided irrespective of the type inclusion setting
             if schema_type is not None and schema_type != data_type:
@@ -123,62 +131,98 @@ class DataUtil(BuilderUtil):
                     )
 
             # Freeze or make immutable all public fields, checking against the schema
-            data_type_spec = data.get_type_spec()
-            consume(
-                setattr(
-                    data,
-                    field_name := field_spec.field_name,
-                    (
-                        cls._checked_empty(  # Validates vs. the type hint while is_empty does not
-                            field_value,
-                            field_spec.field_type_hint,
-                            outer_type_name=typename(data_type),
-                            field_name=field_name,
-                        )
-                        if is_empty(field_value := getattr(data, field_name))
-                        else (
-                            PrimitiveUtil.build_(
-                                field_value,
-                                field_spec.field_type_hint,
-                                outer_type_name=typename(data_type),
-                                field_name=field_name,
-                            )
-                            if is_primitive_type(type(field_value))
-                            else (
-                                EnumUtil.build_(
-                                    field_value,
-                                    field_spec.field_type_hint,
-                                    outer_type_name=typename(data_type),
-                                    field_name=field_name,
-                                )
-                                if is_enum_type(type(field_value))
-                                else (
-                                    PredicateUtil.build_(
-                                        field_value,
-                                        field_spec.field_type_hint,
-                                        outer_type_name=typename(data_type),
-                                        field_name=field_name,
-                                    )
-                                    if is_predicate_type(type(field_value))
-                                    else cls.build_(
-                                        field_value,
-                                        field_spec.field_type_hint,
-                                        outer_type_name=typename(data_type),
-                                        field_name=field_name,
-                                    )
-                                )
-                            )
-                        )
-                    ),
-                )
-                for field_spec in data_type_spec.fields
-            )
+            if (build_plan := _BUILD_PLAN_DICT.get(data_type)) is None:
+                build_plan = _BUILD_PLAN_DICT.setdefault(data_type, cls._get_build_plan(data_type))
+            outer_type_name = typename(data_type)
+            for field_name, field_hint, passthrough_type in build_plan:
+                field_value = getattr(data, field_name)
+                if is_empty(field_value):
+                    # Validates vs. the type hint while is_empty does not
+                    built_value = cls._checked_empty(
+                        field_value, field_hint, outer_type_name=outer_type_name, field_name=field_name
+                    )
+                elif (field_type := type(field_value)) is passthrough_type:
+                    # Fast path for values that require no conversion or validation beyond their type
+                    continue
+                else:
+                    if (field_builder := _FIELD_BUILDER_DICT.get(field_type)) is None:
+                        field_builder = _FIELD_BUILDER_DICT.setdefault(field_type, cls._get_field_builder(field_type))
+                    built_value = field_builder(
+                        field_value, field_hint, outer_type_name=outer_type_name, field_name=field_name
+                    )
+
+                # Assign only if building the field produced a different object
+                if built_value is not field_value:
+                    setattr(data, field_name, built_value)
 
             # Mark as frozen and return
             return data.mark_frozen()
         else:
             raise cls._unsupported_object_error(data)
 
+    @classmethod
+    def _get_init_methods(cls, data_type: type) -> tuple[Callable[[Any], None], ...]:
+        """Return unique '__init' methods of the class hierarchy in the order from base to derived."""
+        result = []
+        # Keep track of which init methods in class hierarchy were already added
+        added = set()
+        # Reverse the MRO to start from base to derived
+        for type_ in reversed(data_type.__mro__):
+            # Remove leading underscores from the class name when generating mangling for __init
+            # to support classes that start from _ to mark them as protected
+            type_init = getattr(type_, f"_{type_.__name__.lstrip('_')}__init", None)
+            if type_init is not None and (qualname := type_init.__qualname__) not in added:
+                # Add qualname to prevent executing the same method twice
+                added.add(qualname)
+                result.append(type_init)
+        return tuple(result)
+
+    @classmethod
+    def _get_build_plan(cls, data_type: type) -> _BuildPlan:
+        """Create (field_name, field_type_hint, passthrough_type) for each field of the data type."""
+        return tuple(
+            (
+                field_spec.field_name,
+                field_hint := field_spec.field_type_hint,
+                # A str value in a str field without subtype is returned unchanged by PrimitiveUtil.build_
+                (
+                    str
+                    if field_hint.schema_type is str and field_hint.subtype is None and not field_hint.remaining
+                    else None
+                ),
+            )
+            for field_spec in data_type.get_type_spec().fields
+        )
+
+    @classmethod
+    def _get_field_builder(cls, field_type: type) -> _FieldBuilder:
+        """Return the builder for a non-empty field value of the specified type."""
+        if is_primitive_type(field_type):
+            return PrimitiveUtil.build_
+        elif is_enum_type(field_type):
+            return EnumUtil.build_
+        elif is_predicate_type(field_type):
+            return PredicateUtil.build_
+        elif is_data_key_or_record_type(field_type):
+            return cls._build_data_field
+        else:
+            return cls.build_
+
+    @classmethod
+    def _build_data_field(
+        cls,
+        data: Any,
+        type_hint: TypeHint | None = None,
+        *,
+        outer_type_name: str | None = None,
+        field_name: str | None = None,
+    ) -> Any:
+        """Build a data, key or record field, return without further checks if already frozen (e.g., a key)."""
+        if data.is_frozen():
+            return data
+        else:
+            return cls.build_(data, type_hint, outer_type_name=outer_type_name, field_name=field_name)
+
     @classmethod
     def _checked_empty(  # Move to NoneUtils
         cls,
@@ -26,7 +26,8 @@ from cl.runtime.serializers.slots_util import SlotsUtil
 class DataclassMixin(DataMixin, ABC):
     """Implements abstract methods in DataMixin for dataclass-based data, key or record classes."""
 
-    __slots__ = ()
+    __slots__ = ("_frozen",)
+    """Frozen status of the instance, see BuilderMixin for details."""
 
     @classmethod
     @cached
@@ -0,0 +1,73 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import TypeVar
+from cl.runtime.settings.api_settings import ApiSettings
+
+TResult = TypeVar("TResult")
+"""Return type of the function invoked in the thread pool."""
+
+_executor: ThreadPoolExecutor | None = None
+"""Thread pool shared by all routes in this process, created on first use."""
+
+_executor_lock = threading.Lock()
+"""Lock for creating and shutting down the thread pool."""
+
+
+class RouteExecutor:
+    """
+    Runs synchronous route implementations in a thread pool so they do not block the event loop.
+
+    Notes:
+        - The pool size is specified by ApiSettings.api_max_workers
+        - The function runs in a copy of the calling contextvars context, so the contexts active
+          in the route (Env, DataSource, EventBroker, etc.) are also active in the worker thread
+        - Contexts are propagated without ContextSnapshot because entering the snapshot would invoke
+          __enter__ and __exit__ of each context again, for example commit the DataSource on exit
+    """
+
+    @classmethod
+    async def run(cls, func: Callable[..., TResult], *args, **kwargs) -> TResult:
+        """Invoke func(*args, **kwargs) in the thread pool with the active contexts and await the result."""
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._get_executor(), functools.partial(context.run, func, *args, **kwargs))
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Wait for the running calls to complete and release the threads, the pool is recreated on next use."""
+        global _executor
+        with _executor_lock:
+            if _executor is not None:
+                _executor.shutdown(wait=True)
+                _executor = None
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Return the thread pool, create if it does not yet exist."""
+        global _executor
+        if _executor is None:
+            with _executor_lock:
+                if _executor is None:
+                    _executor = ThreadPoolExecutor(
+                        max_workers=ApiSettings.instance().api_max_workers,
+                        thread_name_prefix="RouteExecutor",
+                    )
+        return _executor
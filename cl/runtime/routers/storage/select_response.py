@@ -17,6 +17,7 @@ from enum import Enum
 from typing import Any
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.db.data_source import DataSource
+from cl.runtime.db.query_mixin import QueryMixin
 from cl.runtime.primitive.case_util import CaseUtil
 from cl.runtime.records.protocols import is_key_type
 from cl.runtime.records.protocols import is_primitive_type
@@ -34,55 +35,93 @@ from cl.runtime.serializers.key_serializers import KeySerializers
 class SelectResponse(RecordsWithSchemaResponse):
     """Response data type for the /storage/select route."""
 
+    total_count: int | None = None
+    """Total number of records matching the request, used for pagination when 'skip' or 'limit' is specified."""
+
     @classmethod
     def get_response(cls, request: SelectRequest) -> SelectResponse:
         """Implements /storage/select route."""
 
-        if request.query_dict:
-            raise RuntimeError("Select with 'query_dict' currently is not supported.")
-
         if request.table_format is False:
             raise RuntimeError("Select with 'table_format=False' currently is not supported.")
 
-        if request.skip != 0:
-            raise RuntimeError("Select with 'skip != 0' currently is not supported.")
+        if request.skip < 0:
+            raise RuntimeError(f"Select with skip={request.skip} is not supported, 'skip' must not be negative.")
 
-        if request.limit is not None:
-            raise RuntimeError("Select with 'limit' currently is not supported.")
+        if request.limit is not None and request.limit < 0:
+            raise RuntimeError(f"Select with limit={request.limit} is not supported, 'limit' must not be negative.")
 
         ds = active(DataSource)
 
+        # Load only the requested page, skip and limit are applied by the database
+        skip = request.skip if request.skip else None
+        limit = request.limit
+
         # TODO(Roman): !!! Implement separate methods for table and type
         if (type_kind := TypeInfo.get_type_name_info(type_name=request.type_).type_kind) == TypeKind.RECORD:
             # Get records for a type
             record_type_name = request.type_
             record_type = TypeInfo.from_type_name(record_type_name)
-            # Load records for the type
-            records = ds.load_by_type(record_type)
+            key_type = record_type.get_key_type()
+            restrict_to = record_type
             common_base_record_type = record_type
         elif type_kind == TypeKind.KEY:
             # Get records for a table
             key_type_name = request.type_
             key_type = TypeInfo.from_type_name(key_type_name)
-            records = ds.load_all(key_type)
-
-            if records:
-                # Get the common type of the records stored in the table
-                record_types = [type(record) for record in records]
-                common_base_record_type = TypeInfo.get_common_base_type(types=record_types)
-            else:
-                # Default to key type when there are no records
-                common_base_record_type = key_type
+            restrict_to = None
+            # Get the common type of the records stored in the table from record type presence without loading them
+            common_base_record_type = ds.get_common_base_record_type(key_type=key_type)
         else:
             raise RuntimeError(f"Type {request.type_} is neither a record nor a key.")
 
+        if request.query_dict:
+            # Load records and count using the query
+            query = cls._deserialize_query(request.query_dict, key_type=key_type)
+            records = ds.load_by_query(query, restrict_to=restrict_to, limit=limit, skip=skip)
+            total_count = ds.count_by_query(query, restrict_to=restrict_to)
+        else:
+            # Load records and count for the table, restricted to the type if specified
+            records = ds.load_all(key_type, restrict_to=restrict_to, limit=limit, skip=skip)
+            if skip is None and (limit is None or len(records) < limit):
+                # All records have been loaded, no need to count in the database
+                total_count = len(records)
+            else:
+                total_count = ds.count_all(key_type, restrict_to=restrict_to)
+
         # Serialize records for table.
         serialized_records = [cls._serialize_record_for_table(record) for record in records]
 
         # Get schema dict for type.
         schema_dict = cls._get_schema_dict(common_base_record_type)
 
-        return SelectResponse(schema_=schema_dict, data=serialized_records)  # noqa
+        return SelectResponse(schema_=schema_dict, data=serialized_records, total_count=total_count)  # noqa
+
+    @classmethod
+    def _deserialize_query(cls, query_dict: dict[str, Any], *, key_type: type) -> QueryMixin:
+        """Deserialize query from UI format, the query type is specified by '_t' and must target the key type."""
+
+        # Only field values matched for equality are supported, predicates have no UI serialization format
+        for field_name, field_value in query_dict.items():
+            if isinstance(field_value, dict) and (predicate_type_name := field_value.get("_t", None)) is not None:
+                raise RuntimeError(
+                    f"Select with 'query_dict' does not support predicate {predicate_type_name} "
+                    f"for field {field_name}, specify the field value to match instead."
+                )
+
+        query = DataSerializers.FOR_UI.deserialize(query_dict)
+        if not isinstance(query, QueryMixin):
+            raise RuntimeError(
+                f"Select with 'query_dict' of type {typename(type(query))} is not supported, "
+                f"'_t' must specify a query type."
+            )
+        query.build()
+        if (query_key_type := query.get_target_type().get_key_type()) != key_type:
+            raise RuntimeError(
+                f"Select with 'query_dict' of type {typename(type(query))} is not supported for {typename(key_type)}, "
+                f"the query targets {typename(query_key_type)}."
+            )
+        return query
 
     @classmethod
     def _serialize_record_for_table(cls, record: RecordMixin) -> dict[str, Any]:
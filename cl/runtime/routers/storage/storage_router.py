@@ -17,6 +17,7 @@ from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Header
 from fastapi import Query
+from cl.runtime.routers.route_executor import RouteExecutor
 from cl.runtime.routers.storage.datasets_request import DatasetsRequest
 from cl.runtime.routers.storage.datasets_response_item import DatasetsResponseItem
 from cl.runtime.routers.storage.delete_request import DeleteRequest
@@ -48,7 +49,9 @@ async def get_datasets(
     environment: Annotated[str, Header(description="Name of the environment (database).")] = None,
 ) -> list[DatasetsResponseItem]:
     """Information about the environments."""
-    return DatasetsResponseItem.get_datasets(DatasetsRequest(env=environment, type_name=type_name))
+    return await RouteExecutor.run(
+        DatasetsResponseItem.get_datasets, DatasetsRequest(env=environment, type_name=type_name)
+    )
 
 
 @router.post("/load", response_model=LoadResponse)
@@ -60,7 +63,8 @@ async def post_load(
 ) -> LoadResponse:
     """Bulk load records by list of keys."""
 
-    return LoadResponse.get_response(
+    return await RouteExecutor.run(
+        LoadResponse.get_response,
         LoadRequest(
             load_keys=load_keys,
             ignore_not_found=ignore_not_found,
@@ -79,10 +83,8 @@ async def post_select(
 ) -> SelectResponse:
     """Select records by query."""
 
-    # TODO (Roman): Support select with 'limit'.
-    limit = None
-
-    return SelectResponse.get_response(
+    return await RouteExecutor.run(
+        SelectResponse.get_response,
         SelectRequest(
             type_=select_body.type,
             query_dict=select_body.query_dict if select_body.query_dict else None,
@@ -99,7 +101,7 @@ async def post_delete(
 ) -> list[KeyRequestItem]:
     """Bulk delete records by list of keys."""
 
-    return DeleteResponseUtil.delete_records(DeleteRequest(delete_keys=delete_keys))
+    return await RouteExecutor.run(DeleteResponseUtil.delete_records, DeleteRequest(delete_keys=delete_keys))
 
 
 @router.post("/save", response_model=list[KeyRequestItem])
@@ -108,7 +110,7 @@ async def post_save(
 ) -> list[KeyRequestItem]:
     """Bulk save records to DB. Don't check if the record already exists."""
 
-    return SaveResponseUtil.save_records(SaveRequest(records=records))
+    return await RouteExecutor.run(SaveResponseUtil.save_records, SaveRequest(records=records))
 
 
 @router.post("/update", response_model=list[KeyRequestItem])
@@ -23,6 +23,7 @@ from cl.runtime.records.protocols import is_key_type
 from cl.runtime.records.protocols import is_primitive_type
 from cl.runtime.records.protocols import is_sequence_type
 from cl.runtime.routers.task.run_request import RunRequest
+from cl.runtime.schema.type_info import TypeInfo
 from cl.runtime.serializers.data_serializers import DataSerializers
 from cl.runtime.tasks.instance_method_task import InstanceMethodTask
 from cl.runtime.tasks.task_util import TaskUtil
@@ -31,6 +32,7 @@ from cl.runtime.views.key_view import KeyView
 from cl.runtime.views.record_list_view import RecordListView
 from cl.runtime.views.record_view import RecordView
 from cl.runtime.views.view import View
+from cl.runtime.views.view_cache import ViewCache
 
 _ui_serializer = DataSerializers.FOR_UI
 
@@ -64,21 +66,45 @@ class RunResponseUtil:
             if not isinstance(method_task, InstanceMethodTask):
                 raise RuntimeError("Static view methods is not supported.")
 
+            # Check the declared type first to avoid loading the record for the views that are not cached
+            if method_task.method_args is None and ViewCache.is_cached_view(
+                TypeInfo.from_type_name(request.type), method_task.method_name
+            ):
+                record = active(DataSource).load_one_or_none(method_task.key)
+                if record is not None and ViewCache.is_cached_view(type(record), method_task.method_name):
+                    # Return the cached response, run task only if not cached for the current version of the record
+                    return ViewCache.get_response(
+                        record,
+                        view_name=method_task.method_name,
+                        create_response=lambda: cls._serialize_result(cls._run_view_task(method_task)),
+                    )
+
+            result = cls._run_view_task(method_task)
+
+        else:
             # Run task in process
-            # TODO (Roman): Check for Dynamic View and load from DB instead of running Task
             result = method_task.run_task_in_process()
 
-            # Process viewer result according to conventions
-            result = cls._process_viewer_result(result, view_for=method_task.key, view_name=method_task.method_name)
+        return cls._serialize_result(result)
 
-            # Build Data object
-            if result and is_data_key_or_record_type(type(result)):
-                result.build()
+    @classmethod
+    def _run_view_task(cls, method_task: InstanceMethodTask) -> Any:
+        """Run view method task in process and process the result according to conventions."""
 
-        else:
-            # Run task in process
-            result = method_task.run_task_in_process()
+        # Run task in process
+        result = method_task.run_task_in_process()
+
+        # Process viewer result according to conventions
+        result = cls._process_viewer_result(result, view_for=method_task.key, view_name=method_task.method_name)
 
+        # Build Data object
+        if result and is_data_key_or_record_type(type(result)):
+            result.build()
+        return result
+
+    @classmethod
+    def _serialize_result(cls, result: Any) -> Any:
+        """Serialize task result for the response."""
         if isinstance(result, PydanticMixin):
             # Do not serialize PydanticMixin instances, since it is supported by FastAPI
             return result
@@ -16,6 +16,7 @@ from typing import Annotated
 from typing import Any
 from fastapi import APIRouter
 from fastapi import Body
+from cl.runtime.routers.route_executor import RouteExecutor
 from cl.runtime.routers.task.cancel_request import CancelRequest
 from cl.runtime.routers.task.cancel_response_item import CancelResponseItem
 from cl.runtime.routers.task.result_request import ResultRequest
@@ -39,7 +40,8 @@ async def post_run(
 ) -> Any:
     """Route to run Task and return result in Response."""
 
-    return RunResponseUtil.get_response(
+    return await RouteExecutor.run(
+        RunResponseUtil.get_response,
         RunRequest(
             type=run_body.type,
             method=run_body.method,
@@ -55,7 +57,8 @@ async def post_submit(
 ) -> list[SubmitResponseItem]:
     """Route to bulk submit Tasks and return task_run_id's in Response."""
 
-    return SubmitResponseItem.get_response(
+    return await RouteExecutor.run(
+        SubmitResponseItem.get_response,
         SubmitRequest(
             type=submit_body.type,
             method=submit_body.method,
@@ -71,7 +74,8 @@ async def post_cancel(
 ) -> list[CancelResponseItem]:
     """Cancel tasks by run ids."""
 
-    return CancelResponseItem.get_response(
+    return await RouteExecutor.run(
+        CancelResponseItem.get_response,
         CancelRequest(
             task_run_ids=task_run_ids.task_run_ids,
         )
@@ -82,7 +86,8 @@ async def post_cancel(
 async def post_cancel_all() -> list[CancelResponseItem]:
     """Cancel all running tasks."""
 
-    return CancelResponseItem.get_response(
+    return await RouteExecutor.run(
+        CancelResponseItem.get_response,
         CancelRequest(
             task_run_ids=[],  # Empty list for cancel_all
             cancel_all=True,
@@ -96,7 +101,8 @@ async def post_status(
 ) -> list[StatusResponseItem]:
     """Bulk request task statuses by run ids."""
 
-    return StatusResponseItem.get_response(
+    return await RouteExecutor.run(
+        StatusResponseItem.get_response,
         StatusRequest(
             task_run_ids=task_run_ids.task_run_ids,
         )
@@ -109,7 +115,8 @@ async def post_result(
 ) -> list[ResultResponseItem]:
     """Bulk request task results by run ids."""
 
-    return ResultResponseItem.get_response(
+    return await RouteExecutor.run(
+        ResultResponseItem.get_response,
         ResultRequest(
             task_run_ids=task_run_ids.task_run_ids,
         )
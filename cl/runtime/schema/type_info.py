@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import marshal
 import os
 import sys
 from dataclasses import dataclass
@@ -51,6 +52,9 @@ _TYPE_INFO_HEADERS = (
 )
 """Headers of TypeInfo preload file."""
 
+_REGISTRY_VERSION = 1
+"""Version of the precompiled TypeInfo registry format, the registry is regenerated when written by another version."""
+
 
 def is_schema_type(type_: type) -> bool:
     """Return true if the type should be included in schema, includes data types (except mixin types) and enums."""
@@ -88,6 +92,9 @@ class TypeInfo(BootstrapMixin):
     _module_dict: ClassVar[dict[str, ModuleType] | None] = None
     """Dictionary of modules indexed by module name in dot-delimited format."""
 
+    _key_record_type_names_dict: ClassVar[dict[str, tuple[str, ...]] | None] = None
+    """Record type names for each key type name, sorted by depth in hierarchy."""
+
     def __init(self) -> None:
         """Use instead of __init__ in the builder pattern, invoked by the build method in base to derived order."""
         if self.type_ is None:
@@ -171,8 +178,8 @@ class TypeInfo(BootstrapMixin):
             # If type_kind is None, only check if present in dict
             found = type_name in cls._type_info_dict
         else:
-            # Otherwise get type_info
-            type_info = cls._type_info_dict.get(type_name).build()
+            # Otherwise get type_info, type kind is known without importing the type
+            type_info = cls._type_info_dict.get(type_name)
             if found := type_info is not None:
                 # Type found in cache, compare type_kind
                 if type_info.type_kind == type_kind:
@@ -272,7 +279,7 @@ class TypeInfo(BootstrapMixin):
         if (type_info := cls._type_info_dict.get(type_name, None)) is not None:
             result = type_info.parent_record_type_names or ()
             if type_kind is not None:
-                result = tuple(x for x in result if cls.get_type_name_info(x).type_kind == type_kind)
+                result = tuple(x for x in result if cls._type_info_dict[x].type_kind == type_kind)
             return result
         else:
             raise cls._type_name_not_found_error(type_name)
@@ -316,10 +323,14 @@ class TypeInfo(BootstrapMixin):
 
         # Get from cached TypeInfo
         if (type_info := cls._type_info_dict.get(type_name, None)) is not None:
+            if type_kind == TypeKind.RECORD and (result := cls._key_record_type_names_dict.get(type_name)) is not None:
+                # Use precomputed index for record types of a key type, already sorted by depth in hierarchy
+                return result
+
             child_record_type_names = type_info.child_record_type_names
             if type_kind is not None:
                 child_record_type_names = tuple(
-                    x for x in child_record_type_names if cls.get_type_name_info(x).type_kind == type_kind
+                    x for x in child_record_type_names if cls._type_info_dict[x].type_kind == type_kind
                 )
 
             # Sort child types by depth in hierarchy
@@ -397,6 +408,11 @@ class TypeInfo(BootstrapMixin):
         # Clear the existing data
         cls._clear()
 
+        # Invalidate serializer plans compiled for the previously loaded types
+        from cl.runtime.serializers.data_serializer import DataSerializer  # TODO: Avoid circular dependency
+
+        DataSerializer.clear_plans()
+
         # Set the packages variable
         packages = tuple(packages)
         if not packages:
@@ -404,9 +420,11 @@ class TypeInfo(BootstrapMixin):
 
         # Add each class after performing checks for duplicates
         consume(cls._add_type(type_) for type_ in ImportUtil.get_types(packages=packages, predicate=is_schema_type))
+        cls._build_key_record_type_names()
 
-        # Overwrite the cache file on disk with the new data
+        # Overwrite the cache file and the precompiled registry on disk with the new data
         cls._save()
+        cls._save_registry()
 
     @classmethod
     def _get_type_kind(cls, type_: type) -> TypeKind | None:
@@ -442,7 +460,9 @@ class TypeInfo(BootstrapMixin):
     def _build_parent_type_names(cls, type_: type) -> tuple[str, ...]:
         """Return a tuple superclasses (inclusive of self) that match the predicate, not cached."""
         # Eliminate duplicates (they should not be present but just to be sure) and sort the names in MRO list
-        return tuple(sorted(set(typename(x) for x in cls._get_data_key_or_record_types(types_=type_.mro(), type_kind=None))))
+        return tuple(
+            sorted(set(typename(x) for x in cls._get_data_key_or_record_types(types_=type_.mro(), type_kind=None)))
+        )
 
     @classmethod
     def _add_type(cls, type_: type, *, subtype: str | None = None) -> None:
@@ -516,15 +536,29 @@ class TypeInfo(BootstrapMixin):
         # Clear cache before loading
         cls._clear()
 
+        # Check that the cache file exists
+        cache_filename = cls._get_preload_filename()
+        if not os.path.exists(cache_filename):
+            raise RuntimeError(f"TypeInfo file is not found at {cache_filename}\n, run init_type_info to create.")
+
+        # Load from the precompiled registry in a single read if it is up to date with the cache file
+        if cls._load_registry():
+            return
+
+        # Otherwise parse the cache file and regenerate the registry for the next process
+        cls._load_csv()
+        cls._build_key_record_type_names()
+        cls._save_registry()
+
+    @classmethod
+    def _load_csv(cls) -> None:
+        """Load the data from TypeInfo.csv."""
+
         # Read from the cache file
         # TODO: !!!!!!!! Move to CsvUtil
         cache_filename = cls._get_preload_filename()
-        if os.path.exists(cache_filename):
-            with open(cache_filename, "r", encoding="utf-8") as file:
-                rows = file.readlines()
-        else:
-            # Cache file does not exist, error message
-            raise RuntimeError(f"TypeInfo file is not found at {cache_filename}\n, run init_type_info to create.")
+        with open(cache_filename, "r", encoding="utf-8") as file:
+            rows = file.readlines()
 
         # Iterate over the rows of TypeInfo preload
         for row_index, row in enumerate(rows):
@@ -547,7 +581,9 @@ class TypeInfo(BootstrapMixin):
                 # Parse a type info row
                 if len(row_tokens) == len(_TYPE_INFO_HEADERS):
                     # Extract the type name and qual name from the tokens
-                    type_name, type_kind, qual_name, subtype, parent_record_type_names, child_record_type_names = row_tokens
+                    type_name, type_kind, qual_name, subtype, parent_record_type_names, child_record_type_names = (
+                        row_tokens
+                    )
                 else:
                     expected_num_tokens = len(_TYPE_INFO_HEADERS)
                     actual_num_tokens = len(row_tokens)
@@ -614,13 +650,114 @@ class TypeInfo(BootstrapMixin):
                 )
 
                 # Write comma-separated values for each token, with semicolons-separated lists
-                file.write(f"{type_name},{type_kind_str},{qual_name},{subtype},{parent_record_type_names_str},{child_record_type_names_str}\n")
+                file.write(
+                    f"{type_name},{type_kind_str},{qual_name},{subtype},"
+                    f"{parent_record_type_names_str},{child_record_type_names_str}\n"
+                )
+
+    @classmethod
+    def _load_registry(cls) -> bool:
+        """Load from the precompiled registry, return False if it does not exist or is out of date with TypeInfo.csv."""
+        registry_filename = cls._get_registry_filename()
+        if not os.path.exists(registry_filename):
+            return False
+        try:
+            with open(registry_filename, "rb") as file:
+                registry = marshal.loads(file.read())
+        except (EOFError, ValueError, TypeError):
+            # Treat a corrupted registry as missing
+            return False
+
+        # Check that the registry was generated from the current version of TypeInfo.csv
+        cache_stat = os.stat(cls._get_preload_filename())
+        if (
+            not isinstance(registry, dict)
+            or registry.get("version") != _REGISTRY_VERSION
+            or registry.get("csv_mtime_ns") != cache_stat.st_mtime_ns
+            or registry.get("csv_size") != cache_stat.st_size
+        ):
+            return False
+
+        # Create TypeInfo objects without invoking build, the module is imported when the type is first used
+        cls._type_info_dict = {
+            type_name: TypeInfo(
+                type_name=type_name,
+                type_kind=TypeKind[type_kind],
+                qual_name=qual_name,
+                subtype=subtype,
+                parent_record_type_names=parent_record_type_names,
+                child_record_type_names=child_record_type_names,
+            )
+            for (
+                type_name,
+                type_kind,
+                qual_name,
+                subtype,
+                parent_record_type_names,
+                child_record_type_names,
+            ) in registry["rows"]
+        }
+        cls._key_record_type_names_dict = registry["key_record_type_names"]
+        return True
+
+    @classmethod
+    def _save_registry(cls) -> None:
+        """Save the precompiled registry for the current version of TypeInfo.csv (overwrites the existing file)."""
+        cache_stat = os.stat(cls._get_preload_filename())
+        registry = {
+            "version": _REGISTRY_VERSION,
+            "csv_mtime_ns": cache_stat.st_mtime_ns,
+            "csv_size": cache_stat.st_size,
+            "rows": tuple(
+                (
+                    type_info.type_name,
+                    type_info.type_kind.name,
+                    type_info.qual_name,
+                    type_info.subtype,
+                    type_info.parent_record_type_names,
+                    type_info.child_record_type_names,
+                )
+                for type_info in sorted(cls._type_info_dict.values(), key=lambda x: x.type_name)
+            ),
+            "key_record_type_names": cls._key_record_type_names_dict,
+        }
+
+        # Write to a temporary file and rename so other processes never observe a partially written registry
+        registry_filename = cls._get_registry_filename()
+        temp_filename = f"{registry_filename}.{os.getpid()}.tmp"
+        try:
+            with open(temp_filename, "wb") as file:
+                file.write(marshal.dumps(registry))
+            os.replace(temp_filename, registry_filename)
+        except OSError:
+            # The registry is an optimization, continue without it if the resources directory is read-only
+            pass
+
+    @classmethod
+    def _build_key_record_type_names(cls) -> None:
+        """Build the index of record type names for each key type name, sorted by depth in hierarchy."""
+        cls._key_record_type_names_dict = {
+            type_info.type_name: tuple(
+                sorted(
+                    (
+                        x
+                        for x in type_info.child_record_type_names or ()
+                        if (child_info := cls._type_info_dict.get(x)) is not None
+                        and child_info.type_kind == TypeKind.RECORD
+                    ),
+                    key=lambda x: len(cls._type_info_dict[x].parent_record_type_names or ()),
+                )
+            )
+            for type_info in cls._type_info_dict.values()
+            if type_info.type_kind == TypeKind.KEY
+        }
 
     @classmethod
     def _clear(cls) -> None:
         """Clear cache before loading or rebuilding."""
         cls._type_info_dict = {}
         cls._module_dict = {}
+        cls._key_record_type_names_dict = {}
 
     @classmethod
     def _get_preload_filename(cls) -> str:
@@ -629,6 +766,13 @@ class TypeInfo(BootstrapMixin):
         result = os.path.join(resources_root, "bootstrap/TypeInfo.csv")
         return result
 
+    @classmethod
+    def _get_registry_filename(cls) -> str:
+        """Get the filename for the precompiled registry generated from TypeInfo.csv."""
+        resources_root = ProjectLayout.get_resources_root()
+        result = os.path.join(resources_root, "bootstrap/TypeInfo.bin")
+        return result
+
     @classmethod
     def _get_type(cls, type_or_name: type | str) -> type:
         """Convert to type if provided as nas, passthrough if already a type."""
@@ -703,12 +847,16 @@ class TypeInfo(BootstrapMixin):
         try:
             # Get class from module
             result = getattr(module, type_name)
-            # Add to the qual_name and type_name dictionaries
-            cls._add_type(result)
-            return result
         except AttributeError:
             raise RuntimeError(f"Class {qual_name} is not found in TypeInfo, run init_type_info to rebuild.")
 
+        # Add to the qual_name and type_name dictionaries unless already loaded from the registry or TypeInfo.csv,
+        # skipping the traversal of the class hierarchy performed by _add_type
+        existing_info = cls._type_info_dict.get(typename(result))
+        if existing_info is None or existing_info.qual_name != qual_name:
+            cls._add_type(result)
+        return result
+
     @classmethod
     def _type_name_not_found_error(cls, type_name: str) -> RuntimeError:
         """Return error message for type name not found."""
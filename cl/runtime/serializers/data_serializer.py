@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
+from typing import Callable
+from typing import ClassVar
 import numpy as np
 from frozendict import frozendict
 from cl.runtime.exceptions.error_util import ErrorUtil
@@ -33,13 +36,48 @@ from cl.runtime.records.typename import typeof
 from cl.runtime.schema.data_spec import DataSpec
 from cl.runtime.schema.type_hint import TypeHint
 from cl.runtime.schema.type_info import TypeInfo
+from cl.runtime.schema.type_kind import TypeKind
 from cl.runtime.schema.type_schema import TypeSchema
 from cl.runtime.serializers.encoder import Encoder
+from cl.runtime.serializers.ndarray_format import NdarrayFormat
 from cl.runtime.serializers.serializer import Serializer
 from cl.runtime.serializers.type_format import TypeFormat
 from cl.runtime.serializers.type_inclusion import TypeInclusion
 from cl.runtime.serializers.type_placement import TypePlacement
 
+_FieldEncoder = Callable[[Any], Any]
+"""Serialize a non-empty field value using the type hint of the field."""
+
+_FieldDecoder = Callable[[Any], Any]
+"""Deserialize a non-empty serialized field value using the type hint of the field."""
+
+_SerializePlan = tuple[tuple[str, str, _FieldEncoder], ...]
+"""Tuple of (field_name, serialized_key, encoder) in the order of field declaration."""
+
+_DeserializePlan = tuple[type, dict[str, tuple[str, _FieldDecoder]], dict[str, tuple[str, _FieldDecoder]]]
+"""Tuple of (schema_class, field_name to (field_name, decoder), serialized_key to (field_name, decoder))."""
+
+_VALUE_KIND_DICT: dict[type, TypeKind | None] = {}
+"""Kind of field value type used to select the serializer (PRIMITIVE, ENUM, KEY, or None for other types)."""
+
+
+def _get_value_kind(value_type: type) -> TypeKind | None:
+    """Return PRIMITIVE, ENUM, KEY, or None for other types, cached for each value type."""
+    try:
+        return _VALUE_KIND_DICT[value_type]
+    except KeyError:
+        if is_primitive_type(value_type) or issubclass(value_type, type):
+            # Metaclasses of type are serialized as primitive type
+            result = TypeKind.PRIMITIVE
+        elif is_enum_type(value_type):
+            result = TypeKind.ENUM
+        elif is_key_type(value_type):
+            result = TypeKind.KEY
+        else:
+            result = None
+        _VALUE_KIND_DICT[value_type] = result
+        return result
+
 
 @dataclass(slots=True, kw_only=True)
 class DataSerializer(Serializer):
@@ -75,6 +113,21 @@ class DataSerializer(Serializer):
     pascalize_keys: bool | None = None
     """Pascalize keys during serialization if set."""
 
+    ndarray_format: NdarrayFormat = NdarrayFormat.DEFAULT
+    """Format used to serialize ndarray, deserialization accepts any format (optional, defaults to DEFAULT)."""
+
+    _serialize_plans: dict[type, _SerializePlan] | None = None
+    """Compiled serialization plan for each data type, created on first use of the type."""
+
+    _deserialize_plans: dict[type, _DeserializePlan] | None = None
+    """Compiled deserialization plan for each data type, created on first use of the type."""
+
+    _plans_generation: int | None = None
+    """Value of _current_plans_generation when the plans were created."""
+
+    _current_plans_generation: ClassVar[int] = 0
+    """Incremented by clear_plans to invalidate the plans of all serializer instances."""
+
     def __validate(self) -> None:
         """Perform checks without changing the data."""
         if (self.inner_serializer is not None) ^ (self.inner_encoder is not None):
@@ -82,6 +135,11 @@ class DataSerializer(Serializer):
                 ["inner_serializer", "inner_encoder"], type_name=self.__class__.__name__
             )
 
+    @classmethod
+    def clear_plans(cls) -> None:
+        """Invalidate compiled plans of all serializer instances, invoked when types are reloaded."""
+        DataSerializer._current_plans_generation += 1
+
     def serialize(self, data: Any, type_hint: TypeHint | None = None) -> Any:
         """Serialize the argument to a dictionary type_hint and schema."""
 
@@ -138,26 +196,14 @@ class DataSerializer(Serializer):
                 if not is_empty(dict_value)
             )
         elif is_ndarray_type(type(data)):
-            # Deserialize ndarray into ndarray, remaining_chain must be None
-            values = tuple(float(x) for x in data.flatten())
+            # Serialize ndarray into a mapping, remaining_chain must be None
             if type_hint is not None:
                 type_hint.validate_for_ndarray()
                 # Type hint is present, do not specify _type
-                return frozendict(
-                    {
-                        "shape": tuple(data.shape),
-                        "values": values,
-                    }
-                )
+                return frozendict(self._serialize_ndarray(data))
             else:
                 # Specify _type when type hint is None
-                return frozendict(
-                    {
-                        "_type": "ndarray",
-                        "shape": tuple(data.shape),
-                        "values": tuple(float(x) for x in data.flatten()),
-                    }
-                )
+                return frozendict({"_type": "ndarray", **self._serialize_ndarray(data)})
         elif is_data_key_or_record_type(type(data)):
             # Use key serializer for key types if specified
             if self.key_serializer is not None and is_key_type(type(data)):
@@ -212,28 +258,12 @@ class DataSerializer(Serializer):
             # Include type information first based on include_type_first flag
             result = {self.type_field: type_field} if include_type_first else {}
 
-            # Use self to serialize keys unless a key serializer is specified
-            key_serializer = self.key_serializer if self.key_serializer is not None else self
-
             # Serialize slot values in the order of declaration except those that are None
-            data_type_spec = data.get_type_spec()
             result.update(
                 {
-                    self._serialize_key(field_name): (
-                        self.primitive_serializer.serialize(field_value, field_spec.field_type_hint)
-                        if is_primitive_type(typeof(field_value))
-                        else (
-                            self.enum_serializer.serialize(field_value, field_spec.field_type_hint)
-                            if is_enum_type(type(field_value))
-                            else (
-                                key_serializer.serialize(field_value, field_spec.field_type_hint)
-                                if is_key_type(type(field_value))
-                                else self._serialize_inner(field_value, field_spec.field_type_hint)
-                            )
-                        )
-                    )
-                    for field_spec in data_type_spec.fields
-                    if not is_empty(field_value := getattr(data, field_name := field_spec.field_name))
+                    serialized_key: encoder(field_value)
+                    for field_name, serialized_key, encoder in self._get_serialize_plan(type(data))
+                    if not is_empty(field_value := getattr(data, field_name))
                 }
             )
 
@@ -328,9 +358,7 @@ class DataSerializer(Serializer):
                     f"but data type {type(data).__name__} is not a mapping."
                 )
             # Deserialize mapping into ndarray
-            shape = data["shape"]
-            values = data["values"]
-            return np.array(values, dtype=float).reshape(shape)  # TODO: !!! Support any dtype
+            return self._deserialize_ndarray(data)
         elif isinstance(
             data, str
         ):  # TODO: !! Refactor to use if/else on schema type only like the new PrimitiveSerializer
@@ -391,10 +419,8 @@ class DataSerializer(Serializer):
                 else:
                     raise RuntimeError("Neither schema type nor _type field is provided for a mapping.")
 
-            # Get type spec
-            type_spec = TypeSchema.for_type(deserialized_type)
-            if not isinstance(type_spec, DataSpec):
-                raise RuntimeError(f"Type '{typename(deserialized_type)}' cannot be deserialized from a dictionary.")
+            # Get the compiled plan for the type, error if the type is not a data type
+            schema_class, field_decoders, key_decoders = self._get_deserialize_plan(deserialized_type)
 
             # Check that no type chain is remaining
             if type_hint is not None and type_hint.remaining is not None:
@@ -403,31 +429,14 @@ class DataSerializer(Serializer):
                     f"specifies an inner type: {type_hint.to_str()}."
                 )
 
-            # Get class and field dictionary for type_name
-            schema_class = type_spec.type_
-            field_dict = {x.field_name: x for x in type_spec.fields} if type_spec.fields is not None else {}
-
             # Deserialize into a dict
-            result_dict = {
-                (snake_case_k := self._deserialize_key(field_key)): (
-                    self._key_error(type_name=typename(deserialized_type), field_key=field_key)
-                    if field_dict.get(snake_case_k) is None
-                    else (
-                        self.inner_serializer.deserialize(self.inner_encoder.decode(field_value), field_hint)
-                        if (
-                            (field_hint := field_dict[snake_case_k].field_type_hint).schema_type != str
-                            and self.inner_encoder is not None
-                            and isinstance(field_value, str)
-                            and len(field_value) > 0
-                            # TODO: Improve detection of embedded JSON
-                            and (field_value.startswith('{"') or field_value.startswith("["))
-                        )
-                        else self.deserialize(field_value, field_hint)
-                    )
-                )
-                for field_key, field_value in data.items()
-                if not is_empty(field_value) and not field_key.startswith("_")
-            }
+            result_dict = {}
+            for field_key, field_value in data.items():
+                if not is_empty(field_value) and not field_key.startswith("_"):
+                    if (key_decoder := key_decoders.get(field_key)) is None:
+                        key_decoder = self._get_key_decoder(deserialized_type, field_key, field_decoders, key_decoders)
+                    field_name, decoder = key_decoder
+                    result_dict[field_name] = decoder(field_value)
 
             # Construct an instance of the target type
             result = schema_class(**result_dict)
@@ -440,6 +449,167 @@ class DataSerializer(Serializer):
                 f"{ErrorUtil.wrap(data)}"
             )
 
+    def _get_serialize_plan(self, data_type: type) -> _SerializePlan:
+        """Get the serialization plan for the data type, compile on first use."""
+        if self._plans_generation != DataSerializer._current_plans_generation:
+            self._clear_plans()
+        if (result := self._serialize_plans.get(data_type)) is None:
+            result = self._compile_serialize_plan(data_type)
+            self._serialize_plans[data_type] = result
+        return result
+
+    def _get_deserialize_plan(self, data_type: type) -> _DeserializePlan:
+        """Get the deserialization plan for the data type, compile on first use."""
+        if self._plans_generation != DataSerializer._current_plans_generation:
+            self._clear_plans()
+        if (result := self._deserialize_plans.get(data_type)) is None:
+            result = self._compile_deserialize_plan(data_type)
+            self._deserialize_plans[data_type] = result
+        return result
+
+    def _clear_plans(self) -> None:
+        """Discard the compiled plans of this instance."""
+        self._serialize_plans = {}
+        self._deserialize_plans = {}
+        self._plans_generation = DataSerializer._current_plans_generation
+
+    def _compile_serialize_plan(self, data_type: type) -> _SerializePlan:
+        """Create (field_name, serialized_key, encoder) for each field of the data type."""
+        return tuple(
+            (
+                field_spec.field_name,
+                self._serialize_key(field_spec.field_name),
+                self._compile_field_encoder(field_spec.field_type_hint),
+            )
+            for field_spec in data_type.get_type_spec().fields
+        )
+
+    def _compile_field_encoder(self, field_hint: TypeHint) -> _FieldEncoder:
+        """Create an encoder for a field with the specified type hint, dispatching on the kind of value type."""
+
+        # Bind the serializers to local variables
+        primitive_serialize = self.primitive_serializer.serialize
+        enum_serialize = self.enum_serializer.serialize
+        key_serialize = self.key_serializer.serialize if self.key_serializer is not None else self.serialize
+        serialize_inner = self._serialize_inner
+
+        def encode(field_value: Any) -> Any:
+            # The field may hold a value whose type differs from the type hint, select the serializer for the value
+            value_kind = _get_value_kind(type(field_value))
+            if value_kind == TypeKind.PRIMITIVE:
+                return primitive_serialize(field_value, field_hint)
+            elif value_kind == TypeKind.ENUM:
+                return enum_serialize(field_value, field_hint)
+            elif value_kind == TypeKind.KEY:
+                # Use self to serialize keys unless a key serializer is specified
+                return key_serialize(field_value, field_hint)
+            else:
+                return serialize_inner(field_value, field_hint)
+
+        return encode
+
+    def _compile_deserialize_plan(self, data_type: type) -> _DeserializePlan:
+        """Create schema class and a decoder for each field of the data type, error if not a data type."""
+
+        # Get type spec
+        type_spec = TypeSchema.for_type(data_type)
+        if not isinstance(type_spec, DataSpec):
+            raise RuntimeError(f"Type '{typename(data_type)}' cannot be deserialized from a dictionary.")
+
+        # Field name to (field_name, decoder) dictionary
+        field_decoders = (
+            {x.field_name: (x.field_name, self._compile_field_decoder(x.field_type_hint)) for x in type_spec.fields}
+            if type_spec.fields is not None
+            else {}
+        )
+
+        # Serialized key to (field_name, decoder) dictionary, populated on first use of each serialized key
+        key_decoders = {} if self.pascalize_keys else field_decoders
+        return type_spec.type_, field_decoders, key_decoders
+
+    def _compile_field_decoder(self, field_hint: TypeHint) -> _FieldDecoder:
+        """Create a decoder for a field with the specified type hint."""
+
+        # Bind the serializers to local variables
+        deserialize = self.deserialize
+        schema_type = field_hint.schema_type
+
+        if schema_type == str or self.inner_encoder is None:
+            if is_primitive_type(schema_type) and not field_hint.remaining:
+                # Primitive field, call primitive serializer directly
+                primitive_deserialize = self.primitive_serializer.deserialize
+                return lambda field_value: primitive_deserialize(field_value, field_hint)
+            else:
+                return lambda field_value: deserialize(field_value, field_hint)
+        else:
+            inner_deserialize = self.inner_serializer.deserialize
+            inner_decode = self.inner_encoder.decode
+
+            def decode(field_value: Any) -> Any:
+                if (
+                    isinstance(field_value, str)
+                    and len(field_value) > 0
+                    # TODO: Improve detection of embedded JSON
+                    and (field_value.startswith('{"') or field_value.startswith("["))
+                ):
+                    # Decode data field using inner encoder and deserialize using inner serializer
+                    return inner_deserialize(inner_decode(field_value), field_hint)
+                else:
+                    return deserialize(field_value, field_hint)
+
+            return decode
+
+    def _get_key_decoder(
+        self,
+        data_type: type,
+        field_key: str,
+        field_decoders: dict[str, tuple[str, _FieldDecoder]],
+        key_decoders: dict[str, tuple[str, _FieldDecoder]],
+    ) -> tuple[str, _FieldDecoder]:
+        """Get (field_name, decoder) for a serialized key not yet in key_decoders, error if no such field."""
+        if (result := field_decoders.get(self._deserialize_key(field_key))) is None:
+            self._key_error(type_name=typename(data_type), field_key=field_key)
+        key_decoders[field_key] = result
+        return result
+
+    def _serialize_ndarray(self, data: np.ndarray) -> dict[str, Any]:
+        """Serialize ndarray to a dictionary according to the ndarray_format setting."""
+        if (value_format := self.ndarray_format) == NdarrayFormat.DEFAULT:
+            return {
+                "shape": tuple(data.shape),
+                "values": tuple(float(x) for x in data.flatten()),
+            }
+        elif value_format in (NdarrayFormat.BINARY, NdarrayFormat.BASE64):
+            if data.dtype.kind not in "biuf":
+                raise RuntimeError(
+                    f"Cannot serialize ndarray with dtype={data.dtype} using {value_format.name} format,\n"
+                    f"only bool, int, uint and float dtypes are supported."
+                )
+            # Convert to little-endian byte order and C order, this does not copy if the data is already in this form
+            data = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder("<"))
+            data_bytes = data.tobytes()
+            return {
+                "dtype": data.dtype.str,
+                "shape": tuple(data.shape),
+                "data": (
+                    data_bytes if value_format == NdarrayFormat.BINARY else base64.b64encode(data_bytes).decode("ascii")
+                ),
+            }
+        else:
+            raise ErrorUtil.enum_value_error(value_format, NdarrayFormat)
+
+    @classmethod
+    def _deserialize_ndarray(cls, data: Any) -> np.ndarray:
+        """Deserialize ndarray from a dictionary in any of the formats specified by NdarrayFormat."""
+        if (data_bytes := data.get("data")) is not None:
+            # BINARY or BASE64 format, create a read-only view of the bytes without copying
+            if isinstance(data_bytes, str):
+                data_bytes = base64.b64decode(data_bytes)
+            return np.frombuffer(data_bytes, dtype=np.dtype(data["dtype"])).reshape(data["shape"])
+        else:
+            # DEFAULT format
+            return np.array(data["values"], dtype=float).reshape(data["shape"])
+
     def _serialize_key(self, field_key: str) -> str:
         """Transform the field key for use in serialization"""
         if self.pascalize_keys:
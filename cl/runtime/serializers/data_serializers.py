@@ -16,6 +16,7 @@ from cl.runtime.serializers.data_serializer import DataSerializer
 from cl.runtime.serializers.enum_serializers import EnumSerializers
 from cl.runtime.serializers.json_encoders import JsonEncoders
 from cl.runtime.serializers.key_serializers import KeySerializers
+from cl.runtime.serializers.ndarray_format import NdarrayFormat
 from cl.runtime.serializers.primitive_serializers import PrimitiveSerializers
 from cl.runtime.serializers.type_inclusion import TypeInclusion
 from cl.runtime.serializers.type_placement import TypePlacement
@@ -109,6 +110,7 @@ class DataSerializers:
             key_serializer=KeySerializers.DELIMITED,
             type_inclusion=TypeInclusion.ALWAYS,  # TODO: Consider changing to AS_NEEDED
             type_placement=TypePlacement.LAST,  # TODO: Remove after all tests pass
+            ndarray_format=NdarrayFormat.BASE64,
         ).build(),
         inner_encoder=JsonEncoders.COMPACT,
         type_inclusion=TypeInclusion.ALWAYS,  # TODO: Consider changing to AS_NEEDED
@@ -119,5 +121,13 @@ class DataSerializers:
     FOR_MONGO = DataSerializer(
         primitive_serializer=PrimitiveSerializers.FOR_MONGO,
         enum_serializer=EnumSerializers.DEFAULT,
+        ndarray_format=NdarrayFormat.BINARY,
     ).build()
     """Default bidirectional data serializer settings for MongoDB."""
+
+    FOR_COUCH = DataSerializer(
+        primitive_serializer=PrimitiveSerializers.FOR_MONGO,
+        enum_serializer=EnumSerializers.DEFAULT,
+        ndarray_format=NdarrayFormat.BASE64,
+    ).build()
+    """Default bidirectional data serializer settings for CouchDB."""
@@ -0,0 +1,29 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import IntEnum
+from enum import auto
+
+
+class NdarrayFormat(IntEnum):
+    """Format used to serialize ndarray, deserialization accepts any of these formats."""
+
+    DEFAULT = auto()
+    """Dictionary of shape and a tuple of float values in C order."""
+
+    BINARY = auto()
+    """Dictionary of dtype, shape and raw little-endian bytes in C order, for storage with native binary support."""
+
+    BASE64 = auto()
+    """Same as BINARY but with raw bytes encoded as a Base64 string on a single line, for text formats such as JSON."""
@@ -86,14 +86,10 @@ class DataService(PydanticMixin):
         # Select by table using load_all
         type_ = cast(type[KeyMixin], TypeInfo.from_type_name(table_name))
         records = ds.load_all(type_, skip=skip, limit=limit)
+        total_count = ds.count_all(type_)
 
-        if records:
-            # Get the common type of the records stored in the table
-            record_types = [type(record) for record in records]
-            common_base_record_type = TypeInfo.get_common_base_type(types=record_types)
-        else:
-            # Default to type_ when there are no records
-            common_base_record_type = type_
+        # Get the common type of the records stored in the table from record type presence without loading them
+        common_base_record_type = ds.get_common_base_record_type(key_type=type_)
 
         # Get schema dict for type
         schema_dict = cls._get_schema_dict(common_base_record_type)
@@ -105,6 +101,7 @@ class DataService(PydanticMixin):
             data=data,
             schema_=schema_dict,  # noqa
             base_type=_UI_SERIALIZER.serialize(common_base_record_type, TypeHints.TYPE_OR_NONE),
+            total_count=total_count,
         )
 
         return result
@@ -119,6 +116,7 @@ class DataService(PydanticMixin):
         # Select by type
         type_ = cast(type[RecordMixin], TypeInfo.from_type_name(type_name))
         records = ds.load_by_type(type_, skip=skip, limit=limit)
+        total_count = ds.count_all(type_.get_key_type(), restrict_to=type_)
 
         # Get schema dict for type
         schema_dict = cls._get_schema_dict(type_)
@@ -130,6 +128,7 @@ class DataService(PydanticMixin):
             data=data,
             schema_=schema_dict,  # noqa
             base_type=_UI_SERIALIZER.serialize(type_, TypeHints.TYPE_OR_NONE),
+            total_count=total_count,
         )
 
         return result
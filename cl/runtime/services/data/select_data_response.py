@@ -28,3 +28,6 @@ class SelectDataResponse(PydanticMixin):
 
     base_type: str
     """Base type as entry point in schema dict."""
+
+    total_count: int | None = None
+    """Total number of records in the selection, used for pagination when 'skip' or 'limit' is specified."""
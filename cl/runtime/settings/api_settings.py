@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 from dataclasses import dataclass
 from typing_extensions import final
 from cl.runtime.records.typename import typename
@@ -56,6 +57,12 @@ class ApiSettings(Settings):
     api_max_age: int | None = None
     """Maximum time in seconds for browsers to cache the CORS response."""
 
+    api_max_workers: int | None = None
+    """Size of the thread pool for running synchronous route implementations (optional, defaults to CPU count + 4)."""
+
+    api_view_cache_max_size: int = 1000
+    """Maximum number of view method responses in the in-process cache, the least recently used are evicted first."""
+
     def __init(self) -> None:
         """Use instead of __init__ in the builder pattern, invoked by the build method in base to derived order."""
 
@@ -121,3 +128,12 @@ class ApiSettings(Settings):
 
         if self.api_max_age is not None and not isinstance(self.api_max_age, int):
             raise RuntimeError(f"{typename(type(self))} field 'max_age' must be an int or None.")
+
+        # Apply the default of ThreadPoolExecutor without the upper limit of 32 so slow routes do not exhaust the pool
+        if self.api_max_workers is None:
+            self.api_max_workers = (os.cpu_count() or 1) + 4
+        elif not isinstance(self.api_max_workers, int) or self.api_max_workers < 1:
+            raise RuntimeError(f"{typename(type(self))} field 'max_workers' must be a positive int or None.")
+
+        if not isinstance(self.api_view_cache_max_size, int) or self.api_view_cache_max_size < 0:
+            raise RuntimeError(f"{typename(type(self))} field 'view_cache_max_size' must be a non-negative int.")
@@ -56,6 +56,18 @@ class DbSettings(Settings):
     db_dir: str | None = None
     """Directory for database files (optional, defaults to '{project_root}/databases')."""
 
+    db_fetch_batch_size: int = 1000
+    """Number of records fetched from the database at a time by iter_all and iter_by_query methods."""
+
+    db_sqlite_reader_count: int = 4
+    """Maximum number of read-only connections per SQLite database in addition to one writer connection."""
+
+    db_cache: bool = False
+    """Wrap the database in an in-process read-through record cache (CachedDb) when set."""
+
+    db_cache_max_records: int | None = 100_000
+    """Maximum number of records in the in-process record cache, unbounded if None."""
+
     def __init(self) -> None:
         """Use instead of __init__ in the builder pattern, invoked by the build method in base to derived order."""
 
@@ -80,6 +92,9 @@ class DbSettings(Settings):
                     f"suitable default exists for db_type={self.db_type}."
                 )
 
+        if not isinstance(self.db_sqlite_reader_count, int) or self.db_sqlite_reader_count < 0:
+            raise RuntimeError("Field 'db_sqlite_reader_count' in settings.yaml must be a non-negative integer.")
+
     @classmethod
     def get_db_dir(cls) -> str:
         """Get database directory (optional, defaults to '{project_root}/databases')."""
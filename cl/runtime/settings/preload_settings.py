@@ -34,8 +34,34 @@ class PreloadSettings(Settings):
         - For JSON, the data is in json/ClassName/.../KeyToken1;KeyToken2.json where ... is optional dataset
     """
 
+    preload_max_workers: int | None = None
+    """Maximum number of processes used to read preload files, defaults to CPU count, read in this process if zero."""
+
+    preload_batch_size: int = 1000
+    """Maximum number of records of the same key type inserted into the data source in a single commit."""
+
+    preload_snapshot_dir: str | None = None
+    """
+    Absolute or relative (to Dynaconf project root) directory for the binary snapshot of preloaded records.
+
+    Notes:
+        - If specified, records from preload files that did not change since the previous run are loaded
+          from the snapshot instead of being parsed again
+        - If not specified, all preload files are parsed on every run
+    """
+
     def __init(self) -> None:
         """Use instead of __init__ in the builder pattern, invoked by the build method in base to derived order."""
 
         # Convert to absolute paths if specified as relative paths and convert to list if single value is specified
         self.preload_dirs = ProjectLayout.normalize_paths("dirs", self.preload_dirs)
+
+        if self.preload_snapshot_dir is not None:
+            self.preload_snapshot_dir = ProjectLayout.normalize_path("preload_snapshot_dir", self.preload_snapshot_dir)
+
+        if self.preload_max_workers is not None and (
+            not isinstance(self.preload_max_workers, int) or self.preload_max_workers < 0
+        ):
+            raise RuntimeError("Field 'preload_max_workers' in settings.yaml must be None or a non-negative integer.")
+        if not isinstance(self.preload_batch_size, int) or self.preload_batch_size <= 0:
+            raise RuntimeError("Field 'preload_batch_size' in settings.yaml must be a positive integer.")
@@ -24,25 +24,34 @@ from urllib.parse import urlparse
 import pika
 import redis
 from celery import Celery
-from celery.exceptions import Reject
 from celery.signals import setup_logging
 from pika.exceptions import ChannelClosedByBroker
 from cl.runtime.contexts.context_manager import activate
 from cl.runtime.contexts.context_manager import active
+from cl.runtime.contexts.context_manager import active_or_none
 from cl.runtime.contexts.context_snapshot import ContextSnapshot
 from cl.runtime.db.data_source import DataSource
 from cl.runtime.log.log_config import celery_empty_logging_config
 from cl.runtime.log.log_config import logging_config
 from cl.runtime.server.env import Env
 from cl.runtime.settings.celery_settings import CelerySettings
+from cl.runtime.tasks.running_task_counter import RunningTaskCounter
 from cl.runtime.tasks.task import Task
 from cl.runtime.tasks.task_key import TaskKey
-from cl.runtime.tasks.task_query import TaskQuery
 from cl.runtime.tasks.task_queue import TaskQueue
 from cl.runtime.tasks.task_status import TaskStatus
 
 CELERY_RUN_COMMAND_QUEUE: Final[str] = "run_command"
 
+_TENANT_TASKS_COUNTER_ID = "CeleryTenantTasks"
+"""Identifier of the counter of tasks running in Celery workers, the counter is separate for each tenant."""
+
+_MAX_TENANT_LIMIT_RETRY_DELAY_SEC = 8
+"""Maximum delay before retrying a task that exceeded the tenant limit, the delay doubles with each retry."""
+
+_TENANT_LIMIT_WARNING_RETRIES = 100
+"""Log a warning each time a task has been delayed by the tenant limit this many more times."""
+
 celery_settings = CelerySettings.instance()
 
 celery_app = Celery(
@@ -66,8 +75,9 @@ def config_loggers(*args, **kwargs):
     dictConfig(celery_empty_logging_config)
 
 
-@celery_app.task(max_retries=celery_settings.celery_max_retries, acks_late=True)  # Do not retry failed tasks
+@celery_app.task(bind=True, max_retries=celery_settings.celery_max_retries, acks_late=True)  # Do not retry failed tasks
 def execute_task(
+    self,
     task_id: str,
     context_snapshot_json: str,
 ) -> None:
@@ -75,17 +85,34 @@ def execute_task(
 
     # Deserialize context from 'context_data' parameter to run with the same settings as the caller context
     with ContextSnapshot.from_json(context_snapshot_json):
-        # The task is running.
-        running_query = TaskQuery(status=TaskStatus.RUNNING).build()
-        running_tasks = active(DataSource).load_by_query(running_query, cast_to=Task)
-
-        if len(running_tasks) >= celery_settings.celery_max_tenant_tasks:
-            raise Reject("Tenant exceeded task limit", requeue=True)
+        # Acquire a slot within the tenant limit of running tasks, delay with backoff instead of requeueing at once
+        # Slots held for longer than the time limit are reclaimed because Celery kills tasks that exceed it
+        max_count = celery_settings.celery_max_tenant_tasks
+        if not RunningTaskCounter.try_acquire(
+            _TENANT_TASKS_COUNTER_ID,
+            task_id=task_id,
+            max_count=max_count,
+            max_hold_sec=celery_settings.celery_time_limit,
+        ):
+            retries = self.request.retries
+            if retries > 0 and retries % _TENANT_LIMIT_WARNING_RETRIES == 0:
+                logging.getLogger(__name__).warning(
+                    "Task %s has been delayed %s times because %s tenant tasks are already running",
+                    task_id,
+                    retries,
+                    max_count,
+                )
+            countdown = min(2**retries, _MAX_TENANT_LIMIT_RETRY_DELAY_SEC)
+            raise self.retry(countdown=countdown, max_retries=None)
 
-        # Load and run the task
-        task_key = TaskKey(task_id=task_id).build()
-        task = active(DataSource).load_one(task_key, cast_to=Task)
-        task.run_task()
+        try:
+            # Load and run the task
+            task_key = TaskKey(task_id=task_id).build()
+            task = active(DataSource).load_one(task_key, cast_to=Task)
+            task.run_task()
+        finally:
+            # Release the slot on every exit path
+            RunningTaskCounter.release(_TENANT_TASKS_COUNTER_ID, task_id=task_id)
 
 
 def celery_start_queue_callable(*, log_config: Dict) -> None:
@@ -114,6 +141,10 @@ def celery_start_queue_callable(*, log_config: Dict) -> None:
 def celery_delete_existing_tasks() -> None:
     """Delete the existing Celery tasks (will exit when the current process exits)."""
 
+    # Reset the counter of running tasks for the active tenant as the tasks it counted are deleted
+    if active_or_none(DataSource) is not None:
+        RunningTaskCounter.reset(_TENANT_TASKS_COUNTER_ID)
+
     # Remove sqlite file of celery broker if exists
     if celery_settings.celery_broker == "sqlite":
         celery_file = celery_settings.celery_broker_uri.split("sqlite:///")[1]
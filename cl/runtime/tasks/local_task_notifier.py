@@ -0,0 +1,41 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections import defaultdict
+from cl.runtime.tasks.task_notifier import TaskNotifier
+
+
+class LocalTaskNotifier(TaskNotifier):
+    """Notifies waiters within the current process using a condition variable."""
+
+    __slots__ = ("_condition", "_versions")
+
+    def __init__(self) -> None:
+        """Create the condition variable and channel versions."""
+        self._condition = threading.Condition()
+        self._versions: defaultdict[str, int] = defaultdict(int)
+
+    def get_version(self, channel: str) -> int:
+        with self._condition:
+            return self._versions[channel]
+
+    def notify(self, channel: str) -> None:
+        with self._condition:
+            self._versions[channel] += 1
+            self._condition.notify_all()
+
+    def wait(self, channel: str, *, version: int, timeout_sec: float) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._versions[channel] != version, timeout=timeout_sec)
@@ -13,20 +13,60 @@
 # limitations under the License.
 
 import datetime as dt
-import time
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from cl.runtime.contexts.context_manager import active
+from cl.runtime.contexts.context_snapshot import ContextSnapshot
 from cl.runtime.db.data_source import DataSource
+from cl.runtime.exceptions.error_util import ErrorUtil
 from cl.runtime.primitive.datetime_util import DatetimeUtil
+from cl.runtime.records.typename import typename
 from cl.runtime.tasks.task import Task
+from cl.runtime.tasks.task_key import TaskKey
+from cl.runtime.tasks.task_notifier import TaskNotifier
 from cl.runtime.tasks.task_query import TaskQuery
 from cl.runtime.tasks.task_queue import TaskQueue
 from cl.runtime.tasks.task_status import TaskStatus
+from cl.runtime.tasks.worker_pool_kind import WorkerPoolKind
+
+_logger = logging.getLogger(__name__)
+
+
+def _run_task(task_id: str, context_snapshot_json: str) -> None:
+    """Load and run the task claimed by the queue in a worker thread or process within the queue contexts."""
+
+    # Deserialize in each worker to run with the same contexts as the queue
+    with ContextSnapshot.from_json(context_snapshot_json):
+        task_key = TaskKey(task_id=task_id).build()
+        task = active(DataSource).load_one(task_key, cast_to=Task)
+        task.run_task()
 
 
 @dataclass(slots=True, kw_only=True)
 class ProcessQueue(TaskQueue):
-    """Execute tasks sequentially within the queue process."""
+    """
+    Execute tasks within the queue process, sequentially or using a pool of worker threads or processes.
+
+    Notes:
+        - Each task is claimed by changing its status from Pending or Awaiting to Running using compare-and-set,
+          so the same task never runs twice when several workers or queue processes share the same DB
+        - Awaiting tasks have priority over Pending tasks
+        - Worker processes are started using spawn rather than fork, so they do not inherit the DB connections,
+          locks and caches of the queue process
+    """
+
+    pool_kind: WorkerPoolKind | None = None
+    """Run tasks using a pool of worker threads or processes, or sequentially in the queue thread if not specified."""
+
+    max_workers: int | None = None
+    """Maximum number of tasks running concurrently in the pool, defaults to CPU count (ignored without pool_kind)."""
 
     def __init(self) -> None:
         """Use instead of __init__ in the builder pattern, invoked by the build method in base to derived order."""
@@ -34,56 +74,150 @@ class ProcessQueue(TaskQueue):
         if self.timeout_sec is None:
             self.timeout_sec = 10
 
+        if self.max_workers is not None and (not isinstance(self.max_workers, int) or self.max_workers <= 0):
+            raise RuntimeError(f"Field 'max_workers' of {typename(type(self))} must be None or a positive integer.")
+
     def run_start_queue(self) -> None:
-        queue_id = self.queue_id
 
         # Set timeout
         timeout_delta = dt.timedelta(seconds=self.timeout_sec) if self.timeout_sec is not None else None
         timeout_at = DatetimeUtil.now() + timeout_delta if timeout_delta is not None else None
 
+        # Submitted and finished tasks wake up the queue, DB polling with increasing interval is a safety net
+        notifier = TaskNotifier.instance()
+        submitted_channel = self.get_submitted_channel()
+
+        # Create the pool, tasks run in the queue thread if not specified
+        max_workers = self.max_workers if self.max_workers is not None else os.cpu_count() or 1
+        if self.pool_kind is None:
+            executor: Executor | None = None
+        elif self.pool_kind == WorkerPoolKind.THREAD:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        elif self.pool_kind == WorkerPoolKind.PROCESS:
+            # Forked workers would share the DB connections and copy the locks and caches of this process
+            executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            raise ErrorUtil.enum_value_error(self.pool_kind, WorkerPoolKind)
+
+        # Workers run tasks within the contexts active when the queue is started
+        context_snapshot_json = ContextSnapshot.capture_active().to_json() if executor is not None else None
+
+        def on_task_done(task: Task, future: Future) -> None:
+            """Report unexpected errors and wake up the queue and the callers waiting for completion."""
+            if (error := future.exception()) is not None:
+                _logger.error(f"Task failed in {typename(type(self))} worker: {error!r}", exc_info=error)
+
+                # The task remains Running if the worker failed before the task could save its final status,
+                # the callback runs in a thread of the pool so the queue contexts are activated from the snapshot
+                with ContextSnapshot.from_json(context_snapshot_json):
+                    update = task.clone()
+                    update.status = TaskStatus.FAILED
+                    update.progress_pct = 100.0
+                    update.remaining_sec = 0.0
+                    update.error_message = str(error)
+                    running_query = TaskQuery(status=TaskStatus.RUNNING).build()
+                    active(DataSource).replace_one_if(update.build(), query=running_query)
+            # Tasks running in a worker process cannot notify the callers in this process
+            notifier.notify(Task.get_finished_channel())
+            notifier.notify(submitted_channel)
+
+        # Futures for the tasks running in the pool
+        running_futures: set[Future] = set()
+
         # Set the counter of while loop cycles with no tasks
         no_task_cycles = 0
-        while True:
-            # Get key for the current queue
-            queue_key = self.get_key()
-
-            # Tasks that are awaiting completion of other tasks and will have priority for subsequent execution
-            awaiting_query = TaskQuery(queue=queue_key, status=TaskStatus.AWAITING).build()
-            awaiting_tasks = active(DataSource).load_by_query(awaiting_query, cast_to=Task)
-
-            # The task that have been submitted to the queue but are not yet running
-            pending_query = TaskQuery(queue=queue_key, status=TaskStatus.PENDING).build()
-            pending_tasks = active(DataSource).load_by_query(pending_query, cast_to=Task)
-
-            # Awaiting tasks have priority over pending tasks
-            queued_tasks = awaiting_tasks + pending_tasks
-
-            if queued_tasks:
-                # Run found tasks sequentially
-                for task in queued_tasks:
-                    task.run_task()
-                # Reset timeout and no task cycles counter
-                timeout_at = DatetimeUtil.now() + timeout_delta if timeout_delta is not None else None
-                no_task_cycles = 0
-            else:
-                if timeout_at is not None and DatetimeUtil.now() > timeout_at:
-                    break
+        try:
+            while True:
+                # Get notification version before the query so that a task submitted after the query is not missed
+                submitted_version = notifier.get_version(submitted_channel)
+
+                # Remove finished tasks to determine the number of available workers
+                running_futures = {x for x in running_futures if not x.done()}
+                available_count = max_workers - len(running_futures) if executor is not None else None
+
+                claimed_count = 0
+                if available_count is None or available_count > 0:
+                    for task in self._load_queued_tasks():
+                        # Claim the task, skip if it has already been claimed by another worker or queue process
+                        if (claimed_task := self._claim_task(task)) is None:
+                            continue
+                        claimed_count += 1
+                        if executor is None:
+                            # Run sequentially in the queue thread
+                            claimed_task.run_task()
+                        else:
+                            # Run in the pool, stop when all workers are busy
+                            future = executor.submit(_run_task, claimed_task.task_id, context_snapshot_json)
+                            future.add_done_callback(partial(on_task_done, claimed_task))
+                            running_futures.add(future)
+                            if claimed_count == available_count:
+                                break
+
+                if claimed_count > 0 or running_futures:
+                    # Reset timeout and no task cycles counter while the queue is busy
+                    timeout_at = DatetimeUtil.now() + timeout_delta if timeout_delta is not None else None
+                    no_task_cycles = 0
+                    if claimed_count > 0:
+                        # Query again without waiting
+                        continue
                 else:
-                    no_task_cycles = no_task_cycles + 1
+                    if timeout_at is not None and DatetimeUtil.now() > timeout_at:
+                        break
+                    else:
+                        no_task_cycles = no_task_cycles + 1
 
-            # Pause for 1 sec more for each no_task_cycle up to 10 sec
-            sleep_sec = min(round(pow(2, no_task_cycles)), 8)
-            time.sleep(sleep_sec)
+                # Wait until a task is submitted or finished, poll after 2^no_task_cycles sec up to 8 sec
+                # or the remaining timeout
+                wait_sec = min(round(pow(2, no_task_cycles)), 8)
+                if timeout_at is not None:
+                    wait_sec = min(wait_sec, (timeout_at - DatetimeUtil.now()).total_seconds())
+                notifier.wait(submitted_channel, version=submitted_version, timeout_sec=max(wait_sec, 0.0))
+        finally:
+            if executor is not None:
+                # Wait for the running tasks to complete
+                executor.shutdown(wait=True)
 
     def run_stop_queue(self) -> None:
         raise NotImplementedError()
 
     def cancel_task(self, task_id: str) -> bool:
         """Cancel a specific task by ID. Returns True if cancellation was attempted."""
-        # ProcessQueue runs tasks synchronously - cancellation not supported
+        # ProcessQueue does not interrupt running tasks - cancellation not supported
         return False
 
     def cancel_tasks_batch(self, task_ids: list[str]) -> bool:
         """Cancel multiple tasks at once. Returns True if cancellation was attempted."""
-        # ProcessQueue runs tasks synchronously - cancellation not supported
+        # ProcessQueue does not interrupt running tasks - cancellation not supported
         return False
+
+    def _load_queued_tasks(self) -> list[Task]:
+        """Load Awaiting and Pending tasks for this queue, Awaiting tasks have priority."""
+
+        # Get key for the current queue
+        queue_key = self.get_key()
+
+        # Tasks that are awaiting completion of other tasks and will have priority for subsequent execution
+        awaiting_query = TaskQuery(queue=queue_key, status=TaskStatus.AWAITING).build()
+        awaiting_tasks = active(DataSource).load_by_query(awaiting_query, cast_to=Task)
+
+        # The task that have been submitted to the queue but are not yet running
+        pending_query = TaskQuery(queue=queue_key, status=TaskStatus.PENDING).build()
+        pending_tasks = active(DataSource).load_by_query(pending_query, cast_to=Task)
+
+        # Awaiting tasks have priority over pending tasks
+        return [*awaiting_tasks, *pending_tasks]
+
+    @classmethod
+    def _claim_task(cls, task: Task) -> Task | None:
+        """
+        Save the task with Running status only if its stored status has not changed since it was loaded,
+        return the claimed task or None if the task has been claimed by another worker or queue process.
+        """
+        update = task.clone()
+        update.status = TaskStatus.RUNNING
+        update = update.build()
+        status_query = TaskQuery(status=task.status).build()
+        if active(DataSource).replace_one_if(update, query=status_query):
+            return update
+        else:
+            return None
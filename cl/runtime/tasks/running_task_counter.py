@@ -0,0 +1,153 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+from typing import Callable
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.db.data_source import DataSource
+from cl.runtime.primitive.datetime_util import DatetimeUtil
+from cl.runtime.records.for_dataclasses.extensions import required
+from cl.runtime.records.record_mixin import RecordMixin
+from cl.runtime.tasks.running_task_counter_key import RunningTaskCounterKey
+from cl.runtime.tasks.running_task_slot import RunningTaskSlot
+from cl.runtime.tasks.task import Task
+from cl.runtime.tasks.task_key import TaskKey
+from cl.runtime.tasks.task_status import TaskStatus
+
+_MAX_ATTEMPTS = 100
+"""Maximum number of attempts to update the counter when it is concurrently updated by other workers."""
+
+_FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+"""Statuses of tasks that no longer hold a slot even if the slot was not released."""
+
+
+@dataclass(slots=True, kw_only=True)
+class RunningTaskCounter(RunningTaskCounterKey, RecordMixin):
+    """
+    Atomic counter of running tasks used to limit the number of tasks running concurrently within a tenant.
+
+    Notes:
+        - The counter is updated using compare-and-set on version, so no lock is required
+        - Each successful 'try_acquire' must be followed by 'release' on every exit path of the task
+        - A task that acquires again, for example when redelivered after its worker was lost, reuses its slot
+        - When no slot is free, slots of tasks that have finished or no longer exist and slots held for longer
+          than max_hold_sec are reclaimed, so slots not released by killed workers do not remain in use
+    """
+
+    running_tasks: list[RunningTaskSlot] = required()
+    """Slots held by running tasks in the order of acquisition."""
+
+    version: int = required()
+    """Incremented on every update of the counter."""
+
+    def get_key(self) -> RunningTaskCounterKey:
+        return RunningTaskCounterKey(counter_id=self.counter_id).build()
+
+    @classmethod
+    def try_acquire(cls, counter_id: str, *, task_id: str, max_count: int, max_hold_sec: float | None = None) -> bool:
+        """
+        Acquire a slot for the task and return True if fewer than max_count slots are held, otherwise return False.
+
+        Args:
+            counter_id: Unique counter identifier
+            task_id: Identifier of the task acquiring the slot
+            max_count: Maximum number of slots held at the same time
+            max_hold_sec: Slots held for longer than this are reclaimed when no slot is free (optional)
+        """
+        if max_count <= 0:
+            return False
+
+        def acquire(running_tasks: list[RunningTaskSlot]) -> tuple[bool, list[RunningTaskSlot] | None]:
+            if any(x.task_id == task_id for x in running_tasks):
+                # The task already holds a slot
+                return True, None
+            if len(running_tasks) >= max_count:
+                # Reclaim the slots that are no longer in use
+                running_tasks = [x for x in running_tasks if cls._is_slot_in_use(x, max_hold_sec=max_hold_sec)]
+                if len(running_tasks) >= max_count:
+                    return False, None
+            slot = RunningTaskSlot(task_id=task_id, acquired_at=DatetimeUtil.now())
+            return True, running_tasks + [slot]
+
+        return cls._try_update(counter_id, acquire)
+
+    @classmethod
+    def release(cls, counter_id: str, *, task_id: str) -> None:
+        """Release the slot acquired by 'try_acquire' after the task has exited, no effect if already reclaimed."""
+
+        def release(running_tasks: list[RunningTaskSlot]) -> tuple[bool, list[RunningTaskSlot] | None]:
+            if all(x.task_id != task_id for x in running_tasks):
+                return True, None
+            return True, [x for x in running_tasks if x.task_id != task_id]
+
+        cls._try_update(counter_id, release)
+
+    @classmethod
+    def reset(cls, counter_id: str) -> None:
+        """Delete the counter when no tasks are running, for example after the existing tasks have been deleted."""
+        active(DataSource).delete_one(RunningTaskCounterKey(counter_id=counter_id).build(), commit=True)
+
+    @classmethod
+    def _is_slot_in_use(cls, slot: RunningTaskSlot, *, max_hold_sec: float | None) -> bool:
+        """Return True unless the slot is held for longer than max_hold_sec or its task has finished or is deleted."""
+        if max_hold_sec is not None and (DatetimeUtil.now() - slot.acquired_at).total_seconds() > max_hold_sec:
+            return False
+        task = active(DataSource).load_one_or_none(TaskKey(task_id=slot.task_id).build(), cast_to=Task)
+        return task is not None and task.status not in _FINISHED_STATUSES
+
+    @classmethod
+    def _try_update(
+        cls,
+        counter_id: str,
+        update_func: Callable[[list[RunningTaskSlot]], tuple[bool, list[RunningTaskSlot] | None]],
+    ) -> bool:
+        """
+        Apply update_func to the slots held and save the result unless it is None, repeat on concurrent updates.
+        Returns the flag returned by update_func.
+        """
+        # TODO: Avoid circular dependency
+        from cl.runtime.tasks.running_task_counter_query import RunningTaskCounterQuery
+
+        data_source = active(DataSource)
+        key = RunningTaskCounterKey(counter_id=counter_id).build()
+        for _ in range(_MAX_ATTEMPTS):
+            counter = data_source.load_one_or_none(key, cast_to=RunningTaskCounter)
+            running_tasks = list(counter.running_tasks) if counter is not None else []
+            result, updated_running_tasks = update_func(running_tasks)
+            if updated_running_tasks is None:
+                return result
+
+            version = counter.version if counter is not None else 0
+            update = RunningTaskCounter(
+                counter_id=counter_id, running_tasks=updated_running_tasks, version=version + 1
+            ).build()
+            if counter is None:
+                # Create the counter, another worker may create it first in which case try again
+                try:
+                    data_source.insert_one(update, commit=True)
+                    return result
+                except Exception as e:  # noqa
+                    # Rethrow if the error is not caused by the counter created concurrently
+                    if data_source.load_one_or_none(key) is None:
+                        raise e
+            else:
+                # Update only if the counter has not been changed by another worker since it was loaded
+                version_query = RunningTaskCounterQuery(counter_id=counter_id, version=version).build()
+                if data_source.replace_one_if(update, query=version_query):
+                    return result
+
+        raise RuntimeError(
+            f"Running task counter {counter_id} could not be updated after {_MAX_ATTEMPTS} attempts\n"
+            f"due to concurrent updates by other workers."
+        )
@@ -0,0 +1,34 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+from cl.runtime.db.query_mixin import QueryMixin
+from cl.runtime.records.for_dataclasses.dataclass_mixin import DataclassMixin
+from cl.runtime.records.key_mixin import KeyMixin
+from cl.runtime.records.predicates import Predicate
+from cl.runtime.tasks.running_task_counter import RunningTaskCounter
+
+
+@dataclass(slots=True, kw_only=True)
+class RunningTaskCounterQuery(DataclassMixin, QueryMixin):
+    """Query for RunningTaskCounter by the version field."""
+
+    counter_id: str | None = None
+    """Unique counter identifier."""
+
+    version: int | Predicate[int] | None = None
+    """Incremented on every update of the counter."""
+
+    def get_target_type(self) -> type[KeyMixin]:
+        return RunningTaskCounter
@@ -0,0 +1,29 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime as dt
+from dataclasses import dataclass
+from cl.runtime.records.for_dataclasses.dataclass_mixin import DataclassMixin
+from cl.runtime.records.for_dataclasses.extensions import required
+
+
+@dataclass(slots=True, kw_only=True)
+class RunningTaskSlot(DataclassMixin):
+    """Slot within the limit of RunningTaskCounter held by a running task."""
+
+    task_id: str = required()
+    """Identifier of the task holding the slot."""
+
+    acquired_at: dt.datetime = required()
+    """Time when the slot was acquired."""
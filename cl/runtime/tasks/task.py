@@ -25,17 +25,26 @@ from cl.runtime.events.event_broker import EventBroker
 from cl.runtime.events.event_kind import EventKind
 from cl.runtime.events.task_event import TaskEvent
 from cl.runtime.events.task_finished_event import TaskFinishedEvent
+from cl.runtime.events.task_started_event import TaskStartedEvent
+from cl.runtime.log.queued_log_handler import QueuedLogHandler
 from cl.runtime.log.task_log import TaskLog
 from cl.runtime.primitive.datetime_util import DatetimeUtil
 from cl.runtime.primitive.timestamp import Timestamp
 from cl.runtime.records.for_dataclasses.extensions import required
 from cl.runtime.records.record_mixin import RecordMixin
 from cl.runtime.tasks.task_key import TaskKey
+from cl.runtime.tasks.task_notifier import TaskNotifier
 from cl.runtime.tasks.task_queue_key import TaskQueueKey
 from cl.runtime.tasks.task_status import TaskStatus
 
 _logger = logging.getLogger(__name__)
 
+_FINISHED_CHANNEL = "task_finished"
+"""Name of TaskNotifier channel notified when any task is finished."""
+
+_PROGRESS_SAVE_INTERVAL_SEC = 1.0
+"""Progress reported by the task is saved to DB at most once per this interval."""
+
 
 @dataclass(slots=True, kw_only=True)
 class Task(TaskKey, RecordMixin, ABC):
@@ -68,9 +77,21 @@ class Task(TaskKey, RecordMixin, ABC):
     remaining_sec: float | None = None
     """Remaining time in seconds if available."""
 
+    cpu_sec: float | None = None
+    """CPU time in seconds used by the thread running the task if available."""
+
     error_message: str | None = None
     """Error message for Failed status if available."""
 
+    _start_perf_counter: float | None = None
+    """Value of time.perf_counter() when run_task started, None if not running in this process."""
+
+    _start_thread_time: float | None = None
+    """Value of time.thread_time() when run_task started, None if not running in this process."""
+
+    _progress_saved_perf_counter: float | None = None
+    """Value of time.perf_counter() when progress was last saved or the task started."""
+
     def get_key(self) -> TaskKey:
         return TaskKey(task_id=self.task_id).build()
 
@@ -103,71 +124,148 @@ class Task(TaskKey, RecordMixin, ABC):
         event_broker = active(EventBroker)
         events_topic = "events"
 
+        # Record wall clock and CPU time of the current thread at start
+        self._start_perf_counter = time.perf_counter()
+        self._start_thread_time = time.thread_time()
+        self._progress_saved_perf_counter = self._start_perf_counter
+
         # Activate logging context for the task
         with activate(self._create_log_context()):
             try:
-                _logger.info("Start task execution.")
-                event_broker.sync_publish(events_topic, TaskEvent(event_kind=EventKind.TASK_STARTED).build())
+                # Time from task creation (UUIDv7-based task_id) to start of execution
+                queued_sec = (DatetimeUtil.now() - Timestamp.to_datetime(self.task_id)).total_seconds()
+                _logger.info(f"Start task execution after {queued_sec:.3f}s in queue.")
+                event_broker.sync_publish(
+                    events_topic,
+                    TaskStartedEvent(event_kind=EventKind.TASK_STARTED, queued_sec=queued_sec).build(),
+                )
 
-                # Save with Running status
-                update = self.clone()
-                update.status = TaskStatus.RUNNING
-                active(DataSource).replace_one(update.build(), commit=True)
+                # Save with Running status unless the task has already been claimed by the queue with this status
+                if self.status != TaskStatus.RUNNING:
+                    update = self.clone()
+                    update.status = TaskStatus.RUNNING
+                    active(DataSource).replace_one(update.build(), commit=True)
 
                 # Invoke out-of-process execution of payload
                 self._execute()
 
             except Exception as e:  # noqa
 
-                _logger.error(repr(e), exc_info=True)
+                elapsed_sec, cpu_sec = self._get_elapsed_and_cpu_sec()
+                _logger.error(f"Task failed after {elapsed_sec:.3f}s (CPU {cpu_sec:.3f}s): {e!r}", exc_info=True)
                 event_broker.sync_publish(
                     events_topic,
-                    TaskFinishedEvent(event_kind=EventKind.TASK_FINISHED, status=TaskStatus.FAILED).build(),
+                    TaskFinishedEvent(
+                        event_kind=EventKind.TASK_FINISHED,
+                        status=TaskStatus.FAILED,
+                        elapsed_sec=elapsed_sec,
+                        cpu_sec=cpu_sec,
+                    ).build(),
                 )
 
                 # Save with Failed status and execution info
                 update = self.clone()
                 update.status = TaskStatus.FAILED
                 update.progress_pct = 100.0
-                update.elapsed_sec = 0.0  # TODO: Implement
+                update.elapsed_sec = elapsed_sec
+                update.cpu_sec = cpu_sec
                 update.remaining_sec = 0.0
                 update.error_message = str(e)
                 active(DataSource).replace_one(update.build(), commit=True)
             else:
 
-                _logger.info("Task completed successfully.")
+                elapsed_sec, cpu_sec = self._get_elapsed_and_cpu_sec()
+                _logger.info(f"Task completed successfully in {elapsed_sec:.3f}s (CPU {cpu_sec:.3f}s).")
                 event_broker.sync_publish(
                     events_topic,
-                    TaskFinishedEvent(event_kind=EventKind.TASK_FINISHED, status=TaskStatus.COMPLETED).build(),
+                    TaskFinishedEvent(
+                        event_kind=EventKind.TASK_FINISHED,
+                        status=TaskStatus.COMPLETED,
+                        elapsed_sec=elapsed_sec,
+                        cpu_sec=cpu_sec,
+                    ).build(),
                 )
 
-                # Record the end time
-                end_time = DatetimeUtil.now()
-
                 # Save with Completed status and execution info
-                # Save with Failed status and execution info
                 update = self.clone()
                 update.status = TaskStatus.COMPLETED
                 update.progress_pct = 100.0
-                update.elapsed_sec = 0.0  # TODO: Implement
+                update.elapsed_sec = elapsed_sec
+                update.cpu_sec = cpu_sec
                 update.remaining_sec = 0.0
                 active(DataSource).replace_one(update.build(), commit=True)
 
+            # Write the log messages and events queued during execution before waking up the callers
+            QueuedLogHandler.flush_all()
+
+            # Wake up the callers waiting for completion after the final status is saved
+            TaskNotifier.instance().notify(self.get_finished_channel())
+
+    def report_progress(self, progress_pct: float) -> None:
+        """
+        Report progress in percent from 0 to 100 when invoked from '_execute', the remaining time is estimated
+        from elapsed time. Reports are coalesced and saved to DB at most once per interval, so this method
+        can be invoked as often as convenient.
+        """
+        if self._start_perf_counter is None:
+            raise RuntimeError("Method report_progress can only be invoked from '_execute' during 'run_task'.")
+
+        # Skip if the progress has been saved within the interval
+        now = time.perf_counter()
+        if now - self._progress_saved_perf_counter < _PROGRESS_SAVE_INTERVAL_SEC:
+            return
+        self._progress_saved_perf_counter = now
+
+        # Estimate remaining time assuming progress is proportional to elapsed time
+        elapsed_sec, cpu_sec = self._get_elapsed_and_cpu_sec()
+        progress_pct = min(max(progress_pct, 0.0), 100.0)
+        remaining_sec = elapsed_sec * (100.0 - progress_pct) / progress_pct if progress_pct > 0.0 else None
+
+        update = self.clone()
+        update.status = TaskStatus.RUNNING
+        update.progress_pct = progress_pct
+        update.elapsed_sec = elapsed_sec
+        update.cpu_sec = cpu_sec
+        update.remaining_sec = remaining_sec
+
+        # Save only while Running so a task cancelled in the meantime is not overwritten, saving immediately
+        # without committing the pending saves and deletes made by the task
+        from cl.runtime.tasks.task_query import TaskQuery  # TODO: Avoid circular dependency
+
+        running_query = TaskQuery(status=TaskStatus.RUNNING).build()
+        active(DataSource).replace_one_if(update.build(), query=running_query)
+
+    def _get_elapsed_and_cpu_sec(self) -> tuple[float, float]:
+        """Return wall clock and CPU time of the current thread in seconds since run_task started."""
+        return time.perf_counter() - self._start_perf_counter, time.thread_time() - self._start_thread_time
+
     def run_task_in_process(self):
         return self._execute()
 
+    @classmethod
+    def get_finished_channel(cls) -> str:
+        """Name of TaskNotifier channel notified when any task is finished."""
+        return _FINISHED_CHANNEL
+
     @classmethod
     def wait_for_completion(cls, task_key: TaskKey, timeout_sec: int = 10) -> None:  # TODO: Rename or move
         """Wait for completion of the specified task run before exiting from this method (not async/await)."""
 
-        start_datetime = DatetimeUtil.now()
-        while DatetimeUtil.now() < start_datetime + dt.timedelta(seconds=timeout_sec):
+        notifier = TaskNotifier.instance()
+        end_datetime = DatetimeUtil.now() + dt.timedelta(seconds=timeout_sec)
+        while (now := DatetimeUtil.now()) < end_datetime:
+            # Get notification version before loading the task so that a task finished after loading is not missed
+            finished_version = notifier.get_version(cls.get_finished_channel())
             task = active(DataSource).load_one(task_key, cast_to=Task)
             if task.status == TaskStatus.COMPLETED:
                 # Test success, task has been completed
                 return
-            # TODO: Refactor to use queue-specific push communication rather than heartbeat
-            time.sleep(1)  # Sleep for 1 second to reduce CPU load
+            # Wait until a task is finished, poll the DB after 1 second if the task runs in another process
+            notifier.wait(
+                cls.get_finished_channel(),
+                version=finished_version,
+                timeout_sec=min(1.0, (end_datetime - now).total_seconds()),
+            )
 
         # Test failure
         raise RuntimeError(f"Task has not been completed after {timeout_sec} sec.")
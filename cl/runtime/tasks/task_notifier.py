@@ -0,0 +1,70 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+from abc import abstractmethod
+from typing import ClassVar
+from typing import Self
+
+
+class TaskNotifier(ABC):
+    """
+    Wakes up task queues when a task is submitted and waiters when a task is finished.
+
+    Notes:
+        - Each channel has a version that is incremented by 'notify', waiters read the version before checking
+          the DB and then wait for it to change, so a notification sent in between is not lost
+        - Notifications only shorten the wait, DB polling remains the safety net and the source of truth
+        - The default implementation notifies within the current process, queues running in a different
+          process require an implementation based on a message broker set using 'set_instance'
+    """
+
+    __instance: ClassVar[Self | None] = None
+    """Notifier used by task queues and tasks in this process."""
+
+    @classmethod
+    def instance(cls) -> Self:
+        """Return the notifier used in this process, create an in-process notifier if not set."""
+        if TaskNotifier.__instance is None:
+            from cl.runtime.tasks.local_task_notifier import LocalTaskNotifier  # TODO: Avoid circular dependency
+
+            TaskNotifier.__instance = LocalTaskNotifier()
+        return TaskNotifier.__instance
+
+    @classmethod
+    def set_instance(cls, notifier: Self | None) -> None:
+        """Set the notifier used in this process, reset to the in-process notifier if None."""
+        TaskNotifier.__instance = notifier
+
+    @abstractmethod
+    def get_version(self, channel: str) -> int:
+        """Return the current version of the channel, pass it to 'wait' to wait for subsequent notifications."""
+
+    @abstractmethod
+    def notify(self, channel: str) -> None:
+        """Increment the version of the channel and wake up all waiters."""
+
+    @abstractmethod
+    def wait(self, channel: str, *, version: int, timeout_sec: float) -> bool:
+        """
+        Wait until the version of the channel differs from the specified version or the timeout expires.
+
+        Args:
+            channel: Channel name
+            version: Version returned by 'get_version' before checking the DB
+            timeout_sec: Maximum wait time in seconds
+
+        Returns:
+            True if notified, False on timeout
+        """
@@ -19,6 +19,8 @@ from cl.runtime.db.tenant import Tenant
 from cl.runtime.db.tenant_key import TenantKey
 from cl.runtime.primitive.timestamp import Timestamp
 from cl.runtime.records.for_dataclasses.extensions import required
+from cl.runtime.tasks.task_key import TaskKey
+from cl.runtime.tasks.task_notifier import TaskNotifier
 from cl.runtime.tasks.task_queue_key import TaskQueueKey
 
 
@@ -58,6 +60,17 @@ class TaskQueue(TaskQueueKey, ABC):
     def run_start_queue(self) -> None:
         """Run a query on tasks, run all returned tasks sequentially or in parallel, then repeat."""
 
+    def submit_task(self, task: TaskKey) -> None:
+        """
+        Notify the queue that the task has been saved with Pending status, which wakes up the queue if it runs
+        in this process. The queue also finds the task by polling the DB, derived types may override.
+        """
+        TaskNotifier.instance().notify(self.get_submitted_channel())
+
+    def get_submitted_channel(self) -> str:
+        """Name of TaskNotifier channel notified when a task is submitted to this queue."""
+        return f"task_submitted:{self.queue_id}"
+
     @abstractmethod
     def run_stop_queue(self) -> None:
         """Exit after completing all currently executing tasks."""
@@ -0,0 +1,153 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.db.data_source import DataSource
+from cl.runtime.records.key_mixin import KeyMixin
+from cl.runtime.records.record_mixin import RecordMixin
+from cl.runtime.serializers.data_serializers import DataSerializers
+from cl.runtime.serializers.json_encoders import JsonEncoders
+from cl.runtime.serializers.key_serializers import KeySerializers
+from cl.runtime.settings.api_settings import ApiSettings
+from cl.runtime.views.view_cache_entry import ViewCacheEntry
+from cl.runtime.views.view_cache_entry_key import ViewCacheEntryKey
+
+TMethod = TypeVar("TMethod", bound=Callable)
+"""Type of the view method declared with @cached_view."""
+
+_VERSION_SERIALIZER = DataSerializers.FOR_JSON
+"""Used to serialize the record when calculating its version."""
+
+_JSON_ENCODER = JsonEncoders.COMPACT
+"""Used to encode the response for persistence and to encode the record when calculating its version."""
+
+_CACHED_VIEW_ATTR = "_cached_view"
+"""Attribute set by @cached_view on the view method."""
+
+_lru: OrderedDict[tuple, tuple[str, str]] = OrderedDict()
+"""Dict of (version, response_json) in the order of last use, with the key returned by ViewCache._get_lru_key."""
+
+_lru_lock = threading.Lock()
+"""Lock for the in-process cache."""
+
+
+def cached_view(method: TMethod) -> TMethod:
+    """
+    Declare that the response of the view method is cached until the record for which it is invoked changes.
+
+    Notes:
+        - Use only when the response depends on the fields of the record and not on other records
+        - The response is cached only when the method is invoked without arguments
+    """
+    setattr(method, _CACHED_VIEW_ATTR, True)
+    return method
+
+
+class ViewCache:
+    """
+    Cache for the responses of view methods declared with @cached_view, backed by persisted ViewCacheEntry
+    records and an in-process LRU cache.
+
+    Notes:
+        - Each response is valid for the (view_for, view_name, version) tuple where version is the hash
+          of the serialized record, so replacing the record invalidates the responses of its cached views
+        - The responses for a deleted record are never returned because the record is loaded to get its version
+    """
+
+    @classmethod
+    def is_cached_view(cls, record_type: type, view_name: str) -> bool:
+        """Return True if the view method of record_type is declared with @cached_view."""
+        return getattr(getattr(record_type, view_name, None), _CACHED_VIEW_ATTR, False)
+
+    @classmethod
+    def get_version(cls, record: RecordMixin) -> str:
+        """Return the hash of the serialized record which changes when any of its fields changes."""
+        record_json = _JSON_ENCODER.encode(_VERSION_SERIALIZER.serialize(record))
+        return hashlib.sha256(record_json.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_response(cls, record: RecordMixin, *, view_name: str, create_response: Callable[[], Any]) -> Any:
+        """
+        Return the cached response of the view method for the current version of the record,
+        or invoke create_response and cache the result if not found.
+
+        Notes:
+            The response is always decoded from JSON, so it has the same format whether or not it was cached
+            (e.g., lists rather than tuples) and the callers do not share mutable objects
+
+        Args:
+            record: Record for which the view method is invoked
+            view_name: Name of the view method
+            create_response: Runs the view method and returns the response in JSON-compatible format
+        """
+        view_for = record.get_key()
+        version = cls.get_version(record)
+        lru_key = cls._get_lru_key(view_for, view_name)
+
+        # Look up in the in-process cache first
+        with _lru_lock:
+            if (cached := _lru.get(lru_key, None)) is not None and cached[0] == version:
+                _lru.move_to_end(lru_key)
+                return _JSON_ENCODER.decode(cached[1])
+
+        # Then look up in DB, run the view method and persist the response if not found or created for another version
+        data_source = active(DataSource)
+        entry_key = ViewCacheEntryKey(view_for=view_for, view_name=view_name).build()
+        entry = data_source.load_one_or_none(entry_key, cast_to=ViewCacheEntry)
+        if entry is not None and entry.view_for_version == version:
+            response_json = entry.response_json
+        else:
+            response_json = _JSON_ENCODER.encode(create_response())
+            entry = ViewCacheEntry(
+                view_for=view_for,
+                view_name=view_name,
+                view_for_version=version,
+                response_json=response_json,
+            ).build()
+            data_source.replace_one(entry, commit=True)
+
+        # Add to the in-process cache, evicting the least recently used responses
+        max_size = ApiSettings.instance().api_view_cache_max_size
+        with _lru_lock:
+            _lru[lru_key] = (version, response_json)
+            _lru.move_to_end(lru_key)
+            while len(_lru) > max_size:
+                _lru.popitem(last=False)
+        return _JSON_ENCODER.decode(response_json)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all responses from the in-process cache, the persisted responses are not affected."""
+        with _lru_lock:
+            _lru.clear()
+
+    @classmethod
+    def _get_lru_key(cls, view_for: KeyMixin, view_name: str) -> tuple:
+        """Return the in-process cache key, responses are isolated by database, dataset and tenant."""
+        data_source = active(DataSource)
+        return (
+            data_source.get_db_id(),
+            data_source.dataset.dataset_id,
+            data_source.tenant.tenant_id,
+            type(view_for),
+            KeySerializers.TUPLE.serialize(view_for),
+            view_name,
+        )
@@ -0,0 +1,36 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from dataclasses import dataclass
+from cl.runtime.records.for_dataclasses.extensions import required
+from cl.runtime.records.record_mixin import RecordMixin
+from cl.runtime.views.view_cache_entry_key import ViewCacheEntryKey
+
+
+@dataclass(slots=True, kw_only=True)
+class ViewCacheEntry(ViewCacheEntryKey, RecordMixin):
+    """
+    Persisted response of a view method declared with @cached_view, valid only for the version of the record
+    for which it was created.
+    """
+
+    view_for_version: str = required()
+    """Hash of the serialized record for which the response was created, see ViewCache.get_version."""
+
+    response_json: str = required()
+    """Response of the view method in JSON format."""
+
+    def get_key(self) -> ViewCacheEntryKey:
+        return ViewCacheEntryKey(view_for=self.view_for, view_name=self.view_name).build()
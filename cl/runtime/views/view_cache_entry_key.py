@@ -0,0 +1,34 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from dataclasses import dataclass
+from cl.runtime.records.for_dataclasses.dataclass_mixin import DataclassMixin
+from cl.runtime.records.for_dataclasses.extensions import required
+from cl.runtime.records.key_mixin import KeyMixin
+
+
+@dataclass(slots=True)
+class ViewCacheEntryKey(DataclassMixin, KeyMixin):
+    """Key of the cached response of a view method for the specified record."""
+
+    view_for: KeyMixin = required()
+    """Generic key of the record for which the view is provided."""
+
+    view_name: str = required()
+    """Name of the view method."""
+
+    @classmethod
+    def get_key_type(cls) -> type[KeyMixin]:
+        return ViewCacheEntryKey
@@ -24,5 +24,6 @@ from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_handlers import Stu
 from stubs.cl.runtime.views.stub_data_viewers import StubDataViewers
 from stubs.cl.runtime.views.stub_plot_viewers import StubPlotViewers
 from stubs.cl.runtime.views.stub_media_viewers import StubMediaViewers
+from stubs.cl.runtime.views.stub_cached_viewers import StubCachedViewers
 from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_any_fields import StubDataclassAnyFields
 from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_tuple_fields import StubDataclassTupleFields
@@ -0,0 +1,34 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from dataclasses import dataclass
+from cl.runtime.tasks.task import Task
+
+
+@dataclass(slots=True, kw_only=True)
+class StubSleepTask(Task):
+    """Sleeps for the specified time during execution reporting progress, can run in any thread or process."""
+
+    sleep_sec: float = 0.0
+    """Time to sleep in seconds."""
+
+    step_count: int = 1
+    """Progress is reported after each of this number of equal steps."""
+
+    def _execute(self) -> None:
+        """Sleep for the specified time reporting progress after each step."""
+        for step in range(self.step_count):
+            time.sleep(self.sleep_sec / self.step_count)
+            self.report_progress(100.0 * (step + 1) / self.step_count)
@@ -0,0 +1,48 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from dataclasses import dataclass
+from cl.runtime.views.script import Script
+from cl.runtime.views.script_language import ScriptLanguage
+from cl.runtime.views.view_cache import cached_view
+from stubs.cl.runtime.views.stub_viewers import StubViewers
+
+_view_count: int = 0
+"""Number of times the cached viewer method was invoked."""
+
+
+@dataclass(slots=True, kw_only=True)
+class StubCachedViewers(StubViewers):
+    """Stub viewers with cached responses."""
+
+    message: str = "Message"
+    """Text displayed by the viewer."""
+
+    @classmethod
+    def get_view_count(cls) -> int:
+        """Return the number of times the cached viewer method was invoked."""
+        return _view_count
+
+    @cached_view
+    def view_message(self) -> Script:
+        """Cached viewer returning a script with the message."""
+        global _view_count
+        _view_count += 1
+        return Script(
+            view_for=self.get_key(),
+            view_name="view_message",
+            language=ScriptLanguage.MARKDOWN,
+            body=[self.message],
+        )
@@ -0,0 +1,144 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from cl.runtime.contexts.context_manager import activate
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.db.data_source import DataSource
+from cl.runtime.db.local.cached_db import CachedDb
+from cl.runtime.db.save_policy import SavePolicy
+from cl.runtime.db.sort_order import SortOrder
+from stubs.cl.runtime import StubDataclass
+from stubs.cl.runtime import StubDataclassDerived
+from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_query import StubDataclassQuery
+
+
+def test_read_through(multi_db_fixture):
+    """Test read-through caching and hit/miss counters."""
+
+    # Save records to the underlying database only, bypassing the cache
+    records = [StubDataclass(id=f"id{i}").build() for i in range(3)]
+    keys = [x.get_key() for x in records]
+    db_source = active(DataSource)
+    db_source.insert_many(records, commit=True)
+
+    cached_db = CachedDb(db=multi_db_fixture).build()
+    with activate(DataSource(db=cached_db, tenant=db_source.tenant).build()) as ds:
+
+        # First lookup is a miss for each key, including the key that is not found
+        missing_key = StubDataclass(id="missing").build().get_key()
+        assert ds.load_many_or_none([*keys, missing_key]) == (*records, None)
+        assert cached_db.get_hit_count() == 0
+        assert cached_db.get_miss_count() == 4
+
+        # Second lookup is served from cache for the existing records
+        cached_db.reset_counters()
+        assert ds.load_many_or_none(keys) == tuple(records)
+        assert cached_db.get_hit_count() == 3
+        assert cached_db.get_miss_count() == 0
+
+
+def test_invalidation(multi_db_fixture):
+    """Test that save and delete operations invalidate cached records."""
+
+    records = [StubDataclass(id=f"id{i}").build() for i in range(3)]
+    keys = [x.get_key() for x in records]
+
+    cached_db = CachedDb(db=multi_db_fixture).build()
+    with activate(DataSource(db=cached_db, tenant=active(DataSource).tenant).build()) as ds:
+
+        # Records saved through the cache are written through and returned without lookup in the underlying db
+        ds.insert_many(records, commit=True)
+        assert ds.load_many_or_none(keys) == tuple(records)
+        assert cached_db.get_miss_count() == 0
+
+        # Replace
+        replaced = StubDataclassDerived(id="id0", derived_str_field="replaced").build()
+        ds.replace_one(replaced, commit=True)
+        assert ds.load_one(keys[0]).derived_str_field == "replaced"
+
+        # Delete
+        ds.delete_many(keys[1:2], commit=True)
+        assert ds.load_one_or_none(keys[1]) is None
+
+        # Delete by query invalidates all cached records of the key type
+        ds.delete_by_query(StubDataclassQuery(id="id2").build())
+        assert ds.load_one_or_none(keys[2]) is None
+        assert ds.load_one(keys[0]) == replaced
+
+
+def test_max_records(multi_db_fixture):
+    """Test that the number of cached records does not exceed max_records."""
+
+    records = [StubDataclass(id=f"id{i}").build() for i in range(5)]
+    keys = [x.get_key() for x in records]
+    active(DataSource).insert_many(records, commit=True)
+
+    cached_db = CachedDb(db=multi_db_fixture, max_records=2).build()
+    with activate(DataSource(db=cached_db, tenant=active(DataSource).tenant).build()) as ds:
+        assert ds.load_many_or_none(keys) == tuple(records)
+        assert cached_db._cache.get_record_count() == 2  # noqa
+
+        # The last two records remain in cache
+        cached_db.reset_counters()
+        assert ds.load_many_or_none(keys[3:]) == tuple(records[3:])
+        assert cached_db.get_hit_count() == 2
+
+
+def test_shared_instance(multi_db_fixture):
+    """Test that the same instance is shared by all data sources in this process for the underlying database."""
+
+    cached_db = CachedDb.for_db(multi_db_fixture)
+    assert CachedDb.for_db(multi_db_fixture) is cached_db
+    assert cached_db.db is multi_db_fixture
+
+
+def test_transaction(multi_db_fixture):
+    """Test that records saved inside a transaction are added to cache only on commit."""
+
+    records = [StubDataclass(id=f"id{i}").build() for i in range(3)]
+    keys = [x.get_key() for x in records]
+    key_type = StubDataclass.get_key_type()
+    dataset = active(DataSource).dataset.dataset_id
+    tenant = active(DataSource).tenant.tenant_id
+    cached_db = CachedDb(db=multi_db_fixture).build()
+
+    def _load_from_cache() -> tuple:
+        """Load records from cache only, bypassing the underlying database."""
+        return cached_db._cache.load_many(  # noqa
+            key_type, keys, dataset=dataset, tenant=tenant, sort_order=SortOrder.INPUT
+        )
+
+    # Records are not in cache while the transaction is in progress, including for other threads
+    cached_db.begin_transaction()
+    cached_db.save_many(key_type, records, dataset=dataset, tenant=tenant, save_policy=SavePolicy.INSERT)
+    assert _load_from_cache() == ()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_load_from_cache).result() == ()
+
+    # Records are written through on commit
+    cached_db.commit_transaction()
+    assert _load_from_cache() == tuple(records)
+
+    # Records saved inside a transaction that is rolled back are removed from cache
+    replaced = StubDataclassDerived(id="id0", derived_str_field="replaced").build()
+    cached_db.begin_transaction()
+    cached_db.save_many(key_type, [replaced], dataset=dataset, tenant=tenant, save_policy=SavePolicy.REPLACE)
+    cached_db.rollback_transaction()
+    assert _load_from_cache() == tuple(records[1:])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
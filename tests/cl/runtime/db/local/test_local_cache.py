@@ -13,11 +13,21 @@
 # limitations under the License.
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from cl.runtime.contexts.context_manager import activate
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.db.data_source import DataSource
 from cl.runtime.db.local.local_cache import LocalCache
+from cl.runtime.db.save_policy import SavePolicy
+from cl.runtime.db.sort_order import SortOrder
+from cl.runtime.records.predicates import In
+from stubs.cl.runtime import StubDataclassPrimitiveFields
+from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_primitive_fields_key import StubDataclassPrimitiveFieldsKey
 from stubs.cl.runtime.records.for_dataclasses.stub_dataclass import StubDataclass
+from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_key import StubDataclassKey
+from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_primitive_fields_query import (
+    StubDataclassPrimitiveFieldsQuery,
+)
 
 
 def test_smoke():
@@ -38,5 +48,97 @@ def test_smoke():
         assert loaded_records[2] is None
 
 
+def test_load_all():
+    """Test load_all with sort, limit and skip."""
+
+    cache = LocalCache(db_id="sample").build()
+    records = [StubDataclass(id=f"id{i}").build() for i in range(5)]
+    cache.save_many(StubDataclassKey, records, dataset="ds", tenant="t", save_policy=SavePolicy.INSERT)
+
+    assert cache.load_all(StubDataclassKey, dataset="ds", tenant="t") == tuple(records)
+    assert cache.load_all(StubDataclassKey, dataset="ds", tenant="t", sort_order=SortOrder.DESC) == tuple(
+        reversed(records)
+    )
+    assert cache.load_all(StubDataclassKey, dataset="ds", tenant="t", limit=2, skip=1) == tuple(records[1:3])
+
+    # Datasets and tenants are isolated
+    assert cache.load_all(StubDataclassKey, dataset="other", tenant="t") == tuple()
+    assert cache.load_all(StubDataclassKey, dataset="ds", tenant="other") == tuple()
+
+    # Insert of an existing key is an error
+    with pytest.raises(RuntimeError, match="already exists"):
+        cache.save_many(StubDataclassKey, records[:1], dataset="ds", tenant="t", save_policy=SavePolicy.INSERT)
+
+    # Delete
+    cache.delete_many(StubDataclassKey, [records[0].get_key()], dataset="ds", tenant="t")
+    assert cache.get_record_count() == 4
+    cache.delete_table(StubDataclassKey, dataset="ds", tenant="t")
+    assert cache.is_empty()
+
+
+def test_load_by_query():
+    """Test load_by_query, count_by_query and delete_by_query."""
+
+    cache = LocalCache(db_id="sample").build()
+    records = [StubDataclassPrimitiveFields(key_str_field=x).build() for x in ["abc", "def", "xyz"]]
+    key_type = StubDataclassPrimitiveFieldsKey
+    cache.save_many(key_type, records, dataset="ds", tenant="t", save_policy=SavePolicy.INSERT)
+
+    eq_query = StubDataclassPrimitiveFieldsQuery(key_str_field="def").build()
+    in_query = StubDataclassPrimitiveFieldsQuery(key_str_field=In(["def", "xyz"])).build()
+    assert cache.load_by_query(eq_query, dataset="ds", tenant="t") == (records[1],)
+    assert cache.load_by_query(in_query, dataset="ds", tenant="t") == tuple(records[1:])
+    assert cache.count_by_query(in_query, dataset="ds", tenant="t") == 2
+
+    cache.delete_by_query(in_query, dataset="ds", tenant="t")
+    assert cache.load_all(key_type, dataset="ds", tenant="t") == (records[0],)
+
+
+def test_max_records():
+    """Test eviction of least recently used records."""
+
+    cache = LocalCache(db_id="sample", max_records=2).build()
+    records = [StubDataclass(id=f"id{i}").build() for i in range(3)]
+    keys = [x.get_key() for x in records]
+
+    cache.save_many(StubDataclassKey, records[:2], dataset="ds", tenant="t", save_policy=SavePolicy.INSERT)
+
+    # Touch the first record so the second becomes least recently used
+    cache.load_many(StubDataclassKey, keys[:1], dataset="ds", tenant="t", sort_order=SortOrder.INPUT)
+
+    # Save the third record, the second record is evicted
+    cache.save_many(StubDataclassKey, records[2:], dataset="ds", tenant="t", save_policy=SavePolicy.INSERT)
+    assert cache.get_record_count() == 2
+    loaded_records = cache.load_many(StubDataclassKey, keys, dataset="ds", tenant="t", sort_order=SortOrder.INPUT)
+    assert loaded_records == (records[0], records[2])
+
+
+def test_concurrent_access():
+    """Test that saving, loading and deleting records in several threads keeps the cache consistent."""
+
+    max_records = 10
+    cache = LocalCache(db_id="sample", max_records=max_records).build()
+
+    def _save_load_delete(thread_index: int) -> None:
+        """Save, load and delete records with keys that overlap with other threads."""
+        for i in range(200):
+            records = [StubDataclass(id=f"id{(thread_index + i + j) % 30}").build() for j in range(3)]
+            keys = [x.get_key() for x in records]
+            cache.save_many(StubDataclassKey, records, dataset="ds", tenant="t", save_policy=SavePolicy.REPLACE)
+            cache.load_many(StubDataclassKey, keys, dataset="ds", tenant="t", sort_order=SortOrder.INPUT)
+            cache.load_all(StubDataclassKey, dataset="ds", tenant="t")
+            cache.delete_many(StubDataclassKey, keys[:1], dataset="ds", tenant="t")
+            if i % 50 == 0:
+                cache.delete_table(StubDataclassKey, dataset="ds", tenant="t")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(_save_load_delete, x) for x in range(4)]:
+            future.result()
+
+    # Records in cache match the LRU order and do not exceed the limit
+    assert cache.get_record_count() <= max_records
+    assert cache.get_record_count() == len(cache._LocalCache__lru)  # noqa
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
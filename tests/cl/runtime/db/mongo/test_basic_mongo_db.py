@@ -13,10 +13,16 @@
 # limitations under the License.
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from cl.runtime.db.mongo.basic_mongo_db import BasicMongoDb
+from cl.runtime.db.mongo.basic_mongo_mock_db import BasicMongoMockDb
+from cl.runtime.db.save_policy import SavePolicy
+from cl.runtime.db.sort_order import SortOrder
 from cl.runtime.qa.regression_guard import RegressionGuard
 from cl.runtime.records.typename import typename
 from cl.runtime.stat.experiment_key_query import ExperimentKeyQuery
+from stubs.cl.runtime import StubDataclass
+from stubs.cl.runtime import StubDataclassKey
 from stubs.cl.runtime import StubDataclassPrimitiveFields
 from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_nested_fields_query import StubDataclassNestedFieldsQuery
 from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_primitive_fields_query import (
@@ -85,5 +91,99 @@ def test_populate_index_dict():
     RegressionGuard().verify_all()
 
 
+def test_bulk_write(basic_mongo_mock_db_fixture):
+    """Test saving records in multiple bulk_write batches and reporting INSERT collisions."""
+    db_id = basic_mongo_mock_db_fixture.db_id
+    dataset = "test_dataset"
+    tenant = "test_tenant"
+    records = [StubDataclass(id=f"id{i}").build() for i in range(5)]
+    keys = [x.get_key() for x in records]
+
+    for ordered in (True, False):
+        db = BasicMongoMockDb(db_id=db_id, bulk_write_batch_size=2, bulk_write_ordered=ordered).build()
+        db.delete_many(StubDataclassKey, keys, dataset=dataset, tenant=tenant)
+
+        # Insert the first two records, then insert all records including the ones already present
+        db.save_many(StubDataclassKey, records[:2], dataset=dataset, tenant=tenant, save_policy=SavePolicy.INSERT)
+        with pytest.raises(RuntimeError, match="already exist while INSERT policy is selected") as exc_info:
+            db.save_many(StubDataclassKey, records, dataset=dataset, tenant=tenant, save_policy=SavePolicy.INSERT)
+
+        # Check that the error message reports each colliding record
+        error_str = str(exc_info.value)
+        loaded_records = db.load_many(StubDataclassKey, keys, dataset=dataset, tenant=tenant, sort_order=SortOrder.ASC)
+        if ordered:
+            # Writing stops at the first collision
+            assert "id0" in error_str
+            assert "id1" not in error_str
+            assert len(loaded_records) == 2
+        else:
+            # All records are attempted and each collision is reported
+            assert "id0" in error_str
+            assert "id1" in error_str
+            assert len(loaded_records) == 5
+
+        # Replace succeeds irrespective of existing records
+        db.save_many(StubDataclassKey, records, dataset=dataset, tenant=tenant, save_policy=SavePolicy.REPLACE)
+        loaded_records = db.load_many(StubDataclassKey, keys, dataset=dataset, tenant=tenant, sort_order=SortOrder.ASC)
+        assert loaded_records == tuple(records)
+
+
+class _StubSession:
+    """Session that records the calls made to it, as mongomock does not support sessions."""
+
+    def __init__(self):
+        self.calls = []
+
+    def start_transaction(self):
+        self.calls.append("start_transaction")
+
+    def commit_transaction(self):
+        self.calls.append("commit_transaction")
+
+    def abort_transaction(self):
+        self.calls.append("abort_transaction")
+
+    def end_session(self):
+        self.calls.append("end_session")
+
+
+class _StubClient:
+    """Client that creates a new stub session on each call to start_session."""
+
+    def start_session(self):
+        return _StubSession()
+
+
+def test_transaction_session_per_thread(monkeypatch):
+    """Test that transactions in different threads sharing the same instance use their own sessions."""
+    monkeypatch.setattr(BasicMongoMockDb, "_get_mongo_client", lambda self: _StubClient())
+    monkeypatch.setattr(BasicMongoMockDb, "_check_supports_transactions", lambda self: True)
+    db = BasicMongoMockDb(db_id="test_transaction_session_per_thread").build()
+
+    def _begin_transaction_in_other_thread() -> _StubSession:
+        """Begin a transaction in another thread and return its session."""
+        assert db._get_mongo_session() is None  # noqa
+        db.begin_transaction()
+        return db._get_mongo_session()  # noqa
+
+    # Begin transaction in this thread
+    db.begin_transaction()
+    session = db._get_mongo_session()  # noqa
+
+    # Transaction in another thread does not see and does not end the session of this thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_session = executor.submit(_begin_transaction_in_other_thread).result()
+        executor.submit(db.commit_transaction).result()
+    assert other_session is not session
+    assert other_session.calls == ["start_transaction", "commit_transaction", "end_session"]
+    assert session.calls == ["start_transaction"]
+
+    # Rollback in this thread ends the session of this thread
+    assert db._get_mongo_session() is session  # noqa
+    db.rollback_transaction()
+    assert db._get_mongo_session() is None  # noqa
+    assert session.calls == ["start_transaction", "abort_transaction", "end_session"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
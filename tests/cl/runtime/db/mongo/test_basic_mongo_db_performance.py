@@ -0,0 +1,68 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import time
+from cl.runtime.db.mongo.basic_mongo_db import _KEY_SERIALIZER
+from cl.runtime.db.mongo.basic_mongo_db import _RECORD_SERIALIZER
+from cl.runtime.db.mongo.basic_mongo_mock_db import BasicMongoMockDb
+from cl.runtime.db.save_policy import SavePolicy
+from stubs.cl.runtime import StubDataclassPrimitiveFields
+from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_primitive_fields_key import StubDataclassPrimitiveFieldsKey
+
+
+def _save_one_by_one(db: BasicMongoMockDb, records, *, dataset: str, tenant: str) -> None:
+    """Per-record replace_one loop used by save_many before bulk_write was introduced."""
+    collection = db._get_mongo_collection(key_type=StubDataclassPrimitiveFieldsKey)
+    for record in records:
+        serialized_key = _KEY_SERIALIZER.serialize(record.get_key())
+        key_dict = {"_dataset": dataset, "_key": serialized_key, "_tenant": tenant}
+        serialized_record = _RECORD_SERIALIZER.serialize(record)
+        serialized_record.update(key_dict)
+        collection.replace_one(key_dict, serialized_record, upsert=True)
+
+
+@pytest.mark.skip("Performance test.")
+def test_performance(basic_mongo_mock_db_fixture):
+    """Compare batched bulk_write in save_many with the per-record loop."""
+    n = 1000
+    dataset = "test_dataset"
+    tenant = "test_tenant"
+    samples = [StubDataclassPrimitiveFields(key_str_field=f"key{i}").build() for i in range(n)]
+    db_id = basic_mongo_mock_db_fixture.db_id
+
+    print(f">>> Test stub type: {StubDataclassPrimitiveFields.__name__}, {n=}.")
+    db = BasicMongoMockDb(db_id=db_id).build()
+    start_time = time.time()
+    _save_one_by_one(db, samples, dataset=dataset, tenant=tenant)
+    end_time = time.time()
+    print(f"Save one by one: {end_time - start_time}s.")
+
+    for batch_size in (10, 100, 1000):
+        for ordered in (True, False):
+            db = BasicMongoMockDb(db_id=db_id, bulk_write_batch_size=batch_size, bulk_write_ordered=ordered).build()
+            start_time = time.time()
+            db.save_many(
+                StubDataclassPrimitiveFieldsKey,
+                samples,
+                dataset=dataset,
+                tenant=tenant,
+                save_policy=SavePolicy.REPLACE,
+            )
+            end_time = time.time()
+            print(f"Save many with {batch_size=}, {ordered=}: {end_time - start_time}s.")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,137 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import os
+import threading
+from cl.runtime.db.sql.sqlite_connection_pool import SqliteConnectionPool
+
+
+def _create_pool(tmp_path, *, reader_count: int = 2) -> SqliteConnectionPool:
+    """Create a pool for a new database with a single table."""
+    pool = SqliteConnectionPool(db_file_path=os.path.join(tmp_path, "test.sqlite"), reader_count=reader_count)
+    with pool.writer() as conn:
+        conn.execute("CREATE TABLE t (x)")
+        conn.commit()
+    return pool
+
+
+def _count_in_reader(pool: SqliteConnectionPool) -> int:
+    """Return the number of rows in table t using a reader connection."""
+    with pool.reader() as conn:
+        return conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+
+
+class _FailingCommitConnection:
+    """Wraps the writer connection and raises on the first commit."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._failed = False
+
+    def commit(self):
+        if not self._failed:
+            self._failed = True
+            raise RuntimeError("Simulated commit failure.")
+        self._conn.commit()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def test_read_during_transaction(tmp_path):
+    """Test that readers in other threads run concurrently with a transaction and see only committed data."""
+    pool = _create_pool(tmp_path)
+    try:
+        pool.begin_transaction()
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+
+        # The thread holding the transaction reads its own changes
+        with pool.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+
+        # Reader in another thread does not wait for the transaction and does not see uncommitted changes
+        counts = []
+        thread = threading.Thread(target=lambda: counts.append(_count_in_reader(pool)))
+        thread.start()
+        thread.join(timeout=5)
+        assert counts == [0]
+
+        pool.commit_transaction()
+        assert _count_in_reader(pool) == 1
+    finally:
+        pool.close()
+
+
+def test_writer_lock(tmp_path):
+    """Test that writers in other threads wait until the transaction is committed."""
+    pool = _create_pool(tmp_path)
+    try:
+        pool.begin_transaction()
+        writer_done = threading.Event()
+
+        def write():
+            with pool.writer() as writer_conn:
+                writer_conn.execute("INSERT INTO t VALUES (2)")
+                writer_conn.commit()
+            writer_done.set()
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        assert not writer_done.wait(timeout=0.2)
+
+        pool.rollback_transaction()
+        thread.join(timeout=5)
+        assert writer_done.is_set()
+        assert _count_in_reader(pool) == 1
+    finally:
+        pool.close()
+
+
+def test_failed_commit(tmp_path):
+    """Test that changes from a failed commit are rolled back rather than committed by the next transaction."""
+    pool = _create_pool(tmp_path)
+    try:
+        pool._writer = _FailingCommitConnection(pool._writer)
+
+        pool.begin_transaction()
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO t VALUES ('from_failed_commit')")
+        with pytest.raises(RuntimeError, match="Simulated commit failure"):
+            pool.commit_transaction()
+        assert not pool.in_transaction()
+
+        pool.begin_transaction()
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO t VALUES ('second')")
+        pool.commit_transaction()
+
+        with pool.reader() as conn:
+            assert [tuple(row) for row in conn.execute("SELECT x FROM t")] == [("second",)]
+    finally:
+        pool.close()
+
+
+def test_close(tmp_path):
+    """Test that the pool cannot be used after close."""
+    pool = _create_pool(tmp_path, reader_count=0)
+    assert _count_in_reader(pool) == 0
+    pool.close()
+    with pytest.raises(RuntimeError, match="has been closed"):
+        _count_in_reader(pool)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
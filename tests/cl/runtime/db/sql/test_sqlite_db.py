@@ -0,0 +1,129 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.db.data_source import DataSource
+from cl.runtime.db.save_policy import SavePolicy
+from cl.runtime.db.sql.sqlite_db import _table_dict
+from cl.runtime.db.sql.sqlite_db import _pending_table_dict  # noqa
+from stubs.cl.runtime import StubDataclassPrimitiveFields
+from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_primitive_fields_query import (
+    StubDataclassPrimitiveFieldsQuery,
+)
+
+
+def _get_index_names(db) -> list[str]:
+    """Get the names of indexes in the database excluding autoindexes."""
+    with db._get_pool().reader() as conn:  # noqa
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type='index' AND name NOT LIKE 'sqlite_%'").fetchall()
+    return sorted(row[0] for row in rows)
+
+
+def test_add_index(sqlite_db_fixture):
+    """Test adding index for the fields in a query."""
+
+    ds = active(DataSource)
+    records = [StubDataclassPrimitiveFields(key_str_field=x).build() for x in ["abc", "def", "xyz"]]
+    ds.insert_many(records, commit=True)
+    assert _get_index_names(sqlite_db_fixture) == []
+
+    # Index is added on first query and used by the query plan
+    query = StubDataclassPrimitiveFieldsQuery(key_str_field="def").build()
+    assert ds.load_by_query(query) == (records[1],)
+    index_name = "idx__StubDataclassPrimitiveFields__key_str_field___type"
+    assert _get_index_names(sqlite_db_fixture) == [index_name]
+    with sqlite_db_fixture._get_pool().reader() as conn:  # noqa
+        plan = conn.execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM "StubDataclassPrimitiveFields" '
+            'WHERE "_tenant" = ? AND "key_str_field" = ?',
+            ["t", "def"],
+        ).fetchall()
+    assert any(index_name in row[-1] for row in plan)
+
+    # Queries with the same fields reuse the index
+    assert ds.count_by_query(StubDataclassPrimitiveFieldsQuery(key_str_field="xyz").build()) == 1
+    assert _get_index_names(sqlite_db_fixture) == [index_name]
+
+    # Index is re-created after the database is dropped
+    ds.drop_db()
+    ds.insert_many(records, commit=True)
+    assert ds.count_by_query(query) == 1
+    assert _get_index_names(sqlite_db_fixture) == [index_name]
+
+
+def test_table_registry(sqlite_db_fixture):
+    """Test caching of table columns and adding columns missing from an existing table."""
+
+    ds = active(DataSource)
+    db_id = sqlite_db_fixture.db_id
+    table_name = "StubDataclassPrimitiveFields"
+
+    # Create a table with only some of the columns, as if created by an earlier version of the type
+    with sqlite_db_fixture._get_pool().writer() as conn:  # noqa
+        conn.execute(f'CREATE TABLE "{table_name}" (_key, _type, _tenant, key_str_field, PRIMARY KEY (_key, _tenant));')
+        conn.commit()
+
+    # Missing columns are added on save and the columns are cached
+    record = StubDataclassPrimitiveFields(key_str_field="abc").build()
+    ds.insert_many([record], commit=True)
+    assert ds.load_one(record.get_key()) == record
+    with sqlite_db_fixture._get_pool().reader() as conn:  # noqa
+        table_columns = {row["name"] for row in conn.execute(f'PRAGMA table_info("{table_name}");')}
+    assert _table_dict[db_id][table_name] == table_columns
+    assert "obj_str_field" in table_columns
+
+    # Registry is cleared when the connection is closed
+    sqlite_db_fixture.close_connection()
+    assert db_id not in _table_dict
+    assert ds.load_one(record.get_key()) == record
+
+
+def test_table_registry_in_transaction(sqlite_db_fixture):
+    """Test that tables created inside a transaction are cached only after commit."""
+
+    ds = active(DataSource)
+    db_id = sqlite_db_fixture.db_id
+    table_name = "StubDataclassPrimitiveFields"
+    key_type = StubDataclassPrimitiveFields.get_key_type()
+    record = StubDataclassPrimitiveFields(key_str_field="abc").build()
+
+    sqlite_db_fixture.begin_transaction()
+    try:
+        sqlite_db_fixture.save_many(
+            key_type,
+            [record],
+            dataset=ds.dataset.dataset_id,
+            tenant=ds.tenant.tenant_id,
+            save_policy=SavePolicy.INSERT,
+        )
+        assert table_name in _pending_table_dict[db_id]
+        assert table_name not in _table_dict.get(db_id, {})
+
+        # Reader in another thread does not see the uncommitted table and does not fail
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(ds.load_all, key_type).result() == ()
+    finally:
+        sqlite_db_fixture.commit_transaction()
+
+    # Table is cached and visible to other threads after commit
+    assert db_id not in _pending_table_dict
+    assert table_name in _table_dict[db_id]
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(ds.load_all, key_type).result() == (record,)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,84 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import time
+from unittest import mock
+from cl.runtime.db.save_policy import SavePolicy
+from cl.runtime.db.sort_order import SortOrder
+from cl.runtime.db.sql.sqlite_db import SqliteDb
+from stubs.cl.runtime import StubDataclassPrimitiveFields
+from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_primitive_fields_key import StubDataclassPrimitiveFieldsKey
+from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_primitive_fields_query import (
+    StubDataclassPrimitiveFieldsQuery,
+)
+
+
+@pytest.mark.skip("Performance test.")
+def test_query_performance(sqlite_db_fixture):
+    """Compare count_by_query before and after the index for the query fields is added."""
+    n = 20_000
+    query_count = 100
+    dataset = "test_dataset"
+    tenant = "test_tenant"
+    samples = [StubDataclassPrimitiveFields(key_str_field=f"key{i}").build() for i in range(n)]
+    queries = [StubDataclassPrimitiveFieldsQuery(key_str_field=f"key{i}").build() for i in range(query_count)]
+
+    print(f">>> Test stub type: {StubDataclassPrimitiveFields.__name__}, {n=}, {query_count=}.")
+    db = sqlite_db_fixture
+    db.save_many(
+        StubDataclassPrimitiveFieldsKey, samples, dataset=dataset, tenant=tenant, save_policy=SavePolicy.INSERT
+    )
+
+    # Query without index by suppressing index creation
+    with mock.patch.object(SqliteDb, "_add_index"):
+        start_time = time.time()
+        for query in queries:
+            assert db.count_by_query(query, dataset=dataset, tenant=tenant) == 1
+        end_time = time.time()
+    print(f"Query without index: {end_time - start_time}s.")
+
+    start_time = time.time()
+    for query in queries:
+        assert db.count_by_query(query, dataset=dataset, tenant=tenant) == 1
+    end_time = time.time()
+    print(f"Query with index (including index creation): {end_time - start_time}s.")
+
+
+@pytest.mark.skip("Performance test.")
+def test_save_performance(sqlite_db_fixture):
+    """Measure many small save_many and load_many calls where table metadata lookup dominates."""
+    n = 1000
+    dataset = "test_dataset"
+    tenant = "test_tenant"
+    samples = [StubDataclassPrimitiveFields(key_str_field=f"key{i}").build() for i in range(n)]
+    key_type = StubDataclassPrimitiveFieldsKey
+
+    print(f">>> Test stub type: {StubDataclassPrimitiveFields.__name__}, {n=}.")
+    db = sqlite_db_fixture
+    start_time = time.time()
+    for sample in samples:
+        db.save_many(key_type, [sample], dataset=dataset, tenant=tenant, save_policy=SavePolicy.REPLACE)
+    end_time = time.time()
+    print(f"Save one record per call: {end_time - start_time}s.")
+
+    start_time = time.time()
+    for sample in samples:
+        db.load_many(key_type, [sample.get_key()], dataset=dataset, tenant=tenant, sort_order=SortOrder.INPUT)
+    end_time = time.time()
+    print(f"Load one record per call: {end_time - start_time}s.")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
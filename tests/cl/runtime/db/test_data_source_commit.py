@@ -16,8 +16,10 @@ import pytest
 from cl.runtime.contexts.context_manager import activate
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.db.data_source import DataSource
+from cl.runtime.db.sql.sqlite_connection_pool import SqliteConnectionPool
 from stubs.cl.runtime import StubDataclass
 from stubs.cl.runtime import StubDataclassKey
+from stubs.cl.runtime import StubDataclassPrimitiveFields
 
 
 def test_commit(multi_db_fixture):
@@ -96,5 +98,51 @@ def test_commit_collisions(default_db_fixture):
         ds.commit()
 
 
+def test_commit_atomic(sqlite_db_fixture):
+    """Test that a commit failing on one key type does not leave partial writes for other key types."""
+    existing = StubDataclass(id="existing").build()
+    deleted = StubDataclass(id="deleted").build()
+    ds = active(DataSource)
+    ds.insert_many([existing, deleted], commit=True)
+
+    other = StubDataclassPrimitiveFields().build()
+    ds.delete_one(deleted.get_key(), commit=False)
+    ds.insert_one(other, commit=False)
+    ds.insert_one(existing, commit=False)  # Fails because the record already exists
+    with pytest.raises(Exception):
+        ds.commit()
+
+    # Neither the delete nor the insert for the other key type are applied
+    assert ds.load_one_or_none(deleted.get_key()) == deleted
+    assert ds.load_one_or_none(other.get_key()) is None
+
+    # Commit succeeds after a rollback
+    ds.insert_one(other, commit=True)
+    assert ds.load_one_or_none(other.get_key()) == other
+
+
+def test_commit_error(sqlite_db_fixture, monkeypatch):
+    """Test that an error in commit is propagated rather than replaced by an error in rollback."""
+
+    def failing_commit_transaction(pool: SqliteConnectionPool) -> None:
+        # Like a failed commit, end the transaction without applying the changes
+        pool.rollback_transaction()
+        raise RuntimeError("Simulated commit failure.")
+
+    sample = StubDataclass().build()
+    ds = active(DataSource)
+    with monkeypatch.context() as m:
+        m.setattr(SqliteConnectionPool, "commit_transaction", failing_commit_transaction)
+        ds.insert_one(sample, commit=False)
+        with pytest.raises(RuntimeError, match="Simulated commit failure"):
+            ds.commit()
+    assert not ds._has_pending_operations()
+    assert ds.load_one_or_none(sample.get_key()) is None
+
+    # Commit succeeds after the failed commit
+    ds.insert_one(sample, commit=True)
+    assert ds.load_one_or_none(sample.get_key()) == sample
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -343,6 +343,93 @@ def test_count_by_query(multi_db_fixture):
     assert active(DataSource).count_by_query(in_query) == 2
 
 
+def test_count_all(multi_db_fixture):
+    """Test count_all with and without restrict_to."""
+    records = [
+        StubDataclass(id="base1").build(),
+        StubDataclass(id="base2").build(),
+        StubDataclassDerived(id="derived1").build(),
+    ]
+
+    # Empty table
+    assert active(DataSource).count_all(StubDataclassKey) == 0
+
+    active(DataSource).insert_many(records, commit=True)
+    assert active(DataSource).count_all(StubDataclassKey) == 3
+    assert active(DataSource).count_all(StubDataclassKey, restrict_to=StubDataclassDerived) == 1
+
+
+def test_project_to(multi_db_fixture):
+    """Test that project_to reads only the fields of the projected type."""
+    records = [
+        StubDataclass(id="base1").build(),
+        StubDataclassDerived(id="derived1", derived_str_field="Error").build(),
+        StubDataclassDerived(id="derived2", derived_str_field="Info").build(),
+    ]
+    active(DataSource).insert_many(records, commit=True)
+    expected = [StubDataclass(id=x.id).build() for x in records]
+
+    # Load all records as the base type
+    loaded_records = active(DataSource).load_all(StubDataclassKey, project_to=StubDataclass)
+    assert list(loaded_records) == expected
+
+    # Load by keys
+    loaded_records = active(DataSource).load_many([x.get_key() for x in records], project_to=StubDataclass)
+    assert list(loaded_records) == expected
+
+    # Load by query using the fields of the derived type to filter
+    query = StubDataclassDerivedQuery(derived_str_field="Error").build()
+    loaded_records = active(DataSource).load_by_query(query, project_to=StubDataclass)
+    assert list(loaded_records) == [StubDataclass(id="derived1").build()]
+
+    # Error if the key type of project_to does not match
+    with pytest.raises(RuntimeError):
+        active(DataSource).load_all(StubDataclassKey, project_to=StubDataclassPrimitiveFields)
+
+
+def test_replace_one_if(multi_db_fixture):
+    """Test replace_one_if which replaces the record only if the stored record matches the query."""
+    record = StubDataclassDerived(id="abc", derived_str_field="Pending").build()
+    active(DataSource).insert_one(record, commit=True)
+    pending_query = StubDataclassDerivedQuery(derived_str_field="Pending").build()
+
+    # Replaced when the stored record matches the query
+    running_record = StubDataclassDerived(id="abc", derived_str_field="Running").build()
+    assert active(DataSource).replace_one_if(running_record, query=pending_query)
+    assert active(DataSource).load_one(record.get_key()) == running_record
+
+    # Not replaced when the stored record no longer matches the query
+    completed_record = StubDataclassDerived(id="abc", derived_str_field="Completed").build()
+    assert not active(DataSource).replace_one_if(completed_record, query=pending_query)
+    assert active(DataSource).load_one(record.get_key()) == running_record
+
+    # Not inserted when the stored record does not exist
+    other_record = StubDataclassDerived(id="xyz", derived_str_field="Running").build()
+    assert not active(DataSource).replace_one_if(other_record, query=pending_query)
+    assert active(DataSource).load_one_or_none(other_record.get_key()) is None
+
+
+def test_iter_all_and_iter_by_query(multi_db_fixture):
+    """Test iter_all and iter_by_query return the same records as load_all and load_by_query."""
+    records = [StubDataclassDerived(id=f"A{i}", derived_str_field="Error" if i % 2 else "Info") for i in range(7)]
+    records = [x.build() for x in records]
+    active(DataSource).insert_many(records, commit=True)
+
+    # Use a batch size that does not divide the number of records
+    iter_all_records = tuple(active(DataSource).iter_all(StubDataclassKey, sort_order=SortOrder.DESC, batch_size=3))
+    assert iter_all_records == active(DataSource).load_all(StubDataclassKey, sort_order=SortOrder.DESC)
+    assert len(iter_all_records) == 7
+
+    # Skip and limit are applied before batching
+    iter_all_records = tuple(active(DataSource).iter_all(StubDataclassKey, skip=2, limit=4, batch_size=3))
+    assert [x.id for x in iter_all_records] == ["A2", "A3", "A4", "A5"]
+
+    query = StubDataclassDerivedQuery(derived_str_field="Error").build()
+    iter_by_query_records = tuple(active(DataSource).iter_by_query(query, batch_size=2))
+    assert iter_by_query_records == active(DataSource).load_by_query(query)
+    assert [x.id for x in iter_by_query_records] == ["A1", "A3", "A5"]
+
+
 def test_skip_and_limit(multi_db_fixture):
     """Test Dbs work correctly with 'skip' and 'limit' params."""
 
@@ -409,6 +496,57 @@ def test_parent_data_source(multi_db_fixture):
     assert child_ds_result == base_only_record
 
 
+def test_parent_data_source_partial_hit(multi_db_fixture):
+    """Test that keys not found in DataSource are looked up in parent when other keys are found."""
+
+    base_ds = active(DataSource)
+
+    # Create child DataSource with parent set to the base
+    child_ds = DataSource(
+        db=base_ds.db,
+        dataset=base_ds.dataset,
+        tenant=TenantKey(tenant_id="test_tenant"),
+        parent=base_ds,
+    ).build()
+
+    # Record def is overridden in child
+    base_ds.insert_many(
+        [
+            StubDataclassDerived(id="abc", derived_str_field="base").build(),
+            StubDataclassDerived(id="def", derived_str_field="base").build(),
+        ],
+        commit=True,
+    )
+    child_ds.insert_many(
+        [
+            StubDataclassDerived(id="def", derived_str_field="child").build(),
+            StubDataclassDerived(id="xyz", derived_str_field="child").build(),
+        ],
+        commit=True,
+    )
+
+    # Mixed hits, including a key that is not found anywhere and a repeated key
+    keys = [StubDataclassKey(id=x).build() for x in ["abc", "def", "missing", "xyz", "abc"]]
+    result = child_ds.load_many_or_none(keys, cast_to=StubDataclassDerived)
+    assert [(x.id, x.derived_str_field) if x is not None else None for x in result] == [
+        ("abc", "base"),
+        ("def", "child"),
+        None,
+        ("xyz", "child"),
+        ("abc", "base"),
+    ]
+
+    # Parent is not affected by the child
+    result = base_ds.load_many_or_none(keys, cast_to=StubDataclassDerived)
+    assert [(x.id, x.derived_str_field) if x is not None else None for x in result] == [
+        ("abc", "base"),
+        ("def", "base"),
+        None,
+        None,
+        ("abc", "base"),
+    ]
+
+
 # TODO (Roman): Support tenant in SqliteDb
 def test_parent_data_source_delete(multi_db_fixture):
     """Test DataSource delete works correctly with parent."""
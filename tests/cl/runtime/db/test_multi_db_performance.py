@@ -16,9 +16,19 @@ import pytest
 import time
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.db.data_source import DataSource
+from cl.runtime.records.record_mixin import RecordMixin
+from cl.runtime.serializers.data_serializers import DataSerializers
+from stubs.cl.runtime import StubDataclass
+from stubs.cl.runtime import StubDataclassKey
+from stubs.cl.runtime import StubDataclassNestedFields
 from stubs.cl.runtime import StubDataclassPrimitiveFields
 
 
+def _get_serialized_size(records: tuple[RecordMixin, ...]) -> int:
+    """Approximate number of bytes read from DB for the records, measured as the length of serialized values."""
+    return sum(len(str(v)) for x in records for v in DataSerializers.FOR_SQLITE.serialize(x).values())
+
+
 @pytest.mark.skip("Performance test.")
 def test_performance(multi_db_fixture):
     """Test performance of save/load methods."""
@@ -51,5 +61,24 @@ def test_performance(multi_db_fixture):
     print(f"Load many one by one: {end_time - start_time}s.")
 
 
+@pytest.mark.skip("Performance test.")
+def test_project_to_performance(multi_db_fixture):
+    """Compare loading wide records with nested fields in full and with project_to the base type."""
+    n = 10_000
+    samples = [StubDataclassNestedFields(id=f"id{i}").build() for i in range(n)]
+    active(DataSource).replace_many(samples, commit=True)
+
+    print(f">>> Test stub type: {StubDataclassNestedFields.__name__}, project_to: {StubDataclass.__name__}, {n=}.")
+    start_time = time.time()
+    full_records = active(DataSource).load_all(StubDataclassKey)
+    end_time = time.time()
+    print(f"Load all full records: {end_time - start_time}s, size: {_get_serialized_size(full_records)} bytes.")
+
+    start_time = time.time()
+    projected_records = active(DataSource).load_all(StubDataclassKey, project_to=StubDataclass)
+    end_time = time.time()
+    print(f"Load all with project_to: {end_time - start_time}s, size: {_get_serialized_size(projected_records)} bytes.")
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
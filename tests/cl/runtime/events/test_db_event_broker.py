@@ -0,0 +1,91 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import asyncio
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.db.data_source import DataSource
+from cl.runtime.events import db_event_broker
+from cl.runtime.events.db_event_broker import _EventPoller  # noqa
+from cl.runtime.events.db_event_broker import _poller_dict  # noqa
+from cl.runtime.events.event import Event
+from cl.runtime.events.event_kind import EventKind
+
+_test_pull_events_delay = 0.05
+"""Reduced delay in seconds to check new events in DB for the test."""
+
+
+def _drain_queue(queue: asyncio.Queue[Event]) -> list[str]:
+    """Return timestamps of all events currently in the queue."""
+    result = []
+    while not queue.empty():
+        result.append(queue.get_nowait().timestamp)
+    return result
+
+
+async def _publish_and_poll(data_source: DataSource, batch_count: int, batch_size: int) -> tuple[list[str], list[str]]:
+    """Publish events in batches while the poller is running, return published and delivered timestamps."""
+    queue = _EventPoller.get_subscriber_queue(data_source)
+    try:
+        published = []
+        delivered = []
+        for _ in range(batch_count):
+            events = [Event(event_kind=EventKind.TASK_STARTED).build() for _ in range(batch_size)]
+            data_source.replace_many(events, commit=True)
+            published.extend(event.timestamp for event in events)
+
+            # Wait for several polls, each of them loads the events within the lookback interval again
+            await asyncio.sleep(10 * _test_pull_events_delay)
+            delivered.extend(_drain_queue(queue))
+        return published, delivered
+    finally:
+        _EventPoller.remove_subscriber_queue(queue)
+
+
+async def _subscribe_and_unsubscribe(data_source: DataSource) -> tuple[bool, bool]:
+    """Return whether the poller is running while subscribed and after the only subscriber is removed."""
+    queue = _EventPoller.get_subscriber_queue(data_source)
+    is_running_when_subscribed = bool(_poller_dict)
+    _EventPoller.remove_subscriber_queue(queue)
+
+    # Wait for the poller to check for subscribers after the current delay
+    await asyncio.sleep(10 * _test_pull_events_delay)
+    is_running_when_unsubscribed = bool(_poller_dict)
+    return is_running_when_subscribed, is_running_when_unsubscribed
+
+
+def test_incremental_delivery(default_db_fixture, monkeypatch):
+    """Test that each event published after subscribing is delivered exactly once."""
+
+    monkeypatch.setattr(db_event_broker, "_pull_events_delay", _test_pull_events_delay)
+    data_source = active(DataSource)
+    published, delivered = asyncio.run(_publish_and_poll(data_source, batch_count=3, batch_size=5))
+
+    # Other events such as log events may also be delivered, consider only the published events
+    delivered = [timestamp for timestamp in delivered if timestamp in set(published)]
+    assert delivered == published
+
+
+def test_poller_shutdown(default_db_fixture, monkeypatch):
+    """Test that the poller stops when there are no subscribers left."""
+
+    monkeypatch.setattr(db_event_broker, "_pull_events_delay", _test_pull_events_delay)
+    data_source = active(DataSource)
+    is_running_when_subscribed, is_running_when_unsubscribed = asyncio.run(_subscribe_and_unsubscribe(data_source))
+    assert is_running_when_subscribed
+    assert not is_running_when_unsubscribed
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,123 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import pytest
+from cl.runtime.configurations.preload_configuration import _read_file  # noqa
+from cl.runtime.file import preload_snapshot
+from cl.runtime.file.csv_reader import CsvReader
+from cl.runtime.file.preload_snapshot import PreloadSnapshot
+from cl.runtime.qa.qa_util import QaUtil
+from stubs.cl.runtime import StubDataclassDerived
+
+
+def _get_preload_file_path() -> str:
+    """Return the path to the preload file shared by the tests in this module."""
+    return os.path.join(os.path.splitext(__file__)[0], "StubDataclassDerived.csv")
+
+
+def test_preload_snapshot():
+    """Test PreloadSnapshot roundtrip and invalidation."""
+
+    env_dir = QaUtil.get_test_dir_from_call_stack()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Copy the preload file so it can be modified
+        file_path = os.path.join(temp_dir, "csv", "StubDataclassDerived.csv")
+        os.makedirs(os.path.dirname(file_path))
+        shutil.copy(os.path.join(env_dir, "StubDataclassDerived.csv"), file_path)
+        snapshot_dir = os.path.join(temp_dir, "snapshot")
+
+        # No snapshot before the first run
+        previous = PreloadSnapshot.load_manifest(snapshot_dir).get(file_path)
+        entry = PreloadSnapshot.get_entry(file_path, previous=previous)
+        assert not PreloadSnapshot.is_current(snapshot_dir, file_path, entry=entry, previous=previous)
+
+        # Save the snapshot and the manifest
+        records = CsvReader().build().load_file(file_path)
+        snapshot_path = PreloadSnapshot.get_snapshot_path(snapshot_dir, file_path)
+        PreloadSnapshot.save_records(snapshot_path, records)
+        PreloadSnapshot.save_manifest(snapshot_dir, {file_path: entry})
+
+        # Unchanged file is current and records are loaded from the snapshot
+        previous = PreloadSnapshot.load_manifest(snapshot_dir).get(file_path)
+        entry = PreloadSnapshot.get_entry(file_path, previous=previous)
+        assert PreloadSnapshot.is_current(snapshot_dir, file_path, entry=entry, previous=previous)
+        assert PreloadSnapshot.load_records(snapshot_path) == records
+
+        # Modified file is not current
+        with open(file_path, "a", encoding="utf-8") as file:
+            file.write("derived_id_3,test_derived_str_field_value_3\n")
+        entry = PreloadSnapshot.get_entry(file_path, previous=previous)
+        assert not PreloadSnapshot.is_current(snapshot_dir, file_path, entry=entry, previous=previous)
+
+
+def test_schema_fingerprint(monkeypatch):
+    """Test that the snapshot is discarded when the schema fingerprint changes."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = _get_preload_file_path()
+        snapshot_dir = os.path.join(temp_dir, "snapshot")
+        entry = PreloadSnapshot.get_entry(file_path, previous=None)
+        PreloadSnapshot.save_manifest(snapshot_dir, {file_path: entry})
+        assert PreloadSnapshot.load_manifest(snapshot_dir) == {file_path: entry}
+
+        # Manifest written for a different TypeInfo.csv or package version is discarded
+        monkeypatch.setattr(PreloadSnapshot, "get_schema_fingerprint", classmethod(lambda cls: "changed"))
+        assert PreloadSnapshot.load_manifest(snapshot_dir) == {}
+
+
+def test_snapshot_load_error():
+    """Test that the file is parsed again when its snapshot cannot be loaded."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = _get_preload_file_path()
+        snapshot_path = os.path.join(temp_dir, "snapshot.bson")
+        records = CsvReader().build().load_file(file_path)
+
+        # Write a snapshot that cannot be decoded
+        with open(snapshot_path, "wb") as file:
+            file.write(b"invalid")
+
+        # Records are parsed from the file and the snapshot is written again
+        _, loaded_records, _, from_snapshot = _read_file("csv", file_path, snapshot_path, True)
+        assert not from_snapshot
+        assert loaded_records == records
+        assert PreloadSnapshot.load_records(snapshot_path) == records
+
+
+def test_type_source_change(monkeypatch):
+    """Test that the file is parsed again when the source of a type stored in its snapshot changes."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = _get_preload_file_path()
+        snapshot_path = os.path.join(temp_dir, "snapshot.bson")
+        records = CsvReader().build().load_file(file_path)
+        PreloadSnapshot.save_records(snapshot_path, records)
+        assert PreloadSnapshot.load_records(snapshot_path) == records
+
+        # Simulate a change to the module where the stored type is defined
+        monkeypatch.setitem(preload_snapshot._module_hash_dict, StubDataclassDerived.__module__, "changed")  # noqa
+        assert PreloadSnapshot.load_records(snapshot_path) is None
+
+        # Records are parsed from the file and the snapshot is written again for the changed source
+        _, loaded_records, _, from_snapshot = _read_file("csv", file_path, snapshot_path, True)
+        assert not from_snapshot
+        assert loaded_records == records
+        assert PreloadSnapshot.load_records(snapshot_path) == records
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
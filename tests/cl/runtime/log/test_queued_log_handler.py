@@ -0,0 +1,103 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+from logging import LogRecord
+from typing import Any
+from typing import Sequence
+import pytest
+from cl.runtime.log.queued_log_handler import QueuedLogHandler
+
+
+class _ListLogHandler(QueuedLogHandler):
+    """Collects messages and batch sizes in memory, the writer blocks until released if gate is set."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.messages: list[str] = []
+        self.batch_sizes: list[int] = []
+        self.gate: threading.Event | None = None
+        self.entered = threading.Event()
+
+    def _create_item(self, record: LogRecord) -> tuple[Any, tuple[Any, ...]]:
+        return None, (record.getMessage(),)
+
+    def _write_batch(self, target: Any, payloads: Sequence[Any]) -> None:
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait()
+        self.messages.extend(payloads)
+        self.batch_sizes.append(len(payloads))
+
+
+def _record(level: int, message: str) -> LogRecord:
+    """Create a log record with the specified level and message."""
+    return logging.LogRecord("test", level, __file__, 0, message, None, None)
+
+
+def test_batching():
+    """Test that records are written in batches and flush writes all queued records."""
+
+    handler = _ListLogHandler(max_batch_size=10, flush_interval_sec=60.0)
+    try:
+        for i in range(25):
+            handler.emit(_record(logging.INFO, f"Message {i}"))
+        handler.flush()
+        assert handler.messages == [f"Message {i}" for i in range(25)]
+        assert max(handler.batch_sizes) <= 10
+        assert handler.get_dropped_count() == 0
+    finally:
+        handler.close()
+
+
+def test_overflow():
+    """Test that DEBUG records are dropped first when the queue is full."""
+
+    handler = _ListLogHandler(max_queue_size=3, max_batch_size=1, flush_interval_sec=60.0)
+    handler.gate = threading.Event()
+    try:
+        # The first record is a full batch taken by the writer which then blocks until the gate is set
+        handler.emit(_record(logging.INFO, "Info 0"))
+        assert handler.entered.wait(10.0)
+
+        handler.emit(_record(logging.DEBUG, "Debug 1"))
+        handler.emit(_record(logging.INFO, "Info 2"))
+        handler.emit(_record(logging.INFO, "Info 3"))
+        # Queue is full, the DEBUG record is dropped to make room
+        handler.emit(_record(logging.INFO, "Info 4"))
+        # Queue is full and has no DEBUG records, the new record is dropped
+        handler.emit(_record(logging.INFO, "Info 5"))
+
+        handler.gate.set()
+        handler.flush()
+        assert handler.messages == ["Info 0", "Info 2", "Info 3", "Info 4"]
+        assert handler.get_dropped_count() == 2
+    finally:
+        handler.gate.set()
+        handler.close()
+
+
+def test_not_queued():
+    """Test writing each record synchronously."""
+
+    handler = _ListLogHandler(queued=False)
+    handler.emit(_record(logging.INFO, "Message"))
+    assert handler.messages == ["Message"]
+    assert handler.batch_sizes == [1]
+    handler.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
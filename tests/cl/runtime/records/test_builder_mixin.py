@@ -14,6 +14,7 @@
 
 import pytest
 from cl.runtime.qa.regression_guard import RegressionGuard
+from cl.runtime.services.data.filter_screen_item import FilterScreenItem
 from stubs.cl.runtime import StubDataclassData
 from stubs.cl.runtime import StubDataclassDerivedData
 from stubs.cl.runtime import StubDataclassDoubleDerivedData
@@ -68,5 +69,24 @@ def test_clone_as():
     guard.verify()
 
 
+def test_frozen():
+    """Test frozen status stored in the '_frozen' slot and in the global registry."""
+
+    # Slot is declared by DataclassMixin
+    data = StubDataclassData(str_field="xyz")
+    assert not data.is_frozen()
+    data.str_field = "abc"
+    data.build()
+    assert data.is_frozen()
+    with pytest.raises(RuntimeError, match="because the instance is frozen"):
+        data.str_field = "def"
+
+    # Slot cannot be declared for Pydantic classes, status is tracked in the global registry
+    item = FilterScreenItem(table_name="abc", filter_name="def")
+    assert not item.is_frozen()
+    item.mark_frozen()
+    assert item.is_frozen()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,62 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import time
+from stubs.cl.runtime import StubDataclass
+from stubs.cl.runtime import StubDataclassComposite
+from stubs.cl.runtime import StubDataclassData
+
+_SAMPLE_TYPES = [
+    StubDataclassData,  # Data without key
+    StubDataclass,  # Record
+    StubDataclassComposite,  # Record with key fields
+]
+
+
+@pytest.mark.skip("Performance test.")
+@pytest.mark.parametrize("sample_type", _SAMPLE_TYPES)
+def test_build_performance(sample_type: type):
+    """Measure build for a large batch of instances."""
+    n = 100_000
+    print(f">>> Test stub type: {sample_type.__name__}, {n=}.")
+
+    start_time = time.time()
+    samples = [sample_type() for _ in range(n)]
+    end_time = time.time()
+    print(f"Create: {end_time - start_time}s.")
+
+    start_time = time.time()
+    for sample in samples:
+        sample.build()
+    end_time = time.time()
+    print(f"Build: {end_time - start_time}s.")
+
+
+@pytest.mark.skip("Performance test.")
+def test_setattr_performance():
+    """Measure setattr for public fields of an instance that is not frozen."""
+    n = 1_000_000
+    sample = StubDataclassData()
+    print(f">>> Setattr, {n=}.")
+
+    start_time = time.time()
+    for i in range(n):
+        sample.int_field = i
+    end_time = time.time()
+    print(f"Setattr: {end_time - start_time}s.")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -57,6 +57,19 @@ def test_data_build():
         DataUtil.build_(sample, TypeHint.for_type(type(sample)))
 
 
+def test_field_conversion():
+    """Test conversion of field values during build."""
+
+    key = StubDataclassKey(id="abc").build()
+    sample = StubDataclassOptionalFields(id="abc1", optional_str="", optional_float=2, optional_key=key)
+    DataUtil.build_(sample, TypeHint.for_type(type(sample)))
+
+    # Empty string is converted to None, int is converted to float, frozen key is kept as is
+    assert sample.optional_str is None
+    assert sample.optional_float == 2.0 and type(sample.optional_float) is float
+    assert sample.optional_key is key
+
+
 def test_required():
     """Test validation of the field type during build."""
 
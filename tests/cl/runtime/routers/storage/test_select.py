@@ -17,9 +17,15 @@ from cl.runtime.contexts.context_manager import active
 from cl.runtime.db.data_source import DataSource
 from cl.runtime.qa.qa_client import QaClient
 from cl.runtime.qa.regression_guard import RegressionGuard
+from cl.runtime.records.typename import typename
 from cl.runtime.routers.storage.select_request import SelectRequest
 from cl.runtime.routers.storage.select_response import SelectResponse
+from cl.runtime.serializers.data_serializers import DataSerializers
 from stubs.cl.runtime import StubDataclass
+from stubs.cl.runtime import StubDataclassPrimitiveFields
+from stubs.cl.runtime.records.for_dataclasses.stub_dataclass_primitive_fields_query import (
+    StubDataclassPrimitiveFieldsQuery,
+)
 
 
 def test_method(default_db_fixture):
@@ -34,8 +40,8 @@ def test_method(default_db_fixture):
 
     assert isinstance(result, SelectResponse)
 
-    # Check if there are only "schema" and "data".
-    assert [x.strip("_") for x in result.model_dump().keys()] == ["schema", "data"]
+    # Check if there are only "schema", "data" and "total_count".
+    assert [x.strip("_") for x in result.model_dump().keys()] == ["schema", "data", "total_count"]
 
     # Check result.
     guard = RegressionGuard()
@@ -43,6 +49,32 @@ def test_method(default_db_fixture):
     guard.verify()
 
 
+def test_skip_limit_and_query(default_db_fixture):
+    """Test /storage/select route with skip, limit and query_dict."""
+
+    # Save test records
+    records = [StubDataclassPrimitiveFields(key_str_field=f"key{i}").build() for i in range(5)]
+    active(DataSource).replace_many(records, commit=True)
+    type_name = typename(StubDataclassPrimitiveFields)
+
+    # Select a page of records, total count includes all records
+    result = SelectResponse.get_response(SelectRequest(type_=type_name, skip=1, limit=2))
+    assert [x["KeyStrField"] for x in result.data] == ["key1", "key2"]
+    assert result.total_count == 5
+
+    # Select by query
+    query = StubDataclassPrimitiveFieldsQuery(key_str_field="key3").build()
+    query_dict = DataSerializers.FOR_UI.serialize(query)
+    result = SelectResponse.get_response(SelectRequest(type_=type_name, query_dict=query_dict, limit=2))
+    assert [x["KeyStrField"] for x in result.data] == ["key3"]
+    assert result.total_count == 1
+
+    # Predicates are not supported in query_dict
+    query_dict = {**query_dict, "KeyStrField": {"_t": "In", "Values": ["key0", "key3"]}}
+    with pytest.raises(RuntimeError, match="does not support predicate In for field KeyStrField"):
+        SelectResponse.get_response(SelectRequest(type_=type_name, query_dict=query_dict))
+
+
 def test_api(default_db_fixture):
     """Test REST API for /storage/select route."""
     with QaClient() as test_client:
@@ -0,0 +1,58 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.db.data_source import DataSource
+from cl.runtime.records.typename import typename
+from cl.runtime.routers.task.run_request import RunRequest
+from cl.runtime.routers.task.run_response_util import RunResponseUtil
+from cl.runtime.serializers.key_serializers import KeySerializers
+from cl.runtime.views.view_cache import ViewCache
+from stubs.cl.runtime import StubCachedViewers
+
+_KEY_SERIALIZER = KeySerializers.DELIMITED
+
+
+def test_method(default_db_fixture, event_broker_fixture):
+    """Test that the response of a cached viewer is reused until the record is replaced."""
+
+    record = StubCachedViewers(stub_id="cached_viewers").build()
+    active(DataSource).replace_one(record, commit=True)
+    key = _KEY_SERIALIZER.serialize(record.get_key())
+    request = RunRequest(type=typename(StubCachedViewers), method="ViewMessage", key=key)
+    ViewCache.clear()
+    view_count = StubCachedViewers.get_view_count()
+
+    # The viewer runs on the first request only
+    response = RunResponseUtil.get_response(request)
+    assert response["Body"] == ["Message"]
+    assert RunResponseUtil.get_response(request) == response
+    assert StubCachedViewers.get_view_count() == view_count + 1
+
+    # The response is loaded from DB when not in the in-process cache
+    ViewCache.clear()
+    assert RunResponseUtil.get_response(request) == response
+    assert StubCachedViewers.get_view_count() == view_count + 1
+
+    # The viewer runs again after the record is replaced
+    active(DataSource).replace_one(StubCachedViewers(stub_id="cached_viewers", message="Other").build(), commit=True)
+    response = RunResponseUtil.get_response(request)
+    assert response["Body"] == ["Other"]
+    assert StubCachedViewers.get_view_count() == view_count + 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,93 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import asyncio
+import time
+from unittest.mock import patch
+from fastapi import FastAPI
+from httpx import ASGITransport
+from httpx import AsyncClient
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.db.data_source import DataSource
+from cl.runtime.records.typename import typename
+from cl.runtime.routers.server_util import ServerUtil
+from cl.runtime.routers.task.run_request import RunRequest
+from stubs.cl.runtime import StubDataclass
+from stubs.cl.runtime import StubHandlers
+
+_SLOW_HANDLER_SEC = 0.5
+"""Duration of the handler invoked by the slow requests."""
+
+
+def _slow_class_method(cls) -> None:
+    """Replaces a stub handler to simulate a handler that blocks for a long time."""
+    time.sleep(_SLOW_HANDLER_SEC)
+
+
+async def _post(client: AsyncClient, url: str, body: dict, latencies: list[float]) -> None:
+    """Send POST request and append its latency in seconds to the list."""
+    start = time.perf_counter()
+    response = await client.post(url, json=body)
+    latencies.append(time.perf_counter() - start)
+    assert response.status_code == 200
+
+
+async def _run_mixed_traffic(*, slow_count: int, fast_count: int) -> tuple[list[float], list[float]]:
+    """Send slow /task/run and fast /storage/select requests concurrently, return latencies for each kind."""
+    app = FastAPI()
+    ServerUtil.include_routers(app)
+    run_body = RunRequest(type=typename(StubHandlers), method="RunClassMethod1A").model_dump()
+    select_body = {"Type": typename(StubDataclass)}
+    slow_latencies = []
+    fast_latencies = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await asyncio.gather(
+            *(_post(client, "/task/run", run_body, slow_latencies) for _ in range(slow_count)),
+            *(_post(client, "/storage/select", select_body, fast_latencies) for _ in range(fast_count)),
+        )
+    return slow_latencies, fast_latencies
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Return the percentile of values using the nearest rank method."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100.0 * len(ordered)) - 1))]
+
+
+@pytest.mark.skip("Performance test.")
+def test_performance(default_db_fixture, event_broker_fixture):
+    """Measure p50 and p99 latency of REST routes under concurrent mixed traffic."""
+
+    records = [StubDataclass(id=f"id{i}").build() for i in range(100)]
+    active(DataSource).replace_many(records, commit=True)
+
+    slow_count = 8
+    fast_count = 200
+    with patch.object(StubHandlers, "run_class_method_1a", classmethod(_slow_class_method)):
+        start = time.perf_counter()
+        slow_latencies, fast_latencies = asyncio.run(
+            _run_mixed_traffic(slow_count=slow_count, fast_count=fast_count)
+        )
+        total_sec = time.perf_counter() - start
+
+    print(f">>> Mixed traffic: {slow_count} slow /task/run, {fast_count} /storage/select, total {total_sec:.3f}s.")
+    for name, latencies in (("/task/run", slow_latencies), ("/storage/select", fast_latencies)):
+        p50 = _percentile(latencies, 50)
+        p99 = _percentile(latencies, 99)
+        print(f"{name}: p50={p50 * 1000:.1f}ms p99={p99 * 1000:.1f}ms.")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
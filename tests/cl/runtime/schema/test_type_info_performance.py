@@ -0,0 +1,65 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import subprocess
+import sys
+import time
+from cl.runtime.project.project_layout import ProjectLayout
+
+_FIRST_LOOKUP_SCRIPT = """
+import time
+from cl.runtime.schema.type_info import TypeInfo
+start_time = time.perf_counter()
+TypeInfo.from_type_name("StubDataclass")
+print(time.perf_counter() - start_time)
+"""
+
+
+def _run_python(script: str) -> str:
+    """Run the script in a new Python process from project root and return its stdout."""
+    return subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ProjectLayout.get_project_root(),
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+
+@pytest.mark.skip("Performance test.")
+def test_import_performance():
+    """Measure the time of 'import cl.runtime' in a new process."""
+    n = 10
+    print(f">>> Import cl.runtime, {n=}.")
+
+    start_time = time.time()
+    for _ in range(n):
+        _run_python("import cl.runtime")
+    end_time = time.time()
+    print(f"Average: {(end_time - start_time) / n}s.")
+
+
+@pytest.mark.skip("Performance test.")
+def test_first_lookup_performance():
+    """Measure the time of the first TypeInfo.from_type_name call in a new process."""
+    n = 10
+    print(f">>> First TypeInfo.from_type_name call, {n=}.")
+
+    elapsed = [float(_run_python(_FIRST_LOOKUP_SCRIPT)) for _ in range(n)]
+    print(f"Average: {sum(elapsed) / n}s.")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
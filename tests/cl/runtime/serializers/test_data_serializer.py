@@ -14,6 +14,7 @@
 
 
 import pytest
+import numpy as np
 import orjson
 from frozendict import frozendict
 from cl.runtime.primitive.case_util import CaseUtil
@@ -22,6 +23,7 @@ from cl.runtime.records.builder_checks import BuilderChecks
 from cl.runtime.serializers.data_serializer import DataSerializer
 from cl.runtime.serializers.enum_serializers import EnumSerializers
 from cl.runtime.serializers.json_serializer import orjson_default
+from cl.runtime.serializers.ndarray_format import NdarrayFormat
 from cl.runtime.serializers.primitive_serializers import PrimitiveSerializers
 from cl.runtime.serializers.type_inclusion import TypeInclusion
 from stubs.cl.runtime import StubDataclass
@@ -192,5 +194,65 @@ def test_unidirectional():
             serializer.serialize(sample)
 
 
+def test_clear_plans():
+    """Test that the plans compiled on first use of a type are invalidated by clear_plans."""
+
+    # Create the serializer
+    serializer = DataSerializer(
+        primitive_serializer=PrimitiveSerializers.PASSTHROUGH,
+        enum_serializer=EnumSerializers.DEFAULT,
+    ).build()
+
+    sample = StubDataclassPrimitiveFields().build()
+    serialized = serializer.serialize(sample)
+    assert BuilderChecks.is_equal(serializer.deserialize(serialized), sample)
+    serialize_plan = serializer._get_serialize_plan(StubDataclassPrimitiveFields)  # noqa
+    deserialize_plan = serializer._get_deserialize_plan(StubDataclassPrimitiveFields)  # noqa
+
+    # The plans are reused until invalidated
+    assert serializer._get_serialize_plan(StubDataclassPrimitiveFields) is serialize_plan  # noqa
+    assert serializer._get_deserialize_plan(StubDataclassPrimitiveFields) is deserialize_plan  # noqa
+
+    # The plans are compiled again after invalidation with the same result
+    DataSerializer.clear_plans()
+    assert serializer._get_serialize_plan(StubDataclassPrimitiveFields) is not serialize_plan  # noqa
+    assert serializer._get_deserialize_plan(StubDataclassPrimitiveFields) is not deserialize_plan  # noqa
+    assert serializer.serialize(sample) == serialized
+    assert BuilderChecks.is_equal(serializer.deserialize(serialized), sample)
+
+
+def test_ndarray_format():
+    """Test roundtrip serialization of ndarray using each ndarray format."""
+
+    for ndarray_format in NdarrayFormat:
+        serializer = DataSerializer(
+            primitive_serializer=PrimitiveSerializers.PASSTHROUGH,
+            enum_serializer=EnumSerializers.DEFAULT,
+            ndarray_format=ndarray_format,
+        ).build()
+
+        # Record with float64 ndarray fields
+        sample = StubDataclassNumpyFields().build()
+        assert BuilderChecks.is_equal(serializer.deserialize(serializer.serialize(sample)), sample)
+
+        # Arrays with other dtypes are only supported by the binary formats
+        if ndarray_format != NdarrayFormat.DEFAULT:
+            for dtype in (np.bool_, np.int32, np.int64, np.float32, np.float64, ">f8"):
+                array = np.arange(6).reshape(2, 3).astype(dtype)
+                serialized = serializer._serialize_ndarray(array)  # noqa
+                if ndarray_format == NdarrayFormat.BINARY:
+                    assert isinstance(serialized["data"], bytes)
+                else:
+                    assert isinstance(serialized["data"], str)
+                deserialized = serializer._deserialize_ndarray(serialized)  # noqa
+                assert deserialized.dtype == array.dtype.newbyteorder("<")
+                assert deserialized.shape == (2, 3)
+                assert np.array_equal(deserialized, array)
+
+            # Object dtype is not supported
+            with pytest.raises(RuntimeError, match="dtype=object"):
+                serializer._serialize_ndarray(np.array(["abc"], dtype=object))  # noqa
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
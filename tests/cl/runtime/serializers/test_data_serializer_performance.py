@@ -0,0 +1,93 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import numpy as np
+import time
+from cl.runtime.serializers.data_serializer import DataSerializer
+from cl.runtime.serializers.data_serializers import DataSerializers
+from cl.runtime.serializers.enum_serializers import EnumSerializers
+from cl.runtime.serializers.ndarray_format import NdarrayFormat
+from cl.runtime.serializers.primitive_serializers import PrimitiveSerializers
+from stubs.cl.runtime import StubDataclassComposite
+from stubs.cl.runtime import StubDataclassListFields
+from stubs.cl.runtime import StubDataclassNestedFields
+from stubs.cl.runtime import StubDataclassPrimitiveFields
+
+_SAMPLE_TYPES = [
+    StubDataclassPrimitiveFields,  # Primitive and enum fields
+    StubDataclassComposite,  # Key fields
+    StubDataclassNestedFields,  # Nested data fields
+    StubDataclassListFields,  # List fields
+]
+
+_SERIALIZERS = {
+    "DEFAULT": DataSerializers.DEFAULT,
+    "FOR_JSON": DataSerializers.FOR_JSON,
+    "FOR_SQLITE": DataSerializers.FOR_SQLITE,
+}
+
+
+@pytest.mark.skip("Performance test.")
+@pytest.mark.parametrize("serializer_name", list(_SERIALIZERS))
+def test_performance(serializer_name: str):
+    """Measure serialize and deserialize for records with different kinds of fields."""
+    n = 10_000
+    serializer = _SERIALIZERS[serializer_name]
+    for sample_type in _SAMPLE_TYPES:
+        sample = sample_type().build()
+        print(f">>> Serializer: {serializer_name}, test stub type: {sample_type.__name__}, {n=}.")
+
+        start_time = time.time()
+        for _ in range(n):
+            serialized = serializer.serialize(sample)
+        end_time = time.time()
+        print(f"Serialize: {end_time - start_time}s.")
+
+        start_time = time.time()
+        for _ in range(n):
+            serializer.deserialize(serialized)
+        end_time = time.time()
+        print(f"Deserialize: {end_time - start_time}s.")
+
+
+@pytest.mark.skip("Performance test.")
+@pytest.mark.parametrize("ndarray_format", list(NdarrayFormat))
+def test_ndarray_performance(ndarray_format: NdarrayFormat):
+    """Measure serialize and deserialize for a large ndarray using each ndarray format."""
+    n = 1_000_000
+    repeat = 10
+    serializer = DataSerializer(
+        primitive_serializer=PrimitiveSerializers.PASSTHROUGH,
+        enum_serializer=EnumSerializers.DEFAULT,
+        ndarray_format=ndarray_format,
+    ).build()
+    array = np.random.default_rng(0).random(n)
+    print(f">>> Ndarray format: {ndarray_format.name}, {n=}, {repeat=}.")
+
+    start_time = time.time()
+    for _ in range(repeat):
+        serialized = serializer._serialize_ndarray(array)  # noqa
+    end_time = time.time()
+    print(f"Serialize: {end_time - start_time}s.")
+
+    start_time = time.time()
+    for _ in range(repeat):
+        serializer._deserialize_ndarray(serialized)  # noqa
+    end_time = time.time()
+    print(f"Deserialize: {end_time - start_time}s.")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -15,7 +15,7 @@
 import pytest
 from unittest.mock import MagicMock
 from unittest.mock import patch
-from celery.exceptions import Reject
+from celery.exceptions import Retry
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.contexts.context_snapshot import ContextSnapshot
 from cl.runtime.db.data_source import DataSource
@@ -80,7 +80,7 @@ def test_reached_tenant_limit(default_db_fixture):
     mock_instance = MagicMock(celery_max_tenant_tasks=0)
     mock_instance.celery_max_tenant_tasks = 0
     with patch("cl.runtime.tasks.celery.celery_queue.celery_settings", new=mock_instance):
-        with pytest.raises(Reject):
+        with pytest.raises(Retry):
             execute_task(
                 "test_task_id",
                 context_snapshot_json,
@@ -0,0 +1,47 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import pytest
+from cl.runtime.tasks.local_task_notifier import LocalTaskNotifier
+
+
+def test_local_task_notifier():
+    """Test LocalTaskNotifier class."""
+
+    notifier = LocalTaskNotifier()
+    channel = "test_local_task_notifier"
+
+    # Wait times out when there is no notification
+    version = notifier.get_version(channel)
+    assert not notifier.wait(channel, version=version, timeout_sec=0.01)
+
+    # Wait returns immediately when notified after getting the version
+    notifier.notify(channel)
+    assert notifier.wait(channel, version=version, timeout_sec=0.0)
+
+    # Notification on another channel does not wake up the waiter
+    version = notifier.get_version(channel)
+    notifier.notify("other_channel")
+    assert not notifier.wait(channel, version=version, timeout_sec=0.01)
+
+    # Notification from another thread wakes up the waiter
+    thread = threading.Timer(0.01, notifier.notify, args=(channel,))
+    thread.start()
+    assert notifier.wait(channel, version=version, timeout_sec=10.0)
+    thread.join()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
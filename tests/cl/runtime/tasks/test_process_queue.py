@@ -16,7 +16,12 @@ import pytest
 from cl.runtime.contexts.context_manager import active
 from cl.runtime.db.data_source import DataSource
 from cl.runtime.qa.regression_guard import RegressionGuard
+from cl.runtime.tasks import process_queue
 from cl.runtime.tasks.process_queue import ProcessQueue
+from cl.runtime.tasks.task import Task
+from cl.runtime.tasks.task_status import TaskStatus
+from cl.runtime.tasks.worker_pool_kind import WorkerPoolKind
+from stubs.cl.runtime.tasks.stub_sleep_task import StubSleepTask
 from stubs.cl.runtime.tasks.stub_task import StubTask
 
 
@@ -44,5 +49,80 @@ def test_process_queue(default_db_fixture, event_broker_fixture):
     guard.verify()
 
 
+def test_process_queue_thread_pool(default_db_fixture, event_broker_fixture):
+    """Test ProcessQueue running tasks in a pool of worker threads."""
+
+    # Create queue
+    queue = ProcessQueue(queue_id="test_process_queue_thread_pool", pool_kind=WorkerPoolKind.THREAD, max_workers=2)
+    queue.timeout_sec = 2
+    queue_key = queue.get_key()
+
+    # Create and save tasks
+    task_count = 4
+    tasks = [StubSleepTask(label=f"{i}", queue=queue_key, sleep_sec=0.1).build() for i in range(task_count)]
+    active(DataSource).insert_many(tasks, commit=True)
+
+    # Start queue, exits after all tasks are completed and the timeout is reached
+    queue.run_start_queue()
+
+    # Each task has been claimed and completed exactly once
+    completed_tasks = active(DataSource).load_many([x.get_key() for x in tasks], cast_to=Task)
+    assert all(x.status == TaskStatus.COMPLETED for x in completed_tasks)
+
+    # Elapsed time is measured during execution, CPU time is much less as the task sleeps
+    assert all(x.elapsed_sec >= 0.1 for x in completed_tasks)
+    assert all(0.0 <= x.cpu_sec < x.elapsed_sec for x in completed_tasks)
+
+    # A task that is no longer pending cannot be claimed again
+    assert ProcessQueue._claim_task(tasks[0]) is None  # noqa
+
+
+def test_process_queue_process_pool(default_db_fixture, event_broker_fixture):
+    """Test ProcessQueue running tasks in a pool of worker processes."""
+
+    # Create queue
+    queue = ProcessQueue(queue_id="test_process_queue_process_pool", pool_kind=WorkerPoolKind.PROCESS, max_workers=1)
+    queue.timeout_sec = 2
+    queue_key = queue.get_key()
+
+    # Create and save tasks, use a single worker as starting a worker process takes time
+    task_count = 2
+    tasks = [StubSleepTask(label=f"{i}", queue=queue_key, sleep_sec=0.1).build() for i in range(task_count)]
+    active(DataSource).insert_many(tasks, commit=True)
+
+    # Start queue, exits after all tasks are completed and the timeout is reached
+    queue.run_start_queue()
+
+    # Each task has been completed by a worker process started using spawn
+    completed_tasks = active(DataSource).load_many([x.get_key() for x in tasks], cast_to=Task)
+    assert all(x.status == TaskStatus.COMPLETED for x in completed_tasks)
+
+
+def test_process_queue_worker_error(default_db_fixture, event_broker_fixture, monkeypatch):
+    """Test that a task is saved with Failed status when the worker fails before the task runs."""
+
+    def _run_task_with_error(task_id: str, context_snapshot_json: str) -> None:
+        raise RuntimeError("Worker error.")
+
+    monkeypatch.setattr(process_queue, "_run_task", _run_task_with_error)
+
+    # Create queue
+    queue = ProcessQueue(queue_id="test_process_queue_worker_error", pool_kind=WorkerPoolKind.THREAD, max_workers=2)
+    queue.timeout_sec = 1
+    queue_key = queue.get_key()
+
+    # Create and save task
+    task = StubSleepTask(label="0", queue=queue_key, sleep_sec=0.1).build()
+    active(DataSource).insert_many([task], commit=True)
+
+    # Start queue, exits after the task has failed and the timeout is reached
+    queue.run_start_queue()
+
+    # Task is not left with Running status
+    failed_task = active(DataSource).load_one(task.get_key(), cast_to=Task)
+    assert failed_task.status == TaskStatus.FAILED
+    assert failed_task.error_message == "Worker error."
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,64 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import pytest
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.contexts.context_snapshot import ContextSnapshot
+from cl.runtime.db.data_source import DataSource
+from cl.runtime.tasks.process_queue import ProcessQueue
+from cl.runtime.tasks.task import Task
+from stubs.cl.runtime.tasks.stub_sleep_task import StubSleepTask
+
+
+@pytest.mark.skip("Performance test.")
+def test_process_queue_latency(default_db_fixture, event_broker_fixture):
+    """Measure the time from task submission to completion notification for an idle ProcessQueue."""
+
+    # Create queue
+    queue = ProcessQueue(queue_id="test_process_queue_latency")
+    queue.timeout_sec = 5
+    queue_key = queue.get_key()
+
+    # Run the queue in a separate thread with the same active contexts
+    context_snapshot = ContextSnapshot.capture_active()
+
+    def run_queue() -> None:
+        with context_snapshot:
+            queue.run_start_queue()
+
+    thread = threading.Thread(target=run_queue)
+    thread.start()
+
+    task_count = 10
+    latencies = []
+    for i in range(task_count):
+        # Let the queue become idle so that it waits for notification
+        time.sleep(0.5)
+
+        # Save and submit task, then wait for completion
+        task = StubSleepTask(label=f"{i}", queue=queue_key).build()
+        start_time = time.perf_counter()
+        active(DataSource).replace_one(task, commit=True)
+        queue.submit_task(task)
+        Task.wait_for_completion(task.get_key())
+        latencies.append(time.perf_counter() - start_time)
+
+    thread.join()
+    print(f"Submit to completion latency: max={max(latencies):.3f}s avg={sum(latencies) / task_count:.3f}s")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,83 @@
+# Copyright (C) 2023-present The Project Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import pytest
+from cl.runtime.contexts.context_manager import active
+from cl.runtime.db.data_source import DataSource
+from cl.runtime.tasks.process_queue import ProcessQueue
+from cl.runtime.tasks.running_task_counter import RunningTaskCounter
+from cl.runtime.tasks.running_task_counter_key import RunningTaskCounterKey
+from cl.runtime.tasks.task_status import TaskStatus
+from stubs.cl.runtime.tasks.stub_task import StubTask
+
+
+def _get_task_ids(counter_key: RunningTaskCounterKey) -> list[str]:
+    """Return identifiers of tasks holding a slot in the order of acquisition."""
+    counter = active(DataSource).load_one(counter_key, cast_to=RunningTaskCounter)
+    return [x.task_id for x in counter.running_tasks]
+
+
+def test_running_task_counter(default_db_fixture):
+    """Test RunningTaskCounter class."""
+
+    counter_id = "test_running_task_counter"
+    counter_key = RunningTaskCounterKey(counter_id=counter_id).build()
+    queue_key = ProcessQueue(queue_id="test_running_task_counter").get_key()
+    a, b, c = [StubTask(label=f"{i}", queue=queue_key, status=TaskStatus.RUNNING).build() for i in range(3)]
+    active(DataSource).insert_many([a, b, c], commit=True)
+
+    # Acquire up to the limit
+    assert RunningTaskCounter.try_acquire(counter_id, task_id=a.task_id, max_count=2)
+    assert RunningTaskCounter.try_acquire(counter_id, task_id=b.task_id, max_count=2)
+    assert not RunningTaskCounter.try_acquire(counter_id, task_id=c.task_id, max_count=2)
+    assert _get_task_ids(counter_key) == [a.task_id, b.task_id]
+
+    # The task that already holds a slot reuses it, for example when redelivered
+    assert RunningTaskCounter.try_acquire(counter_id, task_id=a.task_id, max_count=2)
+    assert _get_task_ids(counter_key) == [a.task_id, b.task_id]
+
+    # Release makes a slot available
+    RunningTaskCounter.release(counter_id, task_id=a.task_id)
+    assert RunningTaskCounter.try_acquire(counter_id, task_id=c.task_id, max_count=2)
+    assert _get_task_ids(counter_key) == [b.task_id, c.task_id]
+
+    # Slot of a task that finished without releasing it is reclaimed when no slot is free
+    b_completed = StubTask(task_id=b.task_id, label=b.label, queue=queue_key, status=TaskStatus.COMPLETED).build()
+    active(DataSource).replace_one(b_completed, commit=True)
+    assert RunningTaskCounter.try_acquire(counter_id, task_id=a.task_id, max_count=2)
+    assert _get_task_ids(counter_key) == [c.task_id, a.task_id]
+
+    # Slots held for longer than max_hold_sec are reclaimed when no slot is free
+    d = StubTask(label="3", queue=queue_key, status=TaskStatus.RUNNING).build()
+    active(DataSource).insert_one(d, commit=True)
+    assert not RunningTaskCounter.try_acquire(counter_id, task_id=d.task_id, max_count=2, max_hold_sec=60)
+    time.sleep(0.01)
+    assert RunningTaskCounter.try_acquire(counter_id, task_id=d.task_id, max_count=2, max_hold_sec=0.001)
+    assert _get_task_ids(counter_key) == [d.task_id]
+
+    # Zero limit is never acquired
+    assert not RunningTaskCounter.try_acquire(counter_id, task_id=c.task_id, max_count=0)
+
+    # Release of a slot that is no longer held has no effect
+    RunningTaskCounter.release(counter_id, task_id=c.task_id)
+    assert _get_task_ids(counter_key) == [d.task_id]
+
+    # Reset deletes the counter
+    RunningTaskCounter.reset(counter_id)
+    assert active(DataSource).load_one_or_none(counter_key) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])